@@ -0,0 +1,83 @@
+"""Benchmark the spherical and WGS84 geodesic models.
+
+Compares speed and the offset between the two earth models for hornet-scale
+projections, so the model can be chosen per workload::
+
+    python benchmarks/geodesic_benchmark.py --count 100000 --max-distance 2000
+"""
+
+# ruff: noqa: T201
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from vespa_finder.geodesic import SphericalGeodesic, WGS84Geodesic, vincenty_inverse
+
+
+def _best_of(repeat, func, *args):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000, help="projections per run")
+    parser.add_argument("--max-distance", type=float, default=2000.0, help="meters")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    # One survey area (~10 km across), as in a real campaign
+    lat = 50.85 + rng.uniform(-0.05, 0.05, args.count)
+    lon = 4.35 + rng.uniform(-0.05, 0.05, args.count)
+    bearing = rng.uniform(0.0, 360.0, args.count)
+    distance = rng.uniform(0.0, args.max_distance, args.count)
+    scalar_count = min(args.count, 10_000)
+
+    models = {
+        "spherical": SphericalGeodesic(),
+        "wgs84": WGS84Geodesic(),
+        "wgs84 (vincenty only)": WGS84Geodesic(fast_path_max_distance=0),
+    }
+    print(f"{args.count} projections up to {args.max_distance:.0f} m, best of {args.repeat}")
+    print(f"{'model':<24}{'direct/s':>14}{'scalar/s':>14}{'inverse/s':>14}")
+    for name, model in models.items():
+        direct = _best_of(args.repeat, model.direct, lat, lon, bearing, distance)
+        scalar = _best_of(
+            args.repeat,
+            lambda m=model: [
+                m.destination(*row)
+                for row in zip(
+                    lat[:scalar_count].tolist(),
+                    lon[:scalar_count].tolist(),
+                    bearing[:scalar_count].tolist(),
+                    distance[:scalar_count].tolist(),
+                    strict=True,
+                )
+            ],
+        )
+        inverse = _best_of(args.repeat, model.inverse, lat, lon, lat[::-1], lon[::-1])
+        print(
+            f"{name:<24}{args.count / direct:>14,.0f}{scalar_count / scalar:>14,.0f}"
+            f"{args.count / inverse:>14,.0f}"
+        )
+
+    spherical = models["spherical"].direct(lat, lon, bearing, distance)
+    ellipsoidal = models["wgs84"].direct(lat, lon, bearing, distance)
+    offset, _ = vincenty_inverse(*spherical, *ellipsoidal)
+    print(
+        f"spherical vs WGS84 end points: median {np.median(offset):.3f} m, max {offset.max():.3f} m"
+    )
+
+
+if __name__ == "__main__":
+    main()
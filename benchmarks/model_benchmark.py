@@ -0,0 +1,134 @@
+"""Benchmark Observation / HiveLocation construction and memory.
+
+Compares validated construction with the trusted constructor used for
+archive and binary-file rows, and the per-object memory of the slotted
+models with equivalent dict-based dataclasses::
+
+    python benchmarks/model_benchmark.py --count 1000000
+"""
+
+# ruff: noqa: T201
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from vespa_finder.models import HiveLocation, Observation
+
+
+@dataclass
+class DictObservation:
+    """Observation's fields without slots or validation, for the memory baseline."""
+
+    latitude: float
+    longitude: float
+    bearing: float
+    round_trip_time: float
+    speed: float | None = None
+    timestamp: datetime = None
+    notes: str = ""
+    hornet_color_mark: str | None = None
+    temperature: float | None = None
+
+
+@dataclass
+class DictHiveLocation:
+    """HiveLocation's fields without slots, for the memory baseline."""
+
+    latitude: float
+    longitude: float
+    confidence_radius: float
+    distance_from_observer: float
+    bearing_from_observer: float
+    calculation_method: str = "single_observation_empirical"
+    timestamp: datetime = None
+
+
+def _rows(count):
+    start = datetime(2026, 7, 1, 8, 0)
+    return [
+        (
+            50.85 + i * 1e-7,
+            4.35 + i * 1e-7,
+            (i * 0.37) % 360,
+            30.0 + i % 600,
+            None,
+            start + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def _timed(build, rows):
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        objects = [build(*row) for row in rows]
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    return objects, elapsed
+
+
+def _object_bytes(build, rows):
+    """Memory of the objects themselves (the row values are shared and not counted)."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(*row) for row in rows]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / len(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000, help="objects per run")
+    parser.add_argument("--memory-count", type=int, default=100_000, help="objects for memory")
+    args = parser.parse_args(argv)
+
+    rows = _rows(args.count)
+    print(f"{args.count} objects")
+    print(f"{'constructor':<32}{'seconds':>10}{'ns/object':>12}")
+    results = {}
+    for name, build in (
+        ("Observation(...)", Observation),
+        ("Observation.trusted(...)", Observation.trusted),
+        ("DictObservation(...)", DictObservation),
+    ):
+        _objects, elapsed = _timed(build, rows)
+        del _objects
+        results[name] = elapsed
+        print(f"{name:<32}{elapsed:>10.2f}{elapsed / args.count * 1e9:>12.0f}")
+    speedup = results["Observation(...)"] / results["Observation.trusted(...)"]
+    print(f"trusted construction is {speedup:.1f}x faster than validated")
+
+    hive_rows = [(*row[:5], "single_observation_empirical", row[5]) for row in rows]
+    _objects, elapsed = _timed(HiveLocation, hive_rows)
+    del _objects
+    print(f"{'HiveLocation(...)':<32}{elapsed:>10.2f}{elapsed / args.count * 1e9:>12.0f}")
+
+    print(f"\nmemory per object ({args.memory_count} objects)")
+    for slotted, baseline, all_rows in (
+        (Observation.trusted, DictObservation, rows),
+        (HiveLocation, DictHiveLocation, hive_rows),
+    ):
+        sample = all_rows[: args.memory_count]
+        slotted_bytes = _object_bytes(slotted, sample)
+        baseline_bytes = _object_bytes(baseline, sample)
+        print(
+            f"{baseline.__name__.removeprefix('Dict'):<16}"
+            f"slots {slotted_bytes:>5.0f} B   dict {baseline_bytes:>5.0f} B   "
+            f"({1 - slotted_bytes / baseline_bytes:.0%} smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,17 +6,20 @@ Professional methodology by Vespawatchers
 
 import logging
 import os
+import time
 import tkinter as tk
-import traceback
 import webbrowser
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from tkinter import messagebox, scrolledtext, ttk
 
 from vespa_finder import HiveCalculator, Observation
 from vespa_finder.geo_utils import format_bearing, format_coordinates
 from vespa_finder.models import HiveLocation
-from vespa_finder.simple_map import SimpleMapGenerator
+from vespa_finder.simple_map import MapGenerationError, SimpleMapGenerator
 from vespa_finder.translations import get_text
+from vespa_finder.workers import BackgroundTaskRunner, Debouncer, TaskContext
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +28,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_PREVIEW_CALCULATOR = HiveCalculator()
+
+
+@lru_cache(maxsize=512)
+def _preview_estimate(
+    latitude: float, longitude: float, bearing: float, round_trip_time: float
+) -> tuple[float, float, float, float]:
+    """
+    Cached empirical estimate used by the live preview.
+
+    Returns:
+        Tuple of (hive_latitude, hive_longitude, distance, confidence_radius)
+    """
+    observation = Observation(
+        latitude=latitude,
+        longitude=longitude,
+        bearing=bearing,
+        round_trip_time=round_trip_time,
+    )
+    hive = _PREVIEW_CALCULATOR.calculate_from_single_observation(observation, method="empirical")
+    return hive.latitude, hive.longitude, hive.distance_from_observer, hive.confidence_radius
+
 
 class ScrollableFrame(ttk.Frame):
     """A scrollable frame container with vertical and horizontal scrollbars."""
@@ -85,6 +110,24 @@ class HornetLocatorGUI:
     ENTRY_WIDTH_SMALL = 8  # For numeric inputs like minutes, seconds, speed
     SEPARATOR_WIDTH = 60  # Width for ASCII art separators in results panel
 
+    # Live preview: coalesce key bursts while keeping keystroke-to-result under ~20 ms
+    LIVE_PREVIEW_DEBOUNCE_MS = 12
+    LIVE_PREVIEW_BUDGET_MS = 20
+
+    # Session table: rows are inserted in chunks so thousands of observations
+    # never block the event loop
+    SESSION_INSERT_CHUNK = 500
+    SESSION_SELECTION_DEBOUNCE_MS = 50
+    SESSION_COLUMNS: tuple[tuple[str, int], ...] = (
+        ("index", 50),
+        ("time", 140),
+        ("position", 220),
+        ("bearing", 110),
+        ("round_trip", 90),
+        ("distance", 90),
+        ("mark", 90),
+    )
+
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
         self.current_lang = "en"  # Default language
@@ -114,9 +157,32 @@ class HornetLocatorGUI:
         self.calculator = HiveCalculator()
         self.map_generator = SimpleMapGenerator()
         self.observations = []
+        self._session_estimates: dict[int, HiveLocation] = {}  # Cached per-observation solves
+        self._session_pending_rows: deque[int] = deque()
+        self._session_inserting = False
+        self.session_hive_location = None
         self.current_map_file = None
         self.current_hive_location = None
 
+        # Calculations and map rendering run off the Tk event loop
+        self.tasks = BackgroundTaskRunner(self.root.after)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Live preview recalculates the estimate (no map) as fields change
+        self.live_preview_enabled = tk.BooleanVar(value=True)
+        self.live_preview = Debouncer(
+            self.root.after,
+            self.root.after_cancel,
+            self.LIVE_PREVIEW_DEBOUNCE_MS,
+            self.update_live_preview,
+        )
+        self.session_selection_changed = Debouncer(
+            self.root.after,
+            self.root.after_cancel,
+            self.SESSION_SELECTION_DEBOUNCE_MS,
+            self.update_session_estimate,
+        )
+
         # Ensure maps directory exists in project folder
         self.maps_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps")
         os.makedirs(self.maps_dir, exist_ok=True)
@@ -212,6 +278,19 @@ class HornetLocatorGUI:
         self.buttons["print_map"].config(text=f"🖨️ {self.t('print_map')}")
         self.buttons["save_report"].config(text=f"💾 {self.t('save_report')}")
         self.buttons["clear"].config(text=f"🔄 {self.t('clear')}")
+        if not self.tasks.busy:
+            self.labels["status"].config(text=self.t("status_ready"))
+        self.buttons["live_preview"].config(text=self.t("live_preview"))
+        self.update_live_preview()
+
+        # Update session panel
+        self.session_labelframe.config(text=f"📋 {self.t('session_panel_title')}")
+        for column, _width in self.SESSION_COLUMNS:
+            self.session_tree.heading(column, text=self.t(f"session_col_{column}"))
+        self.buttons["session_select_all"].config(text=self.t("session_select_all"))
+        self.buttons["session_clear_selection"].config(text=self.t("session_clear_selection"))
+        self.buttons["session_map"].config(text=f"🗺️ {self.t('session_map_selection')}")
+        self.update_session_estimate()
 
         # Update results text based on current state
         if not self.observations:
@@ -357,6 +436,7 @@ class HornetLocatorGUI:
         self.create_header(main_frame)
         self.create_input_panel(main_frame)
         self.create_results_panel(main_frame)
+        self.create_session_panel(main_frame)
 
     def create_header(self, parent: ttk.Frame) -> None:
         """Create header section."""
@@ -544,6 +624,33 @@ class HornetLocatorGUI:
         )
         row += 1
 
+        # Live preview of the estimate while editing
+        self.buttons["live_preview"] = ttk.Checkbutton(
+            input_frame,
+            text=self.t("live_preview"),
+            variable=self.live_preview_enabled,
+            command=self.update_live_preview,
+        )
+        self.buttons["live_preview"].grid(row=row, column=0, columnspan=2, sticky=tk.W)
+        row += 1
+
+        self.labels["live_preview_result"] = ttk.Label(
+            input_frame, text="", style="Success.TLabel", justify=tk.LEFT
+        )
+        self.labels["live_preview_result"].grid(
+            row=row, column=0, columnspan=2, sticky=tk.W, pady=(5, 0)
+        )
+        row += 1
+
+        for entry in (
+            self.lat_entry,
+            self.lon_entry,
+            self.bearing_entry,
+            self.minutes_entry,
+            self.seconds_entry,
+        ):
+            entry.bind("<KeyRelease>", self.live_preview.trigger)
+
         # Calculate Button
         self.buttons["calculate"] = ttk.Button(
             input_frame,
@@ -554,6 +661,17 @@ class HornetLocatorGUI:
         self.buttons["calculate"].grid(row=row, column=0, columnspan=2, pady=15, sticky=tk.W)
         row += 1
 
+        # Progress of background calculation / map rendering
+        self.progress_bar = ttk.Progressbar(input_frame, mode="determinate", maximum=100)
+        self.progress_bar.grid(row=row, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
+        row += 1
+
+        self.labels["status"] = ttk.Label(
+            input_frame, text=self.t("status_ready"), style="Info.TLabel"
+        )
+        self.labels["status"].grid(row=row, column=0, columnspan=2, sticky=tk.W)
+        row += 1
+
         # Action Buttons
         button_frame = ttk.Frame(input_frame)
         button_frame.grid(row=row, column=0, columnspan=2, pady=10, sticky=tk.W)
@@ -594,6 +712,8 @@ class HornetLocatorGUI:
         ttk.Label(input_frame, text="").grid(row=row, column=0, pady=20)
         input_frame.columnconfigure(1, weight=1)
 
+        self.update_live_preview()
+
     def create_results_panel(self, parent: ttk.Frame) -> None:
         """Create results display panel with scrollbar."""
         self.results_labelframe = ttk.LabelFrame(
@@ -610,20 +730,241 @@ class HornetLocatorGUI:
 
         self.update_initial_results_text()
 
+    def create_session_panel(self, parent: ttk.Frame) -> None:
+        """Create the session table listing all observations of this session."""
+        self.session_labelframe = ttk.LabelFrame(
+            parent, text=f"📋 {self.t('session_panel_title')}", padding="5"
+        )
+        self.session_labelframe.grid(
+            row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(5, 0)
+        )
+        self.session_labelframe.rowconfigure(0, weight=1)
+        self.session_labelframe.columnconfigure(0, weight=1)
+
+        columns = [column for column, _width in self.SESSION_COLUMNS]
+        self.session_tree = ttk.Treeview(
+            self.session_labelframe,
+            columns=columns,
+            show="headings",
+            selectmode="extended",
+            height=6,
+        )
+        for column, width in self.SESSION_COLUMNS:
+            self.session_tree.heading(column, text=self.t(f"session_col_{column}"))
+            self.session_tree.column(column, width=width, stretch=column == "position")
+        self.session_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        scrollbar = ttk.Scrollbar(
+            self.session_labelframe, orient="vertical", command=self.session_tree.yview
+        )
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.session_tree.configure(yscrollcommand=scrollbar.set)
+        self.session_tree.bind("<<TreeviewSelect>>", self.session_selection_changed.trigger)
+
+        controls = ttk.Frame(self.session_labelframe)
+        controls.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 0))
+        controls.columnconfigure(3, weight=1)
+
+        self.buttons["session_select_all"] = ttk.Button(
+            controls,
+            text=self.t("session_select_all"),
+            command=self.select_all_session_rows,
+            style="Action.TButton",
+        )
+        self.buttons["session_select_all"].grid(row=0, column=0, padx=2)
+
+        self.buttons["session_clear_selection"] = ttk.Button(
+            controls,
+            text=self.t("session_clear_selection"),
+            command=self.clear_session_selection,
+            style="Action.TButton",
+        )
+        self.buttons["session_clear_selection"].grid(row=0, column=1, padx=2)
+
+        self.buttons["session_map"] = ttk.Button(
+            controls,
+            text=f"🗺️ {self.t('session_map_selection')}",
+            command=self.map_session_selection,
+            style="Action.TButton",
+        )
+        self.buttons["session_map"].grid(row=0, column=2, padx=2)
+
+        self.labels["session_estimate"] = ttk.Label(controls, text="", style="Info.TLabel")
+        self.labels["session_estimate"].grid(row=0, column=3, sticky=tk.W, padx=10)
+
+        self.update_session_estimate()
+
+    def add_session_observations(self, observations: list[Observation]) -> None:
+        """
+        Append observations to the session and queue their table rows.
+
+        Rows are inserted in chunks from the event loop and selected as they
+        appear, so the triangulated estimate includes new observations.
+        """
+        start = len(self.observations)
+        self.observations.extend(observations)
+        self._session_pending_rows.extend(range(start, len(self.observations)))
+        if not self._session_inserting:
+            self._session_inserting = True
+            self.root.after_idle(self._insert_session_rows)
+
+    def _insert_session_rows(self) -> None:
+        """Insert one chunk of queued rows into the session table."""
+        iids = []
+        for _ in range(min(self.SESSION_INSERT_CHUNK, len(self._session_pending_rows))):
+            index = self._session_pending_rows.popleft()
+            iid = str(index)
+            self.session_tree.insert("", tk.END, iid=iid, values=self._session_row_values(index))
+            iids.append(iid)
+
+        if iids:
+            self.session_tree.selection_add(iids)
+            self.session_tree.see(iids[-1])
+
+        if self._session_pending_rows:
+            self.root.after(1, self._insert_session_rows)
+        else:
+            self._session_inserting = False
+
+    def _session_row_values(self, index: int) -> tuple:
+        """Format one observation as a session table row."""
+        obs = self.observations[index]
+        return (
+            index + 1,
+            obs.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            format_coordinates(obs.latitude, obs.longitude),
+            format_bearing(obs.bearing),
+            f"{obs.round_trip_time:.0f}s",
+            f"{obs.estimated_distance:.0f}m",
+            obs.hornet_color_mark or "",
+        )
+
+    def select_all_session_rows(self) -> None:
+        """Select every observation in the session table."""
+        self.session_tree.selection_set(self.session_tree.get_children())
+
+    def clear_session_selection(self) -> None:
+        """Deselect every observation in the session table."""
+        self.session_tree.selection_set(())
+
+    def selected_session_indices(self) -> list[int]:
+        """Indices into ``self.observations`` of the selected rows, in session order."""
+        return sorted(int(iid) for iid in self.session_tree.selection())
+
+    def update_session_estimate(self) -> None:
+        """Triangulate the selected observations and show the estimate."""
+        self.session_selection_changed.cancel()
+        label = self.labels["session_estimate"]
+        indices = self.selected_session_indices()
+
+        if len(indices) < 2:
+            self.session_hive_location = None
+            label.config(text=self.t("session_select_more").format(count=len(indices)))
+            return
+
+        # Only newly selected observations are solved; the rest come from the cache
+        observations = [self.observations[i] for i in indices]
+        estimates = []
+        for index, obs in zip(indices, observations, strict=True):
+            estimate = self._session_estimates.get(index)
+            if estimate is None:
+                estimate = self.calculator.calculate_from_single_observation(obs)
+                self._session_estimates[index] = estimate
+            estimates.append(estimate)
+
+        self.session_hive_location = self.calculator.triangulate_estimates(observations, estimates)
+        label.config(
+            text=self.t("session_estimate").format(
+                count=len(indices),
+                coordinates=format_coordinates(
+                    self.session_hive_location.latitude, self.session_hive_location.longitude
+                ),
+                radius=self.session_hive_location.confidence_radius,
+            )
+        )
+
+    def map_session_selection(self) -> None:
+        """Render a map of the selected observations with their triangulated estimate."""
+        self.update_session_estimate()
+        if self.session_hive_location is None:
+            messagebox.showwarning(
+                self.t("no_data_title"),
+                self.t("session_select_more").format(count=len(self.session_tree.selection())),
+            )
+            return
+
+        observations = [self.observations[i] for i in self.selected_session_indices()]
+        hive_locations = [self.session_hive_location]
+
+        def work(context: TaskContext) -> str:
+            return self.generate_and_open_map(observations, hive_locations, context)
+
+        def on_success(map_file: str) -> None:
+            self.current_map_file = map_file
+            self._reset_progress()
+
+        self.tasks.submit(
+            "session_map",
+            work,
+            on_success=on_success,
+            on_error=self._on_calculation_error,
+            on_progress=self._on_task_progress,
+        )
+
     def open_gps_help(self) -> None:
         """Open Google Maps for GPS coordinates."""
         webbrowser.open("https://www.google.com/maps")
         messagebox.showinfo(self.t("gps_help_title"), self.t("gps_help_message"))
 
+    def read_flight_inputs(self) -> tuple[float, float, float, float]:
+        """
+        Read the required observation fields.
+
+        Returns:
+            Tuple of (latitude, longitude, bearing, round_trip_time_seconds)
+
+        Raises:
+            ValueError: If a field is empty or not a number
+        """
+        latitude = float(self.lat_entry.get())
+        longitude = float(self.lon_entry.get())
+        bearing = float(self.bearing_entry.get())
+        minutes = float(self.minutes_entry.get())
+        seconds = float(self.seconds_entry.get())
+        return latitude, longitude, bearing, minutes * 60 + seconds
+
+    def update_live_preview(self) -> None:
+        """Recalculate the estimate from the current fields without rendering a map."""
+        self.live_preview.cancel()
+        label = self.labels["live_preview_result"]
+        if not self.live_preview_enabled.get():
+            label.config(text="")
+            return
+
+        start = time.perf_counter()
+        try:
+            hive_lat, hive_lon, distance, confidence = _preview_estimate(*self.read_flight_inputs())
+        except ValueError:
+            label.config(text=self.t("live_preview_invalid"), style="Warning.TLabel")
+            return
+
+        label.config(
+            text=self.t("live_preview_result").format(
+                coordinates=format_coordinates(hive_lat, hive_lon),
+                distance=distance,
+                radius=confidence,
+            ),
+            style="Success.TLabel",
+        )
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms > self.LIVE_PREVIEW_BUDGET_MS:
+            logger.warning(f"Live preview took {elapsed_ms:.1f} ms")
+
     def calculate_location(self) -> None:
         """Calculate hive location from input data."""
         try:
-            latitude = float(self.lat_entry.get())
-            longitude = float(self.lon_entry.get())
-            bearing = float(self.bearing_entry.get())
-            minutes = float(self.minutes_entry.get())
-            seconds = float(self.seconds_entry.get())
-            round_trip_time = minutes * 60 + seconds
+            latitude, longitude, bearing, round_trip_time = self.read_flight_inputs()
 
             color = self.color_entry.get().strip() or None
             speed_text = self.speed_entry.get().strip()
@@ -639,42 +980,85 @@ class HornetLocatorGUI:
                 hornet_color_mark=color,
                 notes=notes,
             )
+        except ValueError as e:
+            logger.error(f"Validation error in calculate_location: {e}")
+            messagebox.showerror(
+                self.t("error_title"), self.t("error_message").format(error=str(e))
+            )
+            return
 
+        def work(context: TaskContext) -> tuple[HiveLocation, str]:
+            context.report_progress(0.1, self.t("status_calculating"))
             hive_empirical = self.calculator.calculate_from_single_observation(
                 observation, method="empirical"
             )
+            context.raise_if_cancelled()
+            map_file = self.generate_and_open_map([observation], [hive_empirical], context)
+            return hive_empirical, map_file
+
+        # A new request supersedes any calculation still running
+        self.tasks.submit(
+            "calculate",
+            work,
+            on_success=lambda result: self._on_calculation_done(observation, speed, *result),
+            on_error=self._on_calculation_error,
+            on_progress=self._on_task_progress,
+        )
 
-            self.observations.append(observation)
-            self.current_hive_location = hive_empirical
-
-            # Generate map FIRST so self.current_map_file is set
-            self.generate_and_open_map(observation, hive_empirical)
-            # Then display results (which references self.current_map_file)
-            self.display_results(observation, hive_empirical, speed)
+    def _on_calculation_done(
+        self,
+        observation: Observation,
+        speed: float | None,
+        hive_empirical: HiveLocation,
+        map_file: str,
+    ) -> None:
+        """Show the results of a finished background calculation."""
+        self.add_session_observations([observation])
+        self.current_hive_location = hive_empirical
+        self.current_map_file = map_file
+        self.display_results(observation, hive_empirical, speed)
+        self._reset_progress()
+
+        # Show success message with translation
+        messagebox.showinfo(
+            self.t("success_title"),
+            self.t("success_message").format(filename=os.path.basename(self.current_map_file)),
+        )
+        logger.info(
+            f"Successfully calculated hive location and generated map: {self.current_map_file}"
+        )
 
-            # Show success message with translation
-            messagebox.showinfo(
-                self.t("success_title"),
-                self.t("success_message").format(filename=os.path.basename(self.current_map_file)),
-            )
-            logger.info(
-                f"Successfully calculated hive location and generated map: {self.current_map_file}"
+    def _on_calculation_error(self, error: BaseException) -> None:
+        """Report an error raised by a background calculation."""
+        self._reset_progress()
+        if isinstance(error, ValueError):
+            logger.error(f"Validation error in calculate_location: {error}")
+            messagebox.showerror(
+                self.t("error_title"), self.t("error_message").format(error=str(error))
             )
-
-        except ValueError as e:
-            logger.error(f"Validation error in calculate_location: {e}")
+        elif isinstance(error, (MapGenerationError, OSError)):
+            logger.error(f"File I/O error generating map: {error}")
             messagebox.showerror(
-                self.t("error_title"), self.t("error_message").format(error=str(e))
+                self.t("map_error_title"), self.t("map_error_message").format(error=str(error))
+            )
+        else:
+            logger.error(
+                f"Unexpected error in calculate_location: {error}",
+                exc_info=(type(error), error, error.__traceback__),
             )
-        except OSError as e:
-            logger.error(f"File I/O error in calculate_location: {e}")
-            messagebox.showerror("File Error", f"Failed to create or save map file: {e}")
-        except Exception as e:
-            logger.exception(f"Unexpected error in calculate_location: {e}")
             messagebox.showerror(
-                self.t("calc_error_title"), self.t("calc_error_message").format(error=str(e))
+                self.t("calc_error_title"), self.t("calc_error_message").format(error=str(error))
             )
-            traceback.print_exc()
+
+    def _on_task_progress(self, fraction: float, message: str) -> None:
+        """Update the progress bar from a background task."""
+        self.progress_bar["value"] = fraction * 100
+        self.labels["status"].config(text=message)
+
+    def _reset_progress(self) -> None:
+        """Return the progress bar to its idle state."""
+        self.progress_bar["value"] = 0
+        self.labels["status"].config(text=self.t("status_ready"))
 
     def display_results(
         self, observation: Observation, hive_empirical: HiveLocation, speed: float | None
@@ -767,31 +1151,37 @@ class HornetLocatorGUI:
         self.results_text.insert("1.0", output)
         self.results_text.config(state="disabled")
 
-    def generate_and_open_map(self, observation: Observation, hive_location: HiveLocation) -> None:
-        """Generate interactive map and open in browser."""
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            self.current_map_file = os.path.join(self.maps_dir, f"hornet_map_{timestamp}.html")
-
-            self.map_generator.create_simple_map(
-                observations=[observation],
-                hive_locations=[hive_location],
-                output_file=self.current_map_file,
-            )
-
-            # Open in browser
-            webbrowser.open("file://" + os.path.abspath(self.current_map_file))
-            logger.info(f"Map generated and opened: {self.current_map_file}")
+    def generate_and_open_map(
+        self,
+        observations: list[Observation],
+        hive_locations: list[HiveLocation],
+        context: TaskContext,
+    ) -> str:
+        """
+        Generate interactive map and open in browser.
+
+        Runs in a background worker: must not touch Tk widgets. Errors are
+        propagated to the task's error callback.
+
+        Returns:
+            Path to the generated map file
+        """
+        context.report_progress(0.4, self.t("status_rendering_map"))
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        map_file = os.path.join(self.maps_dir, f"hornet_map_{timestamp}.html")
+
+        map_file = self.map_generator.create_simple_map(
+            observations=observations,
+            hive_locations=hive_locations,
+            output_file=map_file,
+        )
+        context.raise_if_cancelled()
 
-        except OSError as e:
-            logger.error(f"File I/O error generating map: {e}")
-            messagebox.showerror("Map Generation Error", f"Failed to create map file: {e}")
-        except Exception as e:
-            logger.exception(f"Unexpected error generating map: {e}")
-            messagebox.showerror(
-                self.t("map_error_title"), self.t("map_error_message").format(error=str(e))
-            )
-            traceback.print_exc()
+        # Open in browser
+        context.report_progress(0.9, self.t("status_opening_map"))
+        webbrowser.open("file://" + os.path.abspath(map_file))
+        logger.info(f"Map generated and opened: {map_file}")
+        return map_file
 
     def view_map(self) -> None:
         """Open/reopen map in browser."""
@@ -850,6 +1240,12 @@ class HornetLocatorGUI:
         self.bearing_entry.insert(0, "45")
         self.minutes_entry.insert(0, "6")
         self.seconds_entry.insert(0, "30")
+        self.update_live_preview()
+
+    def on_close(self) -> None:
+        """Stop background work and close the window."""
+        self.tasks.shutdown()
+        self.root.destroy()
 
 
 def main() -> None:
@@ -6,6 +6,7 @@ import sys
 
 from vespa_finder import HiveCalculator, Observation, __version__
 from vespa_finder.geo_utils import format_bearing, format_coordinates
+from vespa_finder.quality import score_observations
 
 
 def get_float_input(
@@ -104,6 +105,8 @@ def display_results(observation: Observation, calculator: HiveCalculator):
     print(
         f"  Round trip time: {observation.round_trip_time:.0f} seconds ({observation.round_trip_time / 60:.2f} minutes)"
     )
+    for flag in score_observations([observation]).describe(0):
+        print(f"  ⚠️  Quality check failed: {flag.replace('_', ' ')}")
 
     # Calculate using empirical method (professional standard)
     hive_empirical = calculator.calculate_from_single_observation(observation, method="empirical")
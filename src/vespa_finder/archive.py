@@ -0,0 +1,428 @@
+"""Memory-mapped columnar archive of observations with time-range access.
+
+An archive is a directory holding one raw little-endian file per column,
+a sparse timestamp index and a small JSON metadata file::
+
+    meta.json            format version, row count, index stride, color mark dictionary
+    latitude.col         float64
+    longitude.col        float64
+    bearing.col          float64
+    round_trip_time.col  float64
+    speed.col            float64, NaN where unknown
+    temperature.col      float64, NaN where unknown
+    timestamp.col        datetime64[us], non-decreasing (aware values in UTC)
+    tz_offset.col        int32 seconds east of UTC of the recorded time, or NAIVE_TIMESTAMP
+    mark.col             uint32 code into the color mark dictionary (0 = no mark)
+    timestamp.idx        every ``index_stride``-th timestamp
+
+Rows are kept in timestamp order, so a time range is a contiguous row range:
+the in-memory sparse index narrows the search to one stride of the
+timestamp column and the slice is returned as memory-mapped views. Several
+processes opening the same archive share the operating system's page cache.
+Notes are not archived. Timestamps are ordered in UTC; the offset column
+keeps each observation's recorded clock time and time zone.
+"""
+
+import json
+import os
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta, timezone
+
+import numpy as np
+
+from .binary_format import NAIVE_TIMESTAMP
+from .calculator import HiveCalculator
+from .models import HiveLocationBatch, Observation
+from .quality import QualityScorer, QualityScores
+
+FORMAT_NAME = "vespa-finder-archive"
+FORMAT_VERSION = 1
+DEFAULT_INDEX_STRIDE = 4096
+
+COLUMNS = {
+    "latitude": np.dtype("<f8"),
+    "longitude": np.dtype("<f8"),
+    "bearing": np.dtype("<f8"),
+    "round_trip_time": np.dtype("<f8"),
+    "speed": np.dtype("<f8"),
+    "temperature": np.dtype("<f8"),
+    "timestamp": np.dtype("<M8[us]"),
+    "tz_offset": np.dtype("<i4"),
+    "mark": np.dtype("<u4"),
+}
+
+_MAX_TZ_OFFSET = 24 * 3600  # seconds
+
+
+class ArchiveError(Exception):
+    """Exception raised for invalid archives or out-of-order appends."""
+
+    pass
+
+
+def _to_datetime64(value: datetime | np.datetime64) -> np.datetime64:
+    """Convert a timestamp to the archive's time base (aware values become UTC)."""
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return np.datetime64(value, "us")
+
+
+# Valid range per column, as enforced by Observation (bounds inclusive)
+_COLUMN_RANGES = {
+    "latitude": ("Latitude", -90.0, 90.0),
+    "longitude": ("Longitude", -180.0, 180.0),
+    "bearing": ("Bearing", 0.0, 360.0),
+}
+
+
+def _validate_columns(arrays: dict[str, np.ndarray]) -> None:
+    """Reject rows an Observation would reject, so slices can skip validation."""
+    for name, (label, low, high) in _COLUMN_RANGES.items():
+        invalid = ~((arrays[name] >= low) & (arrays[name] <= high))  # also catches NaN
+        if invalid.any():
+            value = arrays[name][np.argmax(invalid)]
+            raise ArchiveError(f"{label} must be between {low:g} and {high:g}, got {value}")
+    invalid = ~(arrays["round_trip_time"] > 0)
+    if invalid.any():
+        value = arrays["round_trip_time"][np.argmax(invalid)]
+        raise ArchiveError(f"Round trip time must be positive, got {value}")
+    invalid = arrays["speed"] <= 0  # NaN marks an unknown speed
+    if invalid.any():
+        raise ArchiveError(f"Speed must be positive, got {arrays['speed'][np.argmax(invalid)]}")
+    invalid = (arrays["temperature"] < -40) | (arrays["temperature"] > 60)
+    if invalid.any():
+        value = arrays["temperature"][np.argmax(invalid)]
+        raise ArchiveError(f"Temperature must be between -40 and 60 °C, got {value}")
+    if np.isnat(arrays["timestamp"]).any():
+        raise ArchiveError("Archived observations need a timestamp")
+    offset = arrays["tz_offset"]
+    invalid = (np.abs(offset) >= _MAX_TZ_OFFSET) & (offset != NAIVE_TIMESTAMP)
+    if invalid.any():
+        raise ArchiveError(f"Invalid UTC offset of {offset[np.argmax(invalid)]} seconds")
+
+
+class ArchiveSlice:
+    """A contiguous row range of an archive, exposed as memory-mapped column views."""
+
+    def __init__(self, columns: dict[str, np.ndarray], marks: list[str], start: int):
+        self.columns = columns
+        self.start = start  # Row number of the first row in the archive
+        self.marks = marks
+
+    def __len__(self) -> int:
+        return len(self.columns["timestamp"])
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        try:
+            return self.__dict__["columns"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def color_marks(self) -> list[str | None]:
+        """Decode the color mark of each row."""
+        lookup = [None, *self.marks]
+        return [lookup[code] for code in self.columns["mark"].tolist()]
+
+    def wall_clock(self) -> np.ndarray:
+        """Timestamps as recorded: local clock time for aware rows, unchanged for naive ones."""
+        offset = self.columns["tz_offset"]
+        seconds = np.where(offset == NAIVE_TIMESTAMP, 0, offset).astype("m8[s]")
+        return self.columns["timestamp"] + seconds
+
+    def calculate(
+        self, calculator: HiveCalculator | None = None, method: str = "empirical"
+    ) -> HiveLocationBatch:
+        """Estimate the hive location for every row with ``HiveCalculator.calculate_batch``."""
+        calculator = calculator or HiveCalculator()
+        return calculator.calculate_batch(
+            self.columns["latitude"],
+            self.columns["longitude"],
+            self.columns["bearing"],
+            self.columns["round_trip_time"],
+            speed=self.columns["speed"],
+            method=method,
+            timestamp=self.wall_clock(),
+            temperature=self.columns["temperature"],
+        )
+
+    def score_quality(self, scorer: QualityScorer | None = None) -> QualityScores:
+        """Quality flags and weights for every row with ``QualityScorer.score_batch``."""
+        scorer = scorer or QualityScorer()
+        return scorer.score_batch(
+            self.columns["latitude"],
+            self.columns["longitude"],
+            self.columns["bearing"],
+            self.columns["round_trip_time"],
+            speed=self.columns["speed"],
+            timestamp=self.wall_clock(),
+            temperature=self.columns["temperature"],
+        )
+
+    def to_observations(self) -> list[Observation]:
+        """Materialize the rows as Observation objects (without notes)."""
+        zones = {
+            offset: None if offset == NAIVE_TIMESTAMP else timezone(timedelta(seconds=offset))
+            for offset in np.unique(self.columns["tz_offset"]).tolist()
+        }
+        # Rows were validated when appended
+        trusted = Observation.trusted
+        return [
+            trusted(
+                lat,
+                lon,
+                bearing,
+                rtt,
+                None if speed != speed else speed,  # NaN check
+                wall.replace(tzinfo=zones[offset]),
+                "",
+                mark,
+                None if temperature != temperature else temperature,
+            )
+            for lat, lon, bearing, rtt, speed, wall, offset, mark, temperature in zip(
+                self.columns["latitude"].tolist(),
+                self.columns["longitude"].tolist(),
+                self.columns["bearing"].tolist(),
+                self.columns["round_trip_time"].tolist(),
+                self.columns["speed"].tolist(),
+                self.wall_clock().tolist(),
+                self.columns["tz_offset"].tolist(),
+                self.color_marks(),
+                self.columns["temperature"].tolist(),
+                strict=True,
+            )
+        ]
+
+
+class ObservationArchive:
+    """
+    Reader and appender for a columnar observation archive.
+
+    Column files are mapped lazily and read-only. The archive object pickles
+    as its path, so it can be handed to worker processes, which map the same
+    files again instead of receiving copies of the data.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open an existing archive.
+
+        Args:
+            path: Archive directory (see ``create``)
+        """
+        self.path = path
+        meta_path = os.path.join(path, "meta.json")
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            raise ArchiveError(f"{path} is not an observation archive") from None
+        if meta.get("format") != FORMAT_NAME:
+            raise ArchiveError(f"{path} is not an observation archive")
+        if meta["version"] > FORMAT_VERSION:
+            raise ArchiveError(
+                f"{path} uses archive version {meta['version']}; "
+                f"this version reads up to {FORMAT_VERSION}"
+            )
+        self.count: int = meta["count"]
+        self.index_stride: int = meta["index_stride"]
+        self.marks: list[str] = meta["marks"]
+        self._columns: dict[str, np.ndarray] = {}
+        self._index = np.fromfile(self._file("timestamp.idx"), dtype=COLUMNS["timestamp"])[
+            : self._index_length(self.count)
+        ]
+
+    @classmethod
+    def create(cls, path: str, index_stride: int = DEFAULT_INDEX_STRIDE) -> "ObservationArchive":
+        """
+        Create an empty archive directory.
+
+        Args:
+            path: Directory to create (must not already hold an archive)
+            index_stride: Rows between sparse index entries
+        """
+        if index_stride < 1:
+            raise ValueError(f"index_stride must be at least 1, got {index_stride}")
+        if os.path.exists(os.path.join(path, "meta.json")):
+            raise ArchiveError(f"{path} already contains an archive")
+        os.makedirs(path, exist_ok=True)
+        for name in COLUMNS:
+            open(os.path.join(path, f"{name}.col"), "wb").close()
+        open(os.path.join(path, "timestamp.idx"), "wb").close()
+        _write_meta(path, count=0, index_stride=index_stride, marks=[])
+        return cls(path)
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["path"])
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _index_length(self, count: int) -> int:
+        return -(-count // self.index_stride)  # ceil
+
+    def column(self, name: str) -> np.ndarray:
+        """Memory-mapped view of a whole column."""
+        view = self._columns.get(name)
+        if view is None:
+            if self.count == 0:
+                view = np.zeros(0, dtype=COLUMNS[name])
+            else:
+                view = np.memmap(
+                    self._file(f"{name}.col"), dtype=COLUMNS[name], mode="r", shape=(self.count,)
+                )
+            self._columns[name] = view
+        return view
+
+    def rows(self, start: int, stop: int) -> ArchiveSlice:
+        """Rows ``start`` to ``stop`` (exclusive) as zero-copy column views."""
+        start, stop, _ = slice(start, stop).indices(self.count)
+        stop = max(start, stop)
+        return ArchiveSlice(
+            {name: self.column(name)[start:stop] for name in COLUMNS}, self.marks, start
+        )
+
+    def time_range(
+        self,
+        start: datetime | np.datetime64 | None = None,
+        end: datetime | np.datetime64 | None = None,
+    ) -> ArchiveSlice:
+        """
+        Rows with ``start <= timestamp < end``.
+
+        Only the sparse index and at most two strides of the timestamp column
+        are read; the returned columns are views into the mapped files.
+
+        Args:
+            start: Inclusive lower bound (None for the beginning)
+            end: Exclusive upper bound (None for the end)
+        """
+        lo = 0 if start is None else self._lower_bound(_to_datetime64(start))
+        hi = self.count if end is None else self._lower_bound(_to_datetime64(end))
+        return self.rows(lo, max(lo, hi))
+
+    def _lower_bound(self, value: np.datetime64) -> int:
+        """First row whose timestamp is >= value."""
+        # index[k] = timestamp[k * stride]; rows before block k - 1 are all < value
+        k = int(np.searchsorted(self._index, value, side="left"))
+        if k == 0:
+            return 0
+        lo = (k - 1) * self.index_stride
+        hi = min(k * self.index_stride, self.count)
+        window = self.column("timestamp")[lo:hi]
+        return lo + int(np.searchsorted(window, value, side="left"))
+
+    def append(self, observations: Iterable[Observation]) -> int:
+        """
+        Append observations (sorted by timestamp before writing).
+
+        Args:
+            observations: Observations no older than the last archived one
+
+        Returns:
+            Number of rows appended
+        """
+        observations = list(observations)
+        marks = list(self.marks)
+        codes = {mark: i + 1 for i, mark in enumerate(marks)}
+
+        def mark_code(mark: str | None) -> int:
+            if mark is None:
+                return 0
+            code = codes.get(mark)
+            if code is None:
+                marks.append(mark)
+                code = codes[mark] = len(marks)
+            return code
+
+        columns = {
+            "latitude": [o.latitude for o in observations],
+            "longitude": [o.longitude for o in observations],
+            "bearing": [o.bearing for o in observations],
+            "round_trip_time": [o.round_trip_time for o in observations],
+            "speed": [np.nan if o.speed is None else o.speed for o in observations],
+            "timestamp": [_to_datetime64(o.timestamp) for o in observations],
+            "tz_offset": [
+                NAIVE_TIMESTAMP
+                if o.timestamp.tzinfo is None
+                else int(o.timestamp.utcoffset().total_seconds())
+                for o in observations
+            ],
+            "mark": [mark_code(o.hornet_color_mark) for o in observations],
+            "temperature": [
+                np.nan if o.temperature is None else o.temperature for o in observations
+            ],
+        }
+        return self.append_columns(columns, marks=marks)
+
+    def append_columns(self, columns: dict[str, Iterable], marks: list[str] | None = None) -> int:
+        """
+        Append rows given as columns (e.g. from another archive or a binary file).
+
+        Values are range-checked like ``Observation`` fields; a batch with an
+        invalid row is rejected as a whole.
+
+        Args:
+            columns: One array per name in COLUMNS; mark codes refer to ``marks``
+            marks: Updated color mark dictionary (must extend the current one)
+
+        Returns:
+            Number of rows appended
+        """
+        arrays = {name: np.asarray(columns[name], dtype=dtype) for name, dtype in COLUMNS.items()}
+        length = len(arrays["timestamp"])
+        if any(len(array) != length for array in arrays.values()):
+            raise ArchiveError("All columns must have the same length")
+        marks = self.marks if marks is None else marks
+        if marks[: len(self.marks)] != self.marks:
+            raise ArchiveError("Color mark dictionary can only be extended")
+        if length == 0:
+            return 0
+        if int(arrays["mark"].max()) > len(marks):
+            raise ArchiveError("Color mark code outside the dictionary")
+        _validate_columns(arrays)
+
+        order = np.argsort(arrays["timestamp"], kind="stable")
+        arrays = {name: array[order] for name, array in arrays.items()}
+        if self.count and arrays["timestamp"][0] < self.column("timestamp")[-1]:
+            raise ArchiveError("Appended observations must not be older than the archive")
+
+        # Rows past ``count`` are leftovers of an interrupted append; overwrite them
+        for name, array in arrays.items():
+            with open(self._file(f"{name}.col"), "r+b") as f:
+                f.truncate(self.count * COLUMNS[name].itemsize)
+                f.seek(0, os.SEEK_END)
+                f.write(array.tobytes())
+
+        new_count = self.count + length
+        first_entry = self._index_length(self.count)
+        rows = np.arange(first_entry, self._index_length(new_count)) * self.index_stride
+        with open(self._file("timestamp.idx"), "r+b") as f:
+            f.truncate(first_entry * COLUMNS["timestamp"].itemsize)
+            f.seek(0, os.SEEK_END)
+            f.write(arrays["timestamp"][rows - self.count].tobytes())
+
+        _write_meta(self.path, count=new_count, index_stride=self.index_stride, marks=marks)
+        self.__init__(self.path)
+        return length
+
+
+def _write_meta(path: str, count: int, index_stride: int, marks: list[str]) -> None:
+    """Atomically replace the metadata file; this commits an append."""
+    meta = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "count": count,
+        "index_stride": index_stride,
+        "columns": {name: dtype.str for name, dtype in COLUMNS.items()},
+        "marks": marks,
+    }
+    temp_path = os.path.join(path, "meta.json.tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    os.replace(temp_path, os.path.join(path, "meta.json"))
@@ -0,0 +1,367 @@
+"""Compact binary storage for observation and hive location collections.
+
+File layout (all integers little-endian)::
+
+    file header   16 bytes   magic b"VESPAFND", version u16, kind u8, 5 reserved bytes
+    block         repeated   one per write/append:
+        block header  16 bytes   record count u64, string table size u64
+        records       count * itemsize bytes of OBSERVATION_DTYPE / HIVE_LOCATION_DTYPE
+        string table  UTF-8 text referenced by (offset, length) fields of the records,
+                      padded with zeros to a multiple of 8 bytes
+
+Records are fixed-width and 8-byte aligned, so ``RecordFile`` exposes them as
+``numpy.memmap`` views without copying or parsing. Appending writes a new
+block; existing bytes are never rewritten. Floats are stored as ``float64``
+and timestamps as microseconds, so values round-trip exactly.
+"""
+
+import os
+import struct
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from .models import HiveLocation, Observation
+
+MAGIC = b"VESPAFND"
+FORMAT_VERSION = 1
+
+KIND_OBSERVATIONS = 1
+KIND_HIVE_LOCATIONS = 2
+
+_FILE_HEADER = struct.Struct("<8sHB5x")
+_BLOCK_HEADER = struct.Struct("<QQ")
+
+NO_STRING = 0xFFFFFFFF  # length marking a None string
+NAIVE_TIMESTAMP = -(2**31)  # tz_offset marking a naive datetime
+
+OBSERVATION_DTYPE = np.dtype(
+    [
+        ("latitude", "<f8"),
+        ("longitude", "<f8"),
+        ("bearing", "<f8"),
+        ("round_trip_time", "<f8"),
+        ("speed", "<f8"),  # NaN if not given
+        ("temperature", "<f8"),  # NaN if not given
+        ("timestamp", "<M8[us]"),  # wall-clock time
+        ("tz_offset", "<i4"),  # seconds east of UTC, or NAIVE_TIMESTAMP
+        ("notes_offset", "<u4"),
+        ("notes_length", "<u4"),
+        ("mark_offset", "<u4"),
+        ("mark_length", "<u4"),  # NO_STRING if no color mark
+        ("_pad", "<u4"),
+    ]
+)
+
+HIVE_LOCATION_DTYPE = np.dtype(
+    [
+        ("latitude", "<f8"),
+        ("longitude", "<f8"),
+        ("confidence_radius", "<f8"),
+        ("distance_from_observer", "<f8"),
+        ("bearing_from_observer", "<f8"),
+        ("timestamp", "<M8[us]"),  # NaT if not given
+        ("tz_offset", "<i4"),
+        ("method_offset", "<u4"),
+        ("method_length", "<u4"),
+        ("_pad", "<u4"),
+    ]
+)
+
+_DTYPES = {KIND_OBSERVATIONS: OBSERVATION_DTYPE, KIND_HIVE_LOCATIONS: HIVE_LOCATION_DTYPE}
+
+
+class BinaryFormatError(Exception):
+    """Exception raised for malformed or incompatible binary files."""
+
+    pass
+
+
+class _StringTable:
+    """Deduplicating builder for a block's string table."""
+
+    def __init__(self):
+        self._data = bytearray()
+        self._index: dict[str, tuple[int, int]] = {}
+
+    def add(self, text: str | None) -> tuple[int, int]:
+        if text is None:
+            return 0, NO_STRING
+        ref = self._index.get(text)
+        if ref is None:
+            encoded = text.encode("utf-8")
+            ref = (len(self._data), len(encoded))
+            self._data += encoded
+            self._index[text] = ref
+        return ref
+
+    def padded(self) -> bytes:
+        return bytes(self._data) + b"\0" * (-len(self._data) % 8)
+
+
+def _split_timestamps(timestamps: list[datetime | None]) -> tuple[np.ndarray, np.ndarray]:
+    """Convert datetimes to wall-clock microseconds plus UTC offsets."""
+    offsets = np.full(len(timestamps), NAIVE_TIMESTAMP, dtype="<i4")
+    wall = list(timestamps)
+    for i, ts in enumerate(timestamps):
+        if ts is not None and ts.tzinfo is not None:
+            offsets[i] = int(ts.utcoffset().total_seconds())
+            wall[i] = ts.replace(tzinfo=None)
+    return np.array(wall, dtype="<M8[us]"), offsets
+
+
+def _join_timestamp(wall: datetime | None, offset: int) -> datetime | None:
+    if wall is None or offset == NAIVE_TIMESTAMP:
+        return wall
+    return wall.replace(tzinfo=timezone(timedelta(seconds=int(offset))))
+
+
+def observations_to_records(observations: Iterable[Observation]) -> tuple[np.ndarray, bytes]:
+    """
+    Pack observations into a record array and string table.
+
+    Returns:
+        (records with OBSERVATION_DTYPE, padded string table)
+    """
+    observations = list(observations)
+    strings = _StringTable()
+    records = np.zeros(len(observations), dtype=OBSERVATION_DTYPE)
+    records["latitude"] = [o.latitude for o in observations]
+    records["longitude"] = [o.longitude for o in observations]
+    records["bearing"] = [o.bearing for o in observations]
+    records["round_trip_time"] = [o.round_trip_time for o in observations]
+    records["speed"] = [np.nan if o.speed is None else o.speed for o in observations]
+    records["temperature"] = [
+        np.nan if o.temperature is None else o.temperature for o in observations
+    ]
+    records["timestamp"], records["tz_offset"] = _split_timestamps(
+        [o.timestamp for o in observations]
+    )
+    notes = [strings.add(o.notes) for o in observations]
+    marks = [strings.add(o.hornet_color_mark) for o in observations]
+    if observations:
+        records["notes_offset"], records["notes_length"] = zip(*notes, strict=True)
+        records["mark_offset"], records["mark_length"] = zip(*marks, strict=True)
+    return records, strings.padded()
+
+
+def hive_locations_to_records(locations: Iterable[HiveLocation]) -> tuple[np.ndarray, bytes]:
+    """
+    Pack hive locations into a record array and string table.
+
+    Returns:
+        (records with HIVE_LOCATION_DTYPE, padded string table)
+    """
+    locations = list(locations)
+    strings = _StringTable()
+    records = np.zeros(len(locations), dtype=HIVE_LOCATION_DTYPE)
+    for field in (
+        "latitude",
+        "longitude",
+        "confidence_radius",
+        "distance_from_observer",
+        "bearing_from_observer",
+    ):
+        records[field] = [getattr(h, field) for h in locations]
+    records["timestamp"], records["tz_offset"] = _split_timestamps([h.timestamp for h in locations])
+    methods = [strings.add(h.calculation_method) for h in locations]
+    if locations:
+        records["method_offset"], records["method_length"] = zip(*methods, strict=True)
+    return records, strings.padded()
+
+
+def write_records(path: str, kind: int, records: np.ndarray, strings: bytes, append: bool = False):
+    """
+    Write one block of packed records.
+
+    Args:
+        path: Output file
+        kind: KIND_OBSERVATIONS or KIND_HIVE_LOCATIONS
+        records: Record array with the dtype for ``kind``
+        strings: String table referenced by the records (8-byte padded)
+        append: Add a block to an existing file instead of replacing it
+    """
+    if records.dtype != _DTYPES[kind]:
+        raise BinaryFormatError(f"Records have dtype {records.dtype}, expected {_DTYPES[kind]}")
+    if len(strings) % 8:
+        raise BinaryFormatError("String table must be padded to a multiple of 8 bytes")
+
+    if append and os.path.exists(path) and os.path.getsize(path) > 0:
+        _check_header(path, kind)
+        mode = "ab"
+    else:
+        mode = "wb"
+
+    with open(path, mode) as f:
+        if mode == "wb":
+            f.write(_FILE_HEADER.pack(MAGIC, FORMAT_VERSION, kind))
+        f.write(_BLOCK_HEADER.pack(len(records), len(strings)))
+        f.write(np.ascontiguousarray(records).tobytes())
+        f.write(strings)
+
+
+def write_observations(path: str, observations: Iterable[Observation], append: bool = False):
+    """Write observations to a binary file (see module docstring for the layout)."""
+    records, strings = observations_to_records(observations)
+    write_records(path, KIND_OBSERVATIONS, records, strings, append=append)
+
+
+def write_hive_locations(path: str, locations: Iterable[HiveLocation], append: bool = False):
+    """Write hive locations to a binary file (see module docstring for the layout)."""
+    records, strings = hive_locations_to_records(locations)
+    write_records(path, KIND_HIVE_LOCATIONS, records, strings, append=append)
+
+
+def _check_header(path: str, kind: int) -> None:
+    with open(path, "rb") as f:
+        header = f.read(_FILE_HEADER.size)
+    file_kind = _parse_header(header, path)
+    if file_kind != kind:
+        raise BinaryFormatError(f"{path} holds record kind {file_kind}, not {kind}")
+
+
+def _parse_header(header: bytes, path: str) -> int:
+    if len(header) < _FILE_HEADER.size:
+        raise BinaryFormatError(f"{path} is too short to be a VespaFinder binary file")
+    magic, version, kind = _FILE_HEADER.unpack(header[: _FILE_HEADER.size])
+    if magic != MAGIC:
+        raise BinaryFormatError(f"{path} is not a VespaFinder binary file")
+    if version > FORMAT_VERSION:
+        raise BinaryFormatError(
+            f"{path} uses format version {version}; this version reads up to {FORMAT_VERSION}"
+        )
+    if kind not in _DTYPES:
+        raise BinaryFormatError(f"{path} has unknown record kind {kind}")
+    return kind
+
+
+class RecordFile:
+    """
+    Read-only, memory-mapped view of a binary observation or hive location file.
+
+    Opening a file only parses the block headers; record arrays are views
+    into the mapped file, so loading is independent of the number of records
+    until objects are materialized.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a file.
+
+        Args:
+            path: File written by ``write_observations``/``write_hive_locations``
+        """
+        self.path = path
+        self._buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        self.kind = _parse_header(bytes(self._buffer[: _FILE_HEADER.size]), path)
+        self.dtype = _DTYPES[self.kind]
+        self.blocks: list[tuple[np.ndarray, memoryview]] = []
+
+        position = _FILE_HEADER.size
+        size = len(self._buffer)
+        while position < size:
+            if position + _BLOCK_HEADER.size > size:
+                raise BinaryFormatError(f"{path} has a truncated block header")
+            count, string_size = _BLOCK_HEADER.unpack(
+                bytes(self._buffer[position : position + _BLOCK_HEADER.size])
+            )
+            records_start = position + _BLOCK_HEADER.size
+            strings_start = records_start + count * self.dtype.itemsize
+            end = strings_start + string_size
+            if end > size:
+                raise BinaryFormatError(f"{path} has a truncated block")
+            records = self._buffer[records_start:strings_start].view(self.dtype)
+            strings = memoryview(self._buffer[strings_start:end])
+            self.blocks.append((records, strings))
+            position = end
+
+    def __len__(self) -> int:
+        return sum(len(records) for records, _ in self.blocks)
+
+    @property
+    def records(self) -> np.ndarray:
+        """All records; zero-copy when the file has a single block."""
+        if len(self.blocks) == 1:
+            return self.blocks[0][0]
+        if not self.blocks:
+            return np.zeros(0, dtype=self.dtype)
+        return np.concatenate([records for records, _ in self.blocks])
+
+    def to_observations(self) -> list[Observation]:
+        """Materialize all records as Observation objects."""
+        if self.kind != KIND_OBSERVATIONS:
+            raise BinaryFormatError(f"{self.path} does not contain observations")
+        # Records were validated when written
+        result = []
+        trusted = Observation.trusted
+        for records, strings in self.blocks:
+            text = _StringReader(strings)
+            for row in records.tolist():
+                lat, lon, bearing, rtt, speed, temp, wall, offset, n_off, n_len, m_off, m_len, _ = (
+                    row
+                )
+                result.append(
+                    trusted(
+                        lat,
+                        lon,
+                        bearing,
+                        rtt,
+                        None if speed != speed else speed,  # NaN check
+                        _join_timestamp(wall, offset),
+                        text.get(n_off, n_len),
+                        text.get(m_off, m_len),
+                        None if temp != temp else temp,
+                    )
+                )
+        return result
+
+    def to_hive_locations(self) -> list[HiveLocation]:
+        """Materialize all records as HiveLocation objects."""
+        if self.kind != KIND_HIVE_LOCATIONS:
+            raise BinaryFormatError(f"{self.path} does not contain hive locations")
+        result = []
+        for records, strings in self.blocks:
+            text = _StringReader(strings)
+            for record in records.tolist():
+                lat, lon, radius, distance, bearing, wall, offset, m_off, m_len, _ = record
+                result.append(
+                    HiveLocation(
+                        lat,
+                        lon,
+                        radius,
+                        distance,
+                        bearing,
+                        text.get(m_off, m_len),
+                        _join_timestamp(wall, offset),
+                    )
+                )
+        return result
+
+
+class _StringReader:
+    """Decode (offset, length) references into a block's string table."""
+
+    def __init__(self, table: memoryview):
+        self._table = table
+        self._cache: dict[tuple[int, int], str] = {}
+
+    def get(self, offset: int, length: int) -> str | None:
+        if length == NO_STRING:
+            return None
+        key = (offset, length)
+        text = self._cache.get(key)
+        if text is None:
+            text = str(self._table[offset : offset + length], "utf-8")
+            self._cache[key] = text
+        return text
+
+
+def read_observations(path: str) -> list[Observation]:
+    """Read all observations from a binary file."""
+    return RecordFile(path).to_observations()
+
+
+def read_hive_locations(path: str) -> list[HiveLocation]:
+    """Read all hive locations from a binary file."""
+    return RecordFile(path).to_hive_locations()
@@ -0,0 +1,327 @@
+"""Concurrent bulk submission of observations to the Waarneming.nl API."""
+
+import math
+import random
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Self
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .__version__ import __repository__, __version__
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient API failures."""
+
+    max_retries: int = 5
+    backoff_base: float = 0.5  # seconds
+    backoff_max: float = 30.0  # seconds
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Seconds to wait before retry number ``attempt`` (0-based).
+
+        Args:
+            attempt: Number of retries already made
+            retry_after: Server-requested delay (``Retry-After`` header), if any
+
+        Returns:
+            Delay in seconds
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        jittered = random.uniform(0, ceiling)
+        if retry_after is not None:
+            return max(jittered, min(retry_after, self.backoff_max))
+        return jittered
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how often requests are started."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained number of requests per second
+            burst: Number of requests that may start back-to-back
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may start."""
+        while True:
+            wait_time = self._take()
+            if wait_time == 0:
+                return
+            time.sleep(wait_time)
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available, without blocking."""
+        return self._take() == 0
+
+    def _take(self) -> float:
+        """Take a token, or return the seconds until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+
+@dataclass
+class SubmissionResult:
+    """Outcome of submitting one observation."""
+
+    index: int
+    success: bool
+    attempts: int
+    latency: float  # seconds, including retries
+    status_code: int | None = None
+    observation_id: str | int | None = None
+    url: str | None = None
+    error: str | None = None
+
+
+@dataclass
+class SubmissionReport:
+    """Throughput and latency summary of a bulk submission."""
+
+    results: list[SubmissionResult] = field(default_factory=list)
+    elapsed: float = 0.0  # seconds, wall clock
+
+    @property
+    def total(self) -> int:
+        """Number of submitted observations."""
+        return len(self.results)
+
+    @property
+    def succeeded(self) -> int:
+        """Number of observations accepted by the API."""
+        return sum(1 for r in self.results if r.success)
+
+    @property
+    def failed(self) -> int:
+        """Number of observations that could not be submitted."""
+        return self.total - self.succeeded
+
+    @property
+    def retries(self) -> int:
+        """Total number of retried requests."""
+        return sum(r.attempts - 1 for r in self.results)
+
+    @property
+    def throughput(self) -> float:
+        """Submitted observations per second."""
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        Per-observation latency percentile (nearest-rank), in seconds.
+
+        Args:
+            percentile: Percentile between 0 and 100
+        """
+        if not self.results:
+            return 0.0
+        latencies = sorted(r.latency for r in self.results)
+        rank = max(1, math.ceil(percentile / 100 * len(latencies)))
+        return latencies[min(rank, len(latencies)) - 1]
+
+    def summary(self) -> str:
+        """Human-readable summary."""
+        return (
+            f"Submitted {self.total} observations in {self.elapsed:.2f}s "
+            f"({self.throughput:.1f}/s)\n"
+            f"  Succeeded: {self.succeeded}, Failed: {self.failed}, Retries: {self.retries}\n"
+            f"  Latency p50: {self.latency_percentile(50) * 1000:.0f}ms, "
+            f"p95: {self.latency_percentile(95) * 1000:.0f}ms, "
+            f"p99: {self.latency_percentile(99) * 1000:.0f}ms"
+        )
+
+
+class WaarnemingBulkSubmitter:
+    """
+    Submit many prepared observation payloads to Waarneming.nl concurrently.
+
+    Requests share one pooled session sized to the concurrency limit. The API
+    key is sent as a per-request header, so the session itself is never
+    mutated and can safely be used from several worker threads.
+    """
+
+    DEFAULT_API_URL = "https://waarneming.nl/api/v1/observations"
+    DEFAULT_TIMEOUT = (5.0, 30.0)  # (connect, read) seconds
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str = DEFAULT_API_URL,
+        max_concurrency: int = 8,
+        retry_policy: RetryPolicy | None = None,
+        timeout: float | tuple[float, float] = DEFAULT_TIMEOUT,
+    ):
+        """
+        Initialize the submitter.
+
+        Args:
+            api_key: Waarneming.nl API key
+            api_url: Observation endpoint
+            max_concurrency: Maximum number of requests in flight
+            retry_policy: Backoff policy for 429/5xx and connection errors
+            timeout: Request timeout in seconds, or (connect, read) tuple
+        """
+        if not api_key:
+            raise ValueError("An API key is required for Waarneming.nl submissions")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        self.api_url = api_url
+        self.max_concurrency = max_concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeout = timeout
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"}
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {
+                "User-Agent": f"VespaFinder/{__version__} (+{__repository__})",
+                "Accept": "application/json",
+            }
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
+
+    def submit_one(self, payload: dict, index: int = 0) -> SubmissionResult:
+        """
+        Submit a single payload, retrying transient failures.
+
+        Args:
+            payload: Prepared Waarneming.nl observation data
+            index: Position of the payload in its batch (for reporting)
+
+        Returns:
+            SubmissionResult (never raises for HTTP or network errors)
+        """
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            retry_after = None
+            try:
+                response = self.session.post(
+                    self.api_url, json=payload, headers=self._auth_headers, timeout=self.timeout
+                )
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                status_code, error = None, f"{type(e).__name__}: {e}"
+                retryable = True
+            except requests.exceptions.RequestException as e:
+                status_code, error = None, f"{type(e).__name__}: {e}"
+                retryable = False
+            else:
+                status_code = response.status_code
+                if response.ok:
+                    try:
+                        body = response.json()
+                    except ValueError:
+                        body = {}
+                    if not isinstance(body, dict):
+                        body = {}
+                    return SubmissionResult(
+                        index=index,
+                        success=True,
+                        attempts=attempt,
+                        latency=time.perf_counter() - start,
+                        status_code=status_code,
+                        observation_id=body.get("id"),
+                        url=body.get("url"),
+                    )
+                error = f"HTTP {status_code}: {response.text[:200]}"
+                retryable = status_code in self.retry_policy.retry_statuses
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+
+            if not retryable or attempt > self.retry_policy.max_retries:
+                return SubmissionResult(
+                    index=index,
+                    success=False,
+                    attempts=attempt,
+                    latency=time.perf_counter() - start,
+                    status_code=status_code,
+                    error=error,
+                )
+            time.sleep(self.retry_policy.delay(attempt - 1, retry_after))
+
+    def submit_all(self, payloads: Iterable[dict]) -> SubmissionReport:
+        """
+        Submit payloads with bounded concurrency.
+
+        At most ``max_concurrency`` requests are in flight, and payloads are
+        pulled from the iterable lazily, so generators of any size can be
+        streamed through.
+
+        Args:
+            payloads: Prepared Waarneming.nl observation data
+
+        Returns:
+            SubmissionReport with per-observation results ordered by input index
+        """
+        report = SubmissionReport()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="waarneming"
+        ) as executor:
+            for result in self._run_bounded(executor, enumerate(payloads)):
+                report.results.append(result)
+        report.elapsed = time.perf_counter() - start
+        report.results.sort(key=lambda r: r.index)
+        return report
+
+    def _run_bounded(
+        self, executor: ThreadPoolExecutor, items: Iterator[tuple[int, dict]]
+    ) -> Iterator[SubmissionResult]:
+        """Keep at most ``max_concurrency`` submissions in flight."""
+        in_flight: set[Future] = set()
+        for index, payload in items:
+            if len(in_flight) >= self.max_concurrency:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            in_flight.add(executor.submit(self.submit_one, payload, index))
+        for future in in_flight:
+            yield future.result()
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given in seconds."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None  # HTTP-date form is not used by the API
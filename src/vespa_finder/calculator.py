@@ -1,9 +1,14 @@
 """Calculate hive location from hornet observations."""
 
 import math
+from collections.abc import Sequence
 
-from .geo_utils import bearing_between_points, destination_point, haversine_distance
-from .models import HiveLocation, Observation
+import numpy as np
+
+from .circular import mean_longitude
+from .distance_models import DistanceModel, get_distance_model
+from .geodesic import SphericalGeodesic, WGS84Geodesic, get_geodesic
+from .models import HiveLocation, HiveLocationBatch, Observation
 
 
 class HiveCalculator:
@@ -24,6 +29,25 @@ class HiveCalculator:
     # Minimum confidence radius (Vespawatchers note: "nest often slightly further than calculated")
     MIN_CONFIDENCE_RADIUS_METERS = 50.0
 
+    def __init__(
+        self,
+        geodesic: str | SphericalGeodesic | WGS84Geodesic = "spherical",
+        distance_model: str | DistanceModel = "empirical",
+    ):
+        """
+        Initialize the calculator.
+
+        Args:
+            geodesic: Earth model for projections and distances: "spherical" (default,
+                fastest) or "wgs84" (ellipsoidal, for comparison with survey-grade
+                coordinates), or a model instance from ``vespa_finder.geodesic``
+            distance_model: Round-trip to distance conversion used by the "empirical"
+                method: "empirical" (default, 100 m/min), "conditions" (temperature and
+                time-of-day aware), or a ``vespa_finder.distance_models`` instance
+        """
+        self.geodesic = get_geodesic(geodesic)
+        self.distance_model = get_distance_model(distance_model)
+
     def calculate_from_single_observation(
         self, observation: Observation, method: str = "empirical"
     ) -> HiveLocation:
@@ -39,8 +63,8 @@ class HiveCalculator:
         """
         # Calculate distance using selected method
         if method == "empirical":
-            distance = observation.estimated_distance_empirical
-            calc_method = "single_observation_empirical"
+            distance = self.distance_model.distance(observation)
+            calc_method = f"single_observation_{self.distance_model.name}"
         elif method == "theoretical":
             if observation.speed is None:
                 raise ValueError("Speed required for theoretical method")
@@ -49,8 +73,8 @@ class HiveCalculator:
         else:
             raise ValueError(f"Unknown method: {method}. Use 'empirical' or 'theoretical'")
 
-        # Project point along bearing
-        hive_lat, hive_lon = destination_point(
+        # Project point along bearing (spherical origin trig is shared with map arrows/exports)
+        hive_lat, hive_lon = self.geodesic.destination(
             observation.latitude, observation.longitude, observation.bearing, distance
         )
 
@@ -66,6 +90,73 @@ class HiveCalculator:
             calculation_method=calc_method,
         )
 
+    def calculate_batch(
+        self,
+        latitude: np.ndarray,
+        longitude: np.ndarray,
+        bearing: np.ndarray,
+        round_trip_time: np.ndarray,
+        speed: np.ndarray | None = None,
+        method: str = "empirical",
+        timestamp: np.ndarray | None = None,
+        temperature: np.ndarray | None = None,
+    ) -> HiveLocationBatch:
+        """
+        Calculate single-observation hive locations for many observations at once.
+
+        Equivalent to ``calculate_from_single_observation`` for each row, but
+        works on column arrays (e.g. memory-mapped archive slices) without
+        creating per-observation objects.
+
+        Args:
+            latitude: Observer latitudes in degrees
+            longitude: Observer longitudes in degrees
+            bearing: Flight bearings in degrees
+            round_trip_time: Round trip times in seconds
+            speed: Flight speeds in m/s (NaN where unknown); required for "theoretical"
+            method: "empirical" (recommended) or "theoretical"
+            timestamp: Observation times (datetime64), for the distance model
+            temperature: Temperatures in °C (NaN where unknown), for the distance model
+
+        Returns:
+            HiveLocationBatch with one estimate per row
+        """
+        round_trip_time = np.asarray(round_trip_time, dtype=float)
+        if method == "empirical":
+            model = self.distance_model
+            distance = model.distances(round_trip_time, timestamp, temperature)
+            # Timing error combined with the model's own uncertainty (e.g. handling time)
+            time_error = np.hypot(
+                model.timing_errors(self.TIME_UNCERTAINTY, distance.shape, timestamp, temperature),
+                model.uncertainties(round_trip_time, timestamp, temperature),
+            )
+            calc_method = f"single_observation_{model.name}"
+        elif method == "theoretical":
+            speed = None if speed is None else np.asarray(speed, dtype=float)
+            if speed is None or np.isnan(speed).any():
+                raise ValueError("Speed required for theoretical method")
+            distance = speed * round_trip_time / 2.0
+            time_error = speed * self.TIME_UNCERTAINTY / 2
+            calc_method = "single_observation_theoretical"
+        else:
+            raise ValueError(f"Unknown method: {method}. Use 'empirical' or 'theoretical'")
+
+        hive_lat, hive_lon = self.geodesic.direct(latitude, longitude, bearing, distance)
+
+        bearing_error = distance * math.sin(math.radians(self.BEARING_UNCERTAINTY))
+        confidence = np.maximum(
+            self.MIN_CONFIDENCE_RADIUS_METERS, np.sqrt(time_error**2 + bearing_error**2)
+        )
+
+        return HiveLocationBatch(
+            latitude=hive_lat,
+            longitude=hive_lon,
+            confidence_radius=confidence,
+            distance_from_observer=distance,
+            bearing_from_observer=np.asarray(bearing, dtype=float),
+            calculation_method=calc_method,
+        )
+
     def compare_methods(self, observation: Observation) -> dict:
         """
         Compare empirical and theoretical methods.
@@ -99,7 +190,10 @@ class HiveCalculator:
         }
 
     def calculate_from_multiple_observations(
-        self, observations: list[Observation], method: str = "empirical"
+        self,
+        observations: list[Observation],
+        method: str = "empirical",
+        weights: Sequence[float] | None = None,
     ) -> HiveLocation:
         """
         Calculate hive location from multiple observations using triangulation.
@@ -107,6 +201,7 @@ class HiveCalculator:
         Args:
             observations: List of 2+ observations from different locations
             method: "empirical" (recommended) or "theoretical"
+            weights: Optional weight per observation (e.g. ``quality.QualityScores.weight``)
 
         Returns:
             HiveLocation with triangulated coordinates and confidence
@@ -119,16 +214,63 @@ class HiveCalculator:
             self.calculate_from_single_observation(obs, method=method) for obs in observations
         ]
 
-        # Simple average of all estimates (centroid method)
-        avg_lat = sum(est.latitude for est in estimates) / len(estimates)
-        avg_lon = sum(est.longitude for est in estimates) / len(estimates)
+        return self.triangulate_estimates(observations, estimates, method=method, weights=weights)
+
+    def triangulate_estimates(
+        self,
+        observations: list[Observation],
+        estimates: list[HiveLocation],
+        method: str = "empirical",
+        weights: Sequence[float] | None = None,
+    ) -> HiveLocation:
+        """
+        Combine precomputed single-observation estimates by triangulation.
+
+        Callers that cache per-observation estimates (e.g. when the selected
+        subset of a session changes) can use this to avoid recomputing them.
+
+        Args:
+            observations: List of 2+ observations
+            estimates: Single-observation estimate for each observation, in the same order
+            method: Method the estimates were calculated with (used for labelling)
+            weights: Optional weight per observation; the centroid and mean confidence
+                are weighted, and estimates with zero weight are left out
+
+        Returns:
+            HiveLocation with triangulated coordinates and confidence
+        """
+        if len(observations) < 2:
+            raise ValueError("Need at least 2 observations for triangulation")
+        if len(estimates) != len(observations):
+            raise ValueError(
+                f"Expected one estimate per observation, got {len(estimates)} "
+                f"for {len(observations)} observations"
+            )
+        if weights is None:
+            weights = [1.0] * len(estimates)
+        elif len(weights) != len(estimates) or any(w < 0 for w in weights):
+            raise ValueError("Expected one non-negative weight per observation")
+        elif not any(weights):
+            raise ValueError("At least one observation needs a positive weight")
+        total_weight = sum(weights)
+
+        # Weighted average of all estimates (centroid method); longitudes are
+        # averaged circularly so estimates either side of the antimeridian agree
+        avg_lat = sum(w * est.latitude for w, est in zip(weights, estimates, strict=True))
+        avg_lat /= total_weight
+        avg_lon = float(mean_longitude([est.longitude for est in estimates], weights))
 
         # Calculate confidence as standard deviation of estimates
         distances_from_avg = [
-            haversine_distance(avg_lat, avg_lon, est.latitude, est.longitude) for est in estimates
+            self.geodesic.distance_and_bearing(avg_lat, avg_lon, est.latitude, est.longitude)[0]
+            for w, est in zip(weights, estimates, strict=True)
+            if w > 0
         ]
 
-        avg_confidence = sum(est.confidence_radius for est in estimates) / len(estimates)
+        avg_confidence = (
+            sum(w * est.confidence_radius for w, est in zip(weights, estimates, strict=True))
+            / total_weight
+        )
         spread = max(distances_from_avg) if distances_from_avg else 0
 
         # Confidence includes both individual uncertainties and spread between estimates
@@ -136,11 +278,7 @@ class HiveCalculator:
 
         # Calculate distance and bearing from first observation point
         first_obs = observations[0]
-        distance_from_first = haversine_distance(
-            first_obs.latitude, first_obs.longitude, avg_lat, avg_lon
-        )
-
-        bearing_from_first = bearing_between_points(
+        distance_from_first, bearing_from_first = self.geodesic.distance_and_bearing(
             first_obs.latitude, first_obs.longitude, avg_lat, avg_lon
         )
 
@@ -171,8 +309,12 @@ class HiveCalculator:
         """
         if method == "empirical":
             # Empirical method: error from timing uncertainty
-            # ±5 seconds = ±(5/60) minutes = ±(5/60 * 100) meters
-            time_error_meters = (self.TIME_UNCERTAINTY / 60.0) * self.DISTANCE_PER_MINUTE
+            # ±5 seconds = ±(5/60) minutes = ±(5/60 * 100) meters at the standard rate
+            time_error_meters = self.distance_model.timing_error(observation, self.TIME_UNCERTAINTY)
+            # plus the distance model's own uncertainty (e.g. handling time at the nest)
+            time_error_meters = math.hypot(
+                time_error_meters, self.distance_model.uncertainty(observation)
+            )
         else:
             # Theoretical method: error from speed and timing
             if observation.speed is None:
@@ -0,0 +1,237 @@
+"""Time-ordered observation campaigns.
+
+A ``Campaign`` keeps a season's observations sorted by timestamp. Appends
+find their place by bisection (in-order appends, the usual case, are O(1)),
+so nothing is ever re-sorted, and every time query (a window, the last two
+hours, a day) is two bisections plus a slice. Each observation's single
+estimate is calculated once, when it is added, so re-triangulating a window
+only combines cached estimates. Activity counts per time bin are updated on
+append as well, giving nest activity timelines without a pass over the data.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta
+
+from .calculator import HiveCalculator
+from .models import HiveLocation, Observation
+
+DEFAULT_BIN = timedelta(hours=1)
+
+
+class Campaign:
+    """Observations of a campaign, sorted by time, with window queries."""
+
+    def __init__(
+        self,
+        observations: Iterable[Observation] = (),
+        calculator: HiveCalculator | None = None,
+        method: str = "empirical",
+        bin_size: timedelta = DEFAULT_BIN,
+    ):
+        """
+        Initialize the campaign.
+
+        Args:
+            observations: Initial observations (any order)
+            calculator: Calculator for the per-observation estimates
+            method: "empirical" (recommended) or "theoretical"
+            bin_size: Width of the activity timeline bins
+
+        Timestamps must be all naive or all timezone-aware, so they compare.
+        """
+        if bin_size <= timedelta(0):
+            raise ValueError("Bin size must be positive")
+        self.calculator = calculator or HiveCalculator()
+        self.method = method
+        self.bin_size = bin_size
+        self._times: list[datetime] = []
+        self._observations: list[Observation] = []
+        self._estimates: list[HiveLocation] = []
+        self._activity: Counter[int] = Counter()
+        self._mark_activity: dict[str, Counter[int]] = {}
+        self._epoch: datetime | None = None
+        self.extend(observations)
+
+    def __len__(self) -> int:
+        return len(self._observations)
+
+    def __iter__(self) -> Iterator[Observation]:
+        return iter(self._observations)
+
+    @property
+    def start(self) -> datetime | None:
+        """Timestamp of the earliest observation."""
+        return self._times[0] if self._times else None
+
+    @property
+    def end(self) -> datetime | None:
+        """Timestamp of the latest observation."""
+        return self._times[-1] if self._times else None
+
+    def add(self, observation: Observation) -> int:
+        """
+        Add one observation in time order.
+
+        Observations with equal timestamps keep their arrival order.
+
+        Returns:
+            Position of the observation in the campaign
+        """
+        timestamp = observation.timestamp
+        if timestamp is None:
+            raise ValueError("Campaign observations need a timestamp")
+        estimate = self.calculator.calculate_from_single_observation(observation, self.method)
+
+        times = self._times
+        if not times or timestamp >= times[-1]:
+            position = len(times)
+            times.append(timestamp)
+            self._observations.append(observation)
+            self._estimates.append(estimate)
+        else:
+            position = bisect_right(times, timestamp)
+            times.insert(position, timestamp)
+            self._observations.insert(position, observation)
+            self._estimates.insert(position, estimate)
+
+        if self._epoch is None:
+            # Bins are aligned to midnight of the first observation's day
+            self._epoch = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+        index = self._bin(timestamp)
+        self._activity[index] += 1
+        if observation.hornet_color_mark:
+            self._mark_activity.setdefault(observation.hornet_color_mark, Counter())[index] += 1
+        return position
+
+    def extend(self, observations: Iterable[Observation]) -> int:
+        """Add many observations; returns how many were added."""
+        count = 0
+        for observation in observations:
+            self.add(observation)
+            count += 1
+        return count
+
+    def _bin(self, timestamp: datetime) -> int:
+        return (timestamp - self._epoch) // self.bin_size
+
+    def _range(self, start: datetime | None, end: datetime | None) -> tuple[int, int]:
+        low = 0 if start is None else bisect_left(self._times, start)
+        high = len(self._times) if end is None else bisect_left(self._times, end)
+        return low, max(low, high)
+
+    def window(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> list[Observation]:
+        """Observations with ``start <= timestamp < end`` (open-ended when None)."""
+        low, high = self._range(start, end)
+        return self._observations[low:high]
+
+    def last(self, duration: timedelta, now: datetime | None = None) -> list[Observation]:
+        """Observations in the ``duration`` up to and including ``now`` (default: latest)."""
+        now = self.end if now is None else now
+        if now is None:
+            return []
+        high = bisect_right(self._times, now)
+        return self._observations[bisect_left(self._times, now - duration) : high]
+
+    def days(self) -> list[date]:
+        """Calendar days with observations, in order."""
+        days: list[date] = []
+        times, position = self._times, 0
+        while position < len(times):
+            day = times[position].date()
+            days.append(day)
+            # Jump to the first observation after this day
+            position = bisect_left(times, self._midnight(day) + timedelta(days=1), position)
+        return days
+
+    def day(self, day: date) -> list[Observation]:
+        """Observations on one calendar day."""
+        start = self._midnight(day)
+        return self.window(start, start + timedelta(days=1))
+
+    def _midnight(self, day: date) -> datetime:
+        tzinfo = self._times[0].tzinfo if self._times else None
+        return datetime.combine(day, datetime.min.time(), tzinfo=tzinfo)
+
+    def triangulate(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> HiveLocation | None:
+        """
+        Hive estimate from the observations in a window.
+
+        Uses the estimates cached when the observations were added: one
+        observation gives its single estimate, two or more are triangulated.
+
+        Returns:
+            HiveLocation, or None for an empty window
+        """
+        low, high = self._range(start, end)
+        if high - low == 0:
+            return None
+        if high - low == 1:
+            return self._estimates[low]
+        return self.calculator.triangulate_estimates(
+            self._observations[low:high], self._estimates[low:high], method=self.method
+        )
+
+    def rolling(
+        self,
+        window: timedelta,
+        step: timedelta | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[tuple[datetime, HiveLocation | None]]:
+        """
+        Re-triangulate over a sliding window.
+
+        Args:
+            window: Window length
+            step: Distance between window ends (default: ``window``, i.e. no overlap)
+            start: End of the first window (default: first observation + ``window``)
+            end: Last window end (default: just past the latest observation)
+
+        Returns:
+            [(window end, estimate or None), ...]; each window is ``[end - window, end)``
+        """
+        if not self._times:
+            return []
+        step = window if step is None else step
+        if window <= timedelta(0) or step <= timedelta(0):
+            raise ValueError("Window and step must be positive")
+        current = self.start + window if start is None else start
+        last = self.end + timedelta(microseconds=1) if end is None else end
+        results = []
+        while True:
+            window_end = min(current, last)
+            results.append((window_end, self.triangulate(window_end - window, window_end)))
+            if current >= last:
+                return results
+            current += step
+
+    def timeline(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        mark: str | None = None,
+    ) -> list[tuple[datetime, int]]:
+        """
+        Activity per time bin: number of observations (visits) in each bin.
+
+        Args:
+            start, end: Range to cover (default: the campaign's first to last bin)
+            mark: Only count this color mark (default: all observations)
+
+        Returns:
+            [(bin start, count), ...] for consecutive bins, including empty ones
+        """
+        if not self._times:
+            return []
+        first = self._bin(self.start if start is None else start)
+        last = self._bin(self.end) if end is None else self._bin(end - timedelta(microseconds=1))
+        counts = self._activity if mark is None else self._mark_activity.get(mark, Counter())
+        return [
+            (self._epoch + index * self.bin_size, counts[index]) for index in range(first, last + 1)
+        ]
@@ -0,0 +1,118 @@
+"""Circular statistics for bearings (and other angles in degrees).
+
+Arithmetic means of angles are wrong across the 0°/360° seam (the mean of
+350° and 10° is 0°, not 180°). These functions work on unit vectors instead.
+All are vectorized: they take scalars or arrays, reduce along ``axis`` where
+applicable, and evaluate a whole batch in a single NumPy pass.
+"""
+
+import numpy as np
+
+
+def _components(angles, weights=None, axis=None):
+    """Summed sine and cosine components and total weight."""
+    radians = np.radians(np.asarray(angles, dtype=float))
+    if weights is None:
+        return (
+            np.sin(radians).sum(axis=axis),
+            np.cos(radians).sum(axis=axis),
+            np.ones_like(radians).sum(axis=axis),
+        )
+    weights = np.asarray(weights, dtype=float)
+    return (
+        (weights * np.sin(radians)).sum(axis=axis),
+        (weights * np.cos(radians)).sum(axis=axis),
+        np.broadcast_to(weights, radians.shape).sum(axis=axis),
+    )
+
+
+def circular_mean(angles, weights=None, axis=None):
+    """
+    Mean direction in degrees, in [0, 360).
+
+    Args:
+        angles: Angles in degrees
+        weights: Optional weights (same shape as ``angles``)
+        axis: Axis to reduce (default: all)
+
+    Returns:
+        Mean direction; NaN where the resultant is zero (no preferred direction)
+    """
+    sin_sum, cos_sum, total = _components(angles, weights, axis)
+    mean = resultant_direction(sin_sum, cos_sum)
+    return np.where(np.hypot(sin_sum, cos_sum) > 1e-12 * total, mean, np.nan)[()]
+
+
+def resultant_direction(sin_sum, cos_sum):
+    """
+    Direction in degrees, in [0, 360), of summed unit-vector components.
+
+    Lets streaming code keep running sine/cosine sums and read the mean off
+    them at any time.
+    """
+    direction = np.degrees(np.arctan2(sin_sum, cos_sum)) % 360
+    return np.where(direction >= 360, 0.0, direction)[()]  # tiny negatives wrap to 360.0
+
+
+def resultant_length(angles, weights=None, axis=None):
+    """Mean resultant length in [0, 1]: 1 when all angles agree, 0 for no preferred direction."""
+    sin_sum, cos_sum, total = _components(angles, weights, axis)
+    return np.hypot(sin_sum, cos_sum) / total
+
+
+def circular_variance(angles, weights=None, axis=None):
+    """Circular variance ``1 - R`` in [0, 1]."""
+    return 1 - resultant_length(angles, weights, axis)
+
+
+def circular_std(angles, weights=None, axis=None):
+    """Circular standard deviation ``sqrt(-2 ln R)`` in degrees."""
+    length = np.clip(resultant_length(angles, weights, axis), 1e-300, 1.0)
+    return np.degrees(np.sqrt(-2 * np.log(length)))
+
+
+def von_mises_kappa(resultant, count=None):
+    """
+    Von Mises concentration estimate from the mean resultant length.
+
+    Uses the Best & Fisher (1981) approximation of the maximum-likelihood
+    estimate, with their small-sample bias correction when ``count`` < 15.
+
+    Args:
+        resultant: Mean resultant length(s) in [0, 1]
+        count: Sample size(s), for the small-sample correction
+
+    Returns:
+        Concentration kappa (inf for R = 1)
+    """
+    r = np.asarray(resultant, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kappa = np.select(
+            [r < 0.53, r < 0.85, r < 1],
+            [
+                2 * r + r**3 + 5 * r**5 / 6,
+                -0.4 + 1.39 * r + 0.43 / (1 - r),
+                1 / (r**3 - 4 * r**2 + 3 * r),
+            ],
+            default=np.inf,
+        )
+        if count is not None:
+            n = np.asarray(count, dtype=float)
+            small = (n < 15) & np.isfinite(kappa)
+            corrected = np.where(
+                kappa < 2,
+                np.maximum(kappa - 2 / (n * kappa), 0.0),
+                (n - 1) ** 3 * kappa / (n**3 + n),
+            )
+            kappa = np.where(small, np.where(kappa > 0, corrected, 0.0), kappa)
+    return kappa[()]
+
+
+def wrapped_difference(a, b):
+    """Signed angle from ``b`` to ``a`` in degrees, in [-180, 180)."""
+    return (np.asarray(a, dtype=float) - np.asarray(b, dtype=float) + 180) % 360 - 180
+
+
+def mean_longitude(longitudes, weights=None, axis=None):
+    """Mean longitude in [-180, 180), correct across the antimeridian."""
+    return (circular_mean(longitudes, weights, axis) + 180) % 360 - 180
@@ -0,0 +1,183 @@
+"""Drop repeated observations at ingest.
+
+Volunteers often submit the same observation twice through different channels
+(app, web form, spreadsheet), which double-weights it in triangulation. Two
+observations are duplicates when they are within tolerances in position,
+time, bearing and round-trip time and do not carry different color marks.
+
+``Deduplicator`` streams: each observation is hashed into a spatial grid cell
+and compared only with recent observations in the cells within
+``distance_tolerance`` of it. Cells are ``distance_tolerance`` high and a
+fixed number of degrees wide, sized at the first observation's latitude, so
+the grid does not shear with longitude; poleward of that latitude more
+columns are probed. Observations older than the sliding time window are
+evicted, so a stream is deduplicated in O(n) time with memory bounded by the
+observations inside the window::
+
+    deduplicator = Deduplicator(time_tolerance=120)
+    archive.append(deduplicator.filter(incoming))
+    for duplicate, original in deduplicator.merged:
+        ...
+"""
+
+import math
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+from .geo_utils import EARTH_RADIUS_METERS
+from .models import Observation
+
+DEFAULT_DISTANCE_TOLERANCE = 15.0  # meters
+DEFAULT_TIME_TOLERANCE = 300.0  # seconds
+DEFAULT_BEARING_TOLERANCE = 5.0  # degrees
+DEFAULT_ROUND_TRIP_TOLERANCE = 10.0  # seconds
+
+_METERS_PER_DEGREE = math.radians(EARTH_RADIUS_METERS)
+_MIN_COS_LATITUDE = math.cos(math.radians(89.9))  # keeps cell widths finite at the poles
+
+
+class Deduplicator:
+    """Streaming duplicate filter over a sliding time window."""
+
+    def __init__(
+        self,
+        distance_tolerance: float = DEFAULT_DISTANCE_TOLERANCE,
+        time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+        bearing_tolerance: float = DEFAULT_BEARING_TOLERANCE,
+        round_trip_tolerance: float = DEFAULT_ROUND_TRIP_TOLERANCE,
+        window: float | None = None,
+    ):
+        """
+        Initialize the filter.
+
+        Args:
+            distance_tolerance: Maximum distance between duplicates in meters
+            time_tolerance: Maximum time between duplicates in seconds
+            bearing_tolerance: Maximum bearing difference in degrees
+            round_trip_tolerance: Maximum round-trip time difference in seconds
+            window: Seconds an observation is remembered, measured from the newest
+                timestamp seen (default: ``time_tolerance``; raise it to catch
+                duplicates in streams that arrive out of time order)
+        """
+        if distance_tolerance <= 0 or time_tolerance < 0:
+            raise ValueError("Tolerances must be positive")
+        self.distance_tolerance = distance_tolerance
+        self.time_tolerance = time_tolerance
+        self.bearing_tolerance = bearing_tolerance
+        self.round_trip_tolerance = round_trip_tolerance
+        self.window = time_tolerance if window is None else max(window, time_tolerance)
+        self.merged: list[tuple[int, int]] = []  # (duplicate index, kept index)
+        self.seen = 0
+        self._cells: dict[tuple[int, int], deque[tuple[int, Observation]]] = {}
+        self._recent: deque[tuple[Observation, tuple[int, int]]] = deque()
+        self._newest = None
+        self._cell_width: float | None = None  # degrees of longitude, set on first use
+
+    @property
+    def kept(self) -> int:
+        """Number of observations passed through so far."""
+        return self.seen - len(self.merged)
+
+    @property
+    def remembered(self) -> int:
+        """Number of observations currently held in the window."""
+        return len(self._recent)
+
+    def _longitude_reach(self, latitude: float) -> float:
+        """Degrees of longitude spanned by ``distance_tolerance`` at a latitude."""
+        cos_latitude = max(math.cos(math.radians(latitude)), _MIN_COS_LATITUDE)
+        return self.distance_tolerance / (_METERS_PER_DEGREE * cos_latitude)
+
+    def _cell(self, observation: Observation) -> tuple[int, int]:
+        if self._cell_width is None:
+            self._cell_width = self._longitude_reach(observation.latitude)
+        return (
+            math.floor(observation.latitude * _METERS_PER_DEGREE / self.distance_tolerance),
+            math.floor(observation.longitude / self._cell_width),
+        )
+
+    def _evict(self) -> None:
+        horizon = self._newest.timestamp() - self.window
+        recent = self._recent
+        while recent and recent[0][0].timestamp.timestamp() < horizon:
+            _observation, cell = recent.popleft()
+            entries = self._cells[cell]
+            entries.popleft()  # arrival order is the same in the cell and the window
+            if not entries:
+                del self._cells[cell]
+
+    def is_duplicate(self, observation: Observation, other: Observation) -> bool:
+        """Whether two observations are within all tolerances of each other."""
+        if (
+            observation.hornet_color_mark
+            and other.hornet_color_mark
+            and observation.hornet_color_mark != other.hornet_color_mark
+        ):
+            return False
+        if abs((observation.timestamp - other.timestamp).total_seconds()) > self.time_tolerance:
+            return False
+        if abs(observation.round_trip_time - other.round_trip_time) > self.round_trip_tolerance:
+            return False
+        if abs((observation.bearing - other.bearing + 180) % 360 - 180) > self.bearing_tolerance:
+            return False
+        north = (observation.latitude - other.latitude) * _METERS_PER_DEGREE
+        east = (
+            (observation.longitude - other.longitude)
+            * _METERS_PER_DEGREE
+            * math.cos(math.radians(observation.latitude))
+        )
+        return math.hypot(north, east) <= self.distance_tolerance
+
+    def add(self, observation: Observation) -> int | None:
+        """
+        Check one observation against the window and remember it if it is new.
+
+        Returns:
+            Stream index of the kept observation it duplicates, or None if it is new
+        """
+        index = self.seen
+        self.seen += 1
+        if self._newest is None or observation.timestamp > self._newest:
+            self._newest = observation.timestamp
+            self._evict()
+
+        row, _col = cell = self._cell(observation)
+        reach = self._longitude_reach(observation.latitude)
+        columns = range(
+            math.floor((observation.longitude - reach) / self._cell_width),
+            math.floor((observation.longitude + reach) / self._cell_width) + 1,
+        )
+        for neighbour in ((r, c) for r in (row - 1, row, row + 1) for c in columns):
+            for kept_index, kept in self._cells.get(neighbour, ()):
+                if self.is_duplicate(observation, kept):
+                    self.merged.append((index, kept_index))
+                    return kept_index
+
+        self._cells.setdefault(cell, deque()).append((index, observation))
+        self._recent.append((observation, cell))
+        return None
+
+    def filter(self, observations: Iterable[Observation]) -> Iterator[Observation]:
+        """Yield the observations of a stream that are not duplicates."""
+        for observation in observations:
+            if self.add(observation) is None:
+                yield observation
+
+
+def deduplicate(
+    observations: Iterable[Observation], **tolerances
+) -> tuple[list[Observation], list[tuple[int, int]]]:
+    """
+    Remove duplicate observations.
+
+    Args:
+        observations: Observations, ideally roughly in time order
+        **tolerances: Passed to ``Deduplicator``
+
+    Returns:
+        (kept observations, [(duplicate index, kept index), ...]) with indices
+        into the input sequence
+    """
+    deduplicator = Deduplicator(**tolerances)
+    kept = list(deduplicator.filter(observations))
+    return kept, deduplicator.merged
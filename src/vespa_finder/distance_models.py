@@ -0,0 +1,416 @@
+"""Round-trip time to distance conversion models.
+
+``EmpiricalDistanceModel`` is the Vespawatchers standard (100 m per minute of
+round trip) and the calculator's default.
+
+``ConditionsDistanceModel`` scales that rate by air temperature and time of
+day, since foragers fly slower in the cold and early or late in the day. Its
+factors are piecewise linear between knots, either the provisional defaults
+below or fitted to sessions with known nest distances via
+``ConditionsDistanceModel.fit``; they are tabulated once, so evaluating an
+observation is a table lookup and batches are a single vectorized gather.
+
+``HandlingTimeDistanceModel`` subtracts the time spent at the nest from the
+round trip and reports the spread of that handling time as uncertainty; its
+parameters can be calibrated from confirmed nests with
+``HandlingTimeDistanceModel.calibrate``.
+
+Select a model per ``HiveCalculator`` with
+``HiveCalculator(distance_model="conditions")``.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+import numpy as np
+
+from .models import Observation
+
+EMPIRICAL_DISTANCE_PER_MINUTE = 100.0  # meters per minute round trip (Vespawatchers)
+
+# Provisional factors relative to the empirical rate; refit with local data
+DEFAULT_TEMPERATURE_FACTORS = ((10.0, 0.7), (15.0, 0.85), (20.0, 1.0), (28.0, 1.1), (35.0, 1.0))
+DEFAULT_HOUR_FACTORS = ((6.0, 0.85), (10.0, 1.0), (16.0, 1.0), (20.0, 0.85))
+
+
+class DistanceModel(ABC):
+    """
+    Base class for distance models.
+
+    Subclasses implement ``rates``: meters of one-way distance per second of
+    round trip, given optional timestamps and temperatures.
+    """
+
+    name = "custom"
+
+    @abstractmethod
+    def rates(
+        self, timestamp: np.ndarray | None = None, temperature: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Rates (m per second of round trip) for arrays of conditions."""
+
+    def rate(self, timestamp: datetime | None = None, temperature: float | None = None) -> float:
+        """Rate for one set of conditions."""
+        rates = self.rates(
+            None if timestamp is None else wall_clock_times([timestamp]),
+            None if temperature is None else np.array([temperature], dtype=float),
+        )
+        return float(np.broadcast_to(rates, (1,))[0])
+
+    def distance(self, observation: Observation) -> float:
+        """One-way distance in meters for an observation."""
+        return observation.round_trip_time * self.rate(
+            observation.timestamp, observation.temperature
+        )
+
+    def distances(
+        self,
+        round_trip_time: np.ndarray,
+        timestamp: np.ndarray | None = None,
+        temperature: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """One-way distances in meters for arrays of observations."""
+        round_trip_time = np.asarray(round_trip_time, dtype=float)
+        return round_trip_time * np.broadcast_to(
+            self.rates(timestamp, temperature), round_trip_time.shape
+        )
+
+    def timing_error(self, observation: Observation, seconds: float) -> float:
+        """Distance error in meters caused by a round-trip timing error."""
+        return seconds * self.rate(observation.timestamp, observation.temperature)
+
+    def timing_errors(
+        self,
+        seconds: float,
+        shape: tuple[int, ...],
+        timestamp: np.ndarray | None = None,
+        temperature: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Distance errors in meters for arrays of observations."""
+        return seconds * np.broadcast_to(self.rates(timestamp, temperature), shape)
+
+    def uncertainty(self, observation: Observation) -> float:  # noqa: ARG002
+        """Standard deviation (meters) of the model's own distance error; none by default."""
+        return 0.0
+
+    def uncertainties(
+        self,
+        round_trip_time: np.ndarray,
+        timestamp: np.ndarray | None = None,  # noqa: ARG002
+        temperature: np.ndarray | None = None,  # noqa: ARG002
+    ) -> np.ndarray:
+        """Model uncertainties in meters for arrays of observations."""
+        return np.zeros(np.shape(round_trip_time))
+
+
+class EmpiricalDistanceModel(DistanceModel):
+    """Fixed 100 m per minute of round trip, independent of conditions."""
+
+    name = "empirical"
+
+    def rates(self, timestamp=None, temperature=None) -> np.ndarray:  # noqa: ARG002
+        return np.array(EMPIRICAL_DISTANCE_PER_MINUTE / 60.0)
+
+    def distance(self, observation: Observation) -> float:
+        return observation.estimated_distance_empirical
+
+    def distances(self, round_trip_time, timestamp=None, temperature=None) -> np.ndarray:  # noqa: ARG002
+        return np.asarray(round_trip_time, dtype=float) / 60.0 * EMPIRICAL_DISTANCE_PER_MINUTE
+
+    def timing_error(self, observation: Observation, seconds: float) -> float:  # noqa: ARG002
+        return (seconds / 60.0) * EMPIRICAL_DISTANCE_PER_MINUTE
+
+    def timing_errors(self, seconds, shape, timestamp=None, temperature=None) -> np.ndarray:  # noqa: ARG002
+        return np.full(shape, seconds / 60.0 * EMPIRICAL_DISTANCE_PER_MINUTE)
+
+
+class ConditionsDistanceModel(DistanceModel):
+    """
+    Empirical rate scaled by temperature and time-of-day factors.
+
+    ``rate = base_rate * temperature_factor(T) * hour_factor(h)``, each factor
+    interpolated linearly between (value, factor) knots and held constant
+    beyond the outer knots. Unknown temperature or time uses factor 1.
+    Factors are tabulated per ``temperature_step`` degrees and
+    ``minutes_step`` minutes of the day.
+    """
+
+    name = "conditions"
+
+    MIN_TEMPERATURE = -10.0
+    MAX_TEMPERATURE = 45.0
+
+    def __init__(
+        self,
+        temperature_factors: Sequence[tuple[float, float]] = DEFAULT_TEMPERATURE_FACTORS,
+        hour_factors: Sequence[tuple[float, float]] = DEFAULT_HOUR_FACTORS,
+        base_rate: float = EMPIRICAL_DISTANCE_PER_MINUTE / 60.0,
+        temperature_step: float = 0.5,
+        minutes_step: int = 15,
+    ):
+        """
+        Initialize the model and build its lookup table.
+
+        Args:
+            temperature_factors: (°C, factor) knots, ascending
+            hour_factors: (hour of day, factor) knots, ascending
+            base_rate: Meters of one-way distance per second of round trip
+            temperature_step: Temperature resolution of the table (°C)
+            minutes_step: Time-of-day resolution of the table (minutes)
+        """
+        self.temperature_factors = tuple(temperature_factors)
+        self.hour_factors = tuple(hour_factors)
+        self.base_rate = base_rate
+        self.temperature_step = temperature_step
+        self.minutes_step = minutes_step
+
+        temperatures = np.arange(
+            self.MIN_TEMPERATURE, self.MAX_TEMPERATURE + temperature_step / 2, temperature_step
+        )
+        hours = (np.arange(0, 24 * 60, minutes_step) + minutes_step / 2) / 60
+        temperature_factor = np.append(_interpolate(self.temperature_factors, temperatures), 1.0)
+        hour_factor = np.append(_interpolate(self.hour_factors, hours), 1.0)
+        # Last row/column: unknown temperature/time
+        self._table = base_rate * temperature_factor[:, None] * hour_factor[None, :]
+        self._rows = self._table.tolist()
+
+    def _temperature_index(self, temperature: float | None) -> int:
+        if temperature is None or temperature != temperature:  # None or NaN
+            return -1
+        clipped = min(max(temperature, self.MIN_TEMPERATURE), self.MAX_TEMPERATURE)
+        return round((clipped - self.MIN_TEMPERATURE) / self.temperature_step)
+
+    def rate(self, timestamp: datetime | None = None, temperature: float | None = None) -> float:
+        """Rate for one set of conditions (constant-time table lookup)."""
+        slot = (
+            -1
+            if timestamp is None
+            else (timestamp.hour * 60 + timestamp.minute) // self.minutes_step
+        )
+        return self._rows[self._temperature_index(temperature)][slot]
+
+    def rates(self, timestamp=None, temperature=None) -> np.ndarray:
+        """Rates for arrays of conditions (NaN temperature / NaT time = unknown)."""
+        if temperature is None:
+            rows = np.array(-1)
+        else:
+            temperature = np.asarray(temperature, dtype=float)
+            known = ~np.isnan(temperature)
+            clipped = np.clip(
+                np.where(known, temperature, self.MIN_TEMPERATURE),
+                self.MIN_TEMPERATURE,
+                self.MAX_TEMPERATURE,
+            )
+            rows = np.rint((clipped - self.MIN_TEMPERATURE) / self.temperature_step).astype(int)
+            rows = np.where(known, rows, -1)
+        if timestamp is None:
+            columns = np.array(-1)
+        else:
+            timestamp = np.asarray(timestamp, dtype="M8[us]")
+            minutes = (timestamp - timestamp.astype("M8[D]")).astype("m8[m]").astype(np.int64)
+            columns = np.where(np.isnat(timestamp), -1, minutes // self.minutes_step)
+        return self._table[rows, columns]
+
+    @classmethod
+    def fit(
+        cls,
+        round_trip_time: np.ndarray,
+        distance: np.ndarray,
+        timestamp: np.ndarray | None = None,
+        temperature: np.ndarray | None = None,
+        temperature_knots: Sequence[float] = (10.0, 15.0, 20.0, 25.0, 30.0, 35.0),
+        hour_knots: Sequence[float] = (7.0, 10.0, 13.0, 16.0, 19.0),
+        **options,
+    ) -> "ConditionsDistanceModel":
+        """
+        Fit factors to observations with known one-way nest distances.
+
+        Uses robust marginal estimates: the base rate is the median of
+        ``distance / round_trip_time``; each knot's factor is the median ratio
+        of the observations nearest that knot, relative to the base rate.
+        Knots without observations get factor 1.
+
+        Args:
+            round_trip_time: Round trip times in seconds
+            distance: Known one-way distances in meters
+            timestamp: Observation times (datetime64 or datetimes), optional
+            temperature: Temperatures in °C (NaN where unknown), optional
+            temperature_knots: Temperatures at which to estimate factors
+            hour_knots: Hours of day at which to estimate factors
+            **options: Passed to the constructor
+
+        Returns:
+            Fitted model
+        """
+        ratio = np.asarray(distance, dtype=float) / np.asarray(round_trip_time, dtype=float)
+        if ratio.size == 0:
+            raise ValueError("Need at least one observation to fit")
+        base_rate = float(np.median(ratio))
+
+        temperature_factors = ((20.0, 1.0),)
+        if temperature is not None:
+            temperature = np.asarray(temperature, dtype=float)
+            known = ~np.isnan(temperature)
+            temperature_factors = _fit_knots(
+                temperature[known], ratio[known] / base_rate, temperature_knots
+            )
+
+        hour_factors = ((12.0, 1.0),)
+        if timestamp is not None:
+            timestamp = np.asarray(timestamp, dtype="M8[us]")
+            known = ~np.isnat(timestamp)
+            hours = (timestamp[known] - timestamp[known].astype("M8[D]")) / np.timedelta64(1, "h")
+            hour_factors = _fit_knots(hours, ratio[known] / base_rate, hour_knots)
+
+        return cls(temperature_factors, hour_factors, base_rate=base_rate, **options)
+
+
+class HandlingTimeDistanceModel(DistanceModel):
+    """
+    Flight time is the round trip minus the time spent at the nest.
+
+    The linear rule converts the whole round trip, so short flights, where
+    handling time is a large share, come out too far. Here handling time is
+    treated as a random variable with mean ``handling_time`` and standard
+    deviation ``handling_std`` (seconds): it is subtracted from the round
+    trip, and its spread is reported as distance uncertainty, which the
+    calculator adds to the confidence radius. Flight time is never taken
+    below ``min_flight_time``.
+
+    The defaults agree with the 100 m/min rule at a 5-minute round trip. Fit
+    your own with ``HandlingTimeDistanceModel.calibrate`` from confirmed nests.
+    """
+
+    name = "handling"
+
+    def __init__(
+        self,
+        flight_rate: float = 500.0 / (300.0 - 60.0),
+        handling_time: float = 60.0,
+        handling_std: float = 30.0,
+        min_flight_time: float = 10.0,
+    ):
+        """
+        Initialize the model.
+
+        Args:
+            flight_rate: Meters of one-way distance per second of flight (round trip)
+            handling_time: Mean time spent at the nest per round trip (seconds)
+            handling_std: Standard deviation of the handling time (seconds)
+            min_flight_time: Lower bound on the corrected flight time (seconds)
+        """
+        self.flight_rate = flight_rate
+        self.handling_time = handling_time
+        self.handling_std = handling_std
+        self.min_flight_time = min_flight_time
+
+    def rates(self, timestamp=None, temperature=None) -> np.ndarray:  # noqa: ARG002
+        return np.array(self.flight_rate)
+
+    def distance(self, observation: Observation) -> float:
+        flight_time = max(observation.round_trip_time - self.handling_time, self.min_flight_time)
+        return flight_time * self.flight_rate
+
+    def distances(self, round_trip_time, timestamp=None, temperature=None) -> np.ndarray:  # noqa: ARG002
+        flight_time = np.maximum(
+            np.asarray(round_trip_time, dtype=float) - self.handling_time, self.min_flight_time
+        )
+        return flight_time * self.flight_rate
+
+    def uncertainty(self, observation: Observation) -> float:
+        # Handling time cannot exceed the round trip, which caps the spread of short trips
+        spread = min(
+            self.handling_std, max(observation.round_trip_time - self.min_flight_time, 0.0)
+        )
+        return spread * self.flight_rate
+
+    def uncertainties(self, round_trip_time, timestamp=None, temperature=None) -> np.ndarray:  # noqa: ARG002
+        headroom = np.maximum(np.asarray(round_trip_time, dtype=float) - self.min_flight_time, 0.0)
+        return np.minimum(self.handling_std, headroom) * self.flight_rate
+
+    @classmethod
+    def calibrate(
+        cls, round_trip_time: np.ndarray, distance: np.ndarray, **options
+    ) -> "HandlingTimeDistanceModel":
+        """
+        Calibrate from round trips to confirmed nests at known one-way distances.
+
+        Fits ``distance = flight_rate * (round_trip_time - handling_time)`` by
+        least squares; the residual spread, converted to seconds, is the
+        handling-time standard deviation.
+
+        Args:
+            round_trip_time: Round trip times in seconds
+            distance: Confirmed one-way nest distances in meters
+            **options: Passed to the constructor (e.g. ``min_flight_time``)
+
+        Raises:
+            ValueError: With fewer than three observations or no distance trend
+        """
+        round_trip_time = np.asarray(round_trip_time, dtype=float)
+        distance = np.asarray(distance, dtype=float)
+        if round_trip_time.size < 3:
+            raise ValueError("Need at least 3 confirmed observations to calibrate")
+        slope, intercept = np.polyfit(round_trip_time, distance, 1)
+        if slope <= 0:
+            raise ValueError("Distances do not increase with round trip time")
+        residuals = distance - (slope * round_trip_time + intercept)
+        handling_std = float(np.std(residuals, ddof=2)) / slope
+        return cls(
+            flight_rate=float(slope),
+            handling_time=float(-intercept / slope),
+            handling_std=handling_std,
+            **options,
+        )
+
+
+def wall_clock_times(timestamps: Iterable[datetime | None]) -> np.ndarray:
+    """
+    Timestamps as a datetime64[us] column of recorded clock times.
+
+    Time-of-day effects depend on the local clock, so time zones are dropped
+    rather than converted to UTC; None becomes NaT.
+    """
+    return np.array(
+        [None if t is None else t.replace(tzinfo=None) for t in timestamps], dtype="M8[us]"
+    )
+
+
+def _interpolate(knots: Sequence[tuple[float, float]], values: np.ndarray) -> np.ndarray:
+    positions, factors = zip(*knots, strict=True)
+    return np.interp(values, positions, factors)
+
+
+def _fit_knots(values, relative, knots) -> tuple[tuple[float, float], ...]:
+    """Median of ``relative`` among the values nearest each knot."""
+    knots = np.asarray(knots, dtype=float)
+    nearest = np.abs(values[:, None] - knots[None, :]).argmin(axis=1)
+    return tuple(
+        (float(knot), float(np.median(relative[nearest == i])) if np.any(nearest == i) else 1.0)
+        for i, knot in enumerate(knots)
+    )
+
+
+DISTANCE_MODELS = {
+    "empirical": EmpiricalDistanceModel,
+    "conditions": ConditionsDistanceModel,
+    "handling": HandlingTimeDistanceModel,
+}
+
+
+def get_distance_model(model: str | DistanceModel) -> DistanceModel:
+    """
+    Resolve a distance model by name ("empirical", "conditions" or "handling") or pass an instance through.
+
+    Raises:
+        ValueError: For unknown model names
+    """
+    if not isinstance(model, str):
+        return model
+    try:
+        return DISTANCE_MODELS[model]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown distance model: {model}. Use one of {', '.join(DISTANCE_MODELS)}"
+        ) from None
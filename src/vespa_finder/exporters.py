@@ -0,0 +1,362 @@
+"""Streaming GeoJSON, KML and GPX export of observations and hive locations.
+
+Each exporter consumes its inputs lazily and writes one feature at a time to
+an open text file handle, so memory use does not depend on the number of
+features and output can be piped straight into GIS tools (e.g. ``ogr2ogr``).
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from datetime import UTC
+from typing import TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+
+from .__version__ import __version__
+from .density import DensityGrid
+from .geo_utils import GeoOrigin, destination_point
+from .models import HiveLocation, Observation
+
+COORDINATE_PRECISION = 7  # decimal degrees, ~1 cm
+CIRCLE_SEGMENTS = 32  # vertices of confidence circles
+
+
+def _round(value: float) -> float:
+    return round(value, COORDINATE_PRECISION)
+
+
+def _timestamp(observation: Observation | HiveLocation) -> str | None:
+    return observation.timestamp.isoformat() if observation.timestamp else None
+
+
+def _utc_timestamp(observation: Observation) -> str | None:
+    # GPX times are UTC; a naive local time cannot be placed without guessing its zone
+    timestamp = observation.timestamp
+    if timestamp is None or timestamp.tzinfo is None:
+        return None
+    return timestamp.astimezone(UTC).replace(tzinfo=None).isoformat() + "Z"
+
+
+def _ray_end(observation: Observation) -> tuple[float, float]:
+    """End point of an observation's bearing ray at its estimated distance."""
+    return destination_point(
+        observation.latitude,
+        observation.longitude,
+        observation.bearing,
+        observation.estimated_distance,
+    )
+
+
+def confidence_ring(
+    hive: HiveLocation, segments: int = CIRCLE_SEGMENTS
+) -> list[tuple[float, float]]:
+    """
+    Closed ring of (lat, lon) vertices approximating a hive's confidence circle.
+
+    Args:
+        hive: Hive location with a confidence radius
+        segments: Number of distinct vertices
+
+    Returns:
+        ``segments + 1`` points; the last repeats the first
+    """
+    bearings = np.linspace(0.0, 360.0, segments, endpoint=False)
+    # Uncached origin: streaming exports would otherwise flush the shared origin cache
+    lats, lons = GeoOrigin(hive.latitude, hive.longitude).destinations(
+        bearings, hive.confidence_radius
+    )
+    ring = list(zip(lats.tolist(), lons.tolist(), strict=True))
+    ring.append(ring[0])
+    return ring
+
+
+# GeoJSON
+
+
+def iter_geojson_features(
+    observations: Iterable[Observation] = (),
+    hive_locations: Iterable[HiveLocation] = (),
+    include_rays: bool = True,
+    include_confidence: bool = True,
+    segments: int = CIRCLE_SEGMENTS,
+) -> Iterator[dict]:
+    """
+    Generate GeoJSON features.
+
+    Observations become points (plus a bearing ray line to the estimated
+    distance); hive locations become points (plus a confidence polygon).
+
+    Args:
+        observations: Observations to export
+        hive_locations: Hive locations to export
+        include_rays: Emit a LineString per observation along its bearing
+        include_confidence: Emit a Polygon per hive for its confidence radius
+        segments: Vertices of confidence polygons
+    """
+    for index, obs in enumerate(observations, 1):
+        properties = {
+            "feature": "observation",
+            "index": index,
+            "bearing": obs.bearing,
+            "round_trip_time": obs.round_trip_time,
+            "estimated_distance": obs.estimated_distance,
+            "speed": obs.speed,
+            "timestamp": _timestamp(obs),
+            "hornet_color_mark": obs.hornet_color_mark,
+            "notes": obs.notes,
+        }
+        yield {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [_round(obs.longitude), _round(obs.latitude)],
+            },
+            "properties": properties,
+        }
+        if include_rays:
+            end_lat, end_lon = _ray_end(obs)
+            yield {
+                "type": "Feature",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [
+                        [_round(obs.longitude), _round(obs.latitude)],
+                        [_round(end_lon), _round(end_lat)],
+                    ],
+                },
+                "properties": {"feature": "bearing_ray", "index": index, "bearing": obs.bearing},
+            }
+
+    for index, hive in enumerate(hive_locations, 1):
+        properties = {
+            "feature": "hive",
+            "index": index,
+            "confidence_radius": hive.confidence_radius,
+            "distance_from_observer": hive.distance_from_observer,
+            "bearing_from_observer": hive.bearing_from_observer,
+            "calculation_method": hive.calculation_method,
+            "timestamp": _timestamp(hive),
+        }
+        yield {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [_round(hive.longitude), _round(hive.latitude)],
+            },
+            "properties": properties,
+        }
+        if include_confidence:
+            ring = [[_round(lon), _round(lat)] for lat, lon in confidence_ring(hive, segments)]
+            yield {
+                "type": "Feature",
+                "geometry": {"type": "Polygon", "coordinates": [ring]},
+                "properties": {
+                    "feature": "confidence_area",
+                    "index": index,
+                    "confidence_radius": hive.confidence_radius,
+                },
+            }
+
+
+def write_geojson(
+    fh: TextIO,
+    observations: Iterable[Observation] = (),
+    hive_locations: Iterable[HiveLocation] = (),
+    sequence: bool = False,
+    **options,
+) -> int:
+    """
+    Write a GeoJSON FeatureCollection (or RFC 8142 text sequence) incrementally.
+
+    Args:
+        fh: Open text file handle
+        observations: Observations to export
+        hive_locations: Hive locations to export
+        sequence: Write a GeoJSON text sequence (one RS-prefixed feature per
+            line) instead of a FeatureCollection, for line-oriented pipelines
+        **options: Passed to ``iter_geojson_features``
+
+    Returns:
+        Number of features written
+    """
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    features = iter_geojson_features(observations, hive_locations, **options)
+    count = 0
+
+    if sequence:
+        for feature in features:
+            fh.write(f"\x1e{encode(feature)}\n")
+            count += 1
+        return count
+
+    fh.write('{"type":"FeatureCollection","features":[')
+    for feature in features:
+        fh.write(",\n" if count else "\n")
+        fh.write(encode(feature))
+        count += 1
+    fh.write("\n]}\n")
+    return count
+
+
+# KML
+
+_KML_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2">
+<Document>
+<name>VespaFinder export</name>
+<Style id="observation"><IconStyle><color>ffff0000</color></IconStyle>
+<LineStyle><color>ffff0000</color><width>2</width></LineStyle></Style>
+<Style id="hive"><IconStyle><color>ff0000ff</color></IconStyle>
+<LineStyle><color>ff0000ff</color><width>2</width></LineStyle>
+<PolyStyle><color>330000ff</color></PolyStyle></Style>
+"""
+_KML_FOOTER = "</Document>\n</kml>\n"
+
+
+def _kml_coords(points: Iterable[tuple[float, float]]) -> str:
+    return " ".join(f"{_round(lon)},{_round(lat)}" for lat, lon in points)
+
+
+def write_kml(
+    fh: TextIO,
+    observations: Iterable[Observation] = (),
+    hive_locations: Iterable[HiveLocation] = (),
+    include_rays: bool = True,
+    include_confidence: bool = True,
+    segments: int = CIRCLE_SEGMENTS,
+) -> int:
+    """
+    Write a KML document incrementally.
+
+    Observations are placemarks with a point (and bearing ray); hives are
+    placemarks with a point (and confidence polygon).
+
+    Returns:
+        Number of placemarks written
+    """
+    fh.write(_KML_HEADER)
+    count = 0
+    for index, obs in enumerate(observations, 1):
+        geometry = f"<Point><coordinates>{_kml_coords([(obs.latitude, obs.longitude)])}</coordinates></Point>"
+        if include_rays:
+            ray = _kml_coords([(obs.latitude, obs.longitude), _ray_end(obs)])
+            geometry = (
+                f"<MultiGeometry>{geometry}"
+                f"<LineString><coordinates>{ray}</coordinates></LineString></MultiGeometry>"
+            )
+        description = (
+            f"Bearing {obs.bearing}°, round trip {obs.round_trip_time:.0f}s, "
+            f"~{obs.estimated_distance:.0f}m"
+        )
+        if obs.hornet_color_mark:
+            description += f", mark {obs.hornet_color_mark}"
+        if obs.notes:
+            description += f". {obs.notes}"
+        when = _timestamp(obs)
+        time_stamp = f"<TimeStamp><when>{when}</when></TimeStamp>" if when else ""
+        fh.write(
+            f"<Placemark><name>Observation {index}</name>"
+            f"<description>{escape(description)}</description>{time_stamp}"
+            f"<styleUrl>#observation</styleUrl>{geometry}</Placemark>\n"
+        )
+        count += 1
+
+    for index, hive in enumerate(hive_locations, 1):
+        geometry = f"<Point><coordinates>{_kml_coords([(hive.latitude, hive.longitude)])}</coordinates></Point>"
+        if include_confidence:
+            ring = _kml_coords(confidence_ring(hive, segments))
+            geometry = (
+                f"<MultiGeometry>{geometry}<Polygon><outerBoundaryIs><LinearRing>"
+                f"<coordinates>{ring}</coordinates></LinearRing></outerBoundaryIs></Polygon>"
+                f"</MultiGeometry>"
+            )
+        description = (
+            f"±{hive.confidence_radius:.0f}m, {hive.distance_from_observer:.0f}m at "
+            f"{hive.bearing_from_observer:.1f}° ({hive.calculation_method})"
+        )
+        fh.write(
+            f"<Placemark><name>Hive {index}</name>"
+            f"<description>{escape(description)}</description>"
+            f"<styleUrl>#hive</styleUrl>{geometry}</Placemark>\n"
+        )
+        count += 1
+
+    fh.write(_KML_FOOTER)
+    return count
+
+
+# GPX
+
+_GPX_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<gpx version="1.1" creator="VespaFinder {version}" '
+    'xmlns="http://www.topografix.com/GPX/1/1">\n'
+)
+
+
+def write_gpx(
+    fh: TextIO,
+    observations: Iterable[Observation] = (),
+    hive_locations: Iterable[HiveLocation] = (),
+) -> int:
+    """
+    Write observations and hive locations as GPX 1.1 waypoints, incrementally.
+
+    Waypoint times are written in UTC (``...Z``), as GPX requires. Only
+    timezone-aware timestamps can be converted, so observations with naive
+    (local, zone-less) timestamps get no ``<time>`` element.
+
+    Returns:
+        Number of waypoints written
+    """
+    fh.write(_GPX_HEADER.format(version=__version__))
+    count = 0
+    for index, obs in enumerate(observations, 1):
+        description = f"Bearing {obs.bearing}°, round trip {obs.round_trip_time:.0f}s"
+        if obs.hornet_color_mark:
+            description += f", mark {obs.hornet_color_mark}"
+        when = _utc_timestamp(obs)
+        time = f"<time>{when}</time>" if when else ""
+        fh.write(
+            f"<wpt lat={quoteattr(str(_round(obs.latitude)))} "
+            f"lon={quoteattr(str(_round(obs.longitude)))}>"
+            f"{time}<name>Observation {index}</name>"
+            f"<desc>{escape(description)}</desc><sym>Binoculars</sym>"
+            f"<type>observation</type></wpt>\n"
+        )
+        count += 1
+
+    for index, hive in enumerate(hive_locations, 1):
+        description = f"±{hive.confidence_radius:.0f}m ({hive.calculation_method})"
+        fh.write(
+            f"<wpt lat={quoteattr(str(_round(hive.latitude)))} "
+            f"lon={quoteattr(str(_round(hive.longitude)))}>"
+            f"<name>Hive {index}</name><desc>{escape(description)}</desc>"
+            f"<sym>Flag, Red</sym><type>hive</type></wpt>\n"
+        )
+        count += 1
+
+    fh.write("</gpx>\n")
+    return count
+
+
+# Density rasters
+
+
+def write_ascii_grid(fh: TextIO, grid: DensityGrid, precision: int = 6) -> None:
+    """
+    Write a density grid as an ESRI ASCII raster (readable by GDAL/QGIS), row by row.
+
+    Uses GDAL's ``dx``/``dy`` header extension since cells are not square in
+    degrees.
+    """
+    height, width = grid.cell_size
+    rows, cols = grid.shape
+    fh.write(
+        f"ncols {cols}\nnrows {rows}\nxllcorner {grid.west!r}\nyllcorner {grid.south!r}\n"
+        f"dx {width!r}\ndy {height!r}\nNODATA_value -9999\n"
+    )
+    for row in grid.values:
+        fh.write(" ".join(f"{value:.{precision}g}" for value in row.tolist()))
+        fh.write("\n")
@@ -1,6 +1,9 @@
 """Geographic calculation utilities using haversine formula."""
 
 import math
+from functools import lru_cache
+
+import numpy as np
 
 # Earth's radius in meters (WGS84 mean radius)
 EARTH_RADIUS_METERS = 6371000.0
@@ -52,6 +55,122 @@ def destination_point(
     return lat2_deg, lon2_deg
 
 
+class GeoOrigin:
+    """
+    Start point with precomputed trigonometric terms.
+
+    Projecting several bearing/distance pairs from the same position (e.g.
+    repeated bearings from one bait station, or the hive estimate and map
+    arrow of one observation) reuses the origin's sine and cosine instead of
+    recomputing them per call. Results are identical to ``destination_point``.
+    """
+
+    __slots__ = ("_cos_lat", "_lat_rad", "_lon_rad", "_sin_lat", "latitude", "longitude")
+
+    def __init__(self, latitude: float, longitude: float):
+        """
+        Initialize an origin.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+        """
+        self.latitude = latitude
+        self.longitude = longitude
+        self._lat_rad = math.radians(latitude)
+        self._lon_rad = math.radians(longitude)
+        self._sin_lat = math.sin(self._lat_rad)
+        self._cos_lat = math.cos(self._lat_rad)
+
+    def destination(self, bearing: float, distance: float) -> tuple[float, float]:
+        """
+        Project one point from the origin.
+
+        Args:
+            bearing: Bearing in degrees (0=North, clockwise)
+            distance: Distance in meters
+
+        Returns:
+            Tuple of (destination_latitude, destination_longitude) in degrees
+        """
+        bearing_rad = math.radians(bearing)
+        angular_distance = distance / EARTH_RADIUS_METERS
+        sin_ad = math.sin(angular_distance)
+        cos_ad = math.cos(angular_distance)
+
+        lat2 = math.asin(self._sin_lat * cos_ad + self._cos_lat * sin_ad * math.cos(bearing_rad))
+        lon2 = self._lon_rad + math.atan2(
+            math.sin(bearing_rad) * sin_ad * self._cos_lat,
+            cos_ad - self._sin_lat * math.sin(lat2),
+        )
+        return math.degrees(lat2), ((math.degrees(lon2) + 180) % 360) - 180
+
+    def destinations(
+        self, bearings: np.ndarray, distances: np.ndarray | float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Project many points from the origin at once.
+
+        Args:
+            bearings: Bearings in degrees
+            distances: Distances in meters (an array, or one distance for all bearings,
+                whose trigonometry is then computed once)
+
+        Returns:
+            Tuple of (destination_latitudes, destination_longitudes) arrays in degrees
+        """
+        bearing_rad = np.radians(bearings)
+        angular_distance = np.asarray(distances, dtype=float) / EARTH_RADIUS_METERS
+        sin_ad = np.sin(angular_distance)
+        cos_ad = np.cos(angular_distance)
+
+        lat2 = np.arcsin(self._sin_lat * cos_ad + self._cos_lat * sin_ad * np.cos(bearing_rad))
+        lon2 = self._lon_rad + np.arctan2(
+            np.sin(bearing_rad) * sin_ad * self._cos_lat, cos_ad - self._sin_lat * np.sin(lat2)
+        )
+        return np.degrees(lat2), ((np.degrees(lon2) + 180) % 360) - 180
+
+
+@lru_cache(maxsize=4096)
+def geo_origin(latitude: float, longitude: float) -> GeoOrigin:
+    """Shared (cached) GeoOrigin for a position; origins are immutable once created."""
+    return GeoOrigin(latitude, longitude)
+
+
+def destination_points(
+    lat: np.ndarray, lon: np.ndarray, bearing: np.ndarray, distance: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized ``destination_point`` for arrays of start points.
+
+    Args:
+        lat: Starting latitudes in degrees
+        lon: Starting longitudes in degrees
+        bearing: Bearings in degrees (0=North, clockwise)
+        distance: Distances in meters
+
+    Returns:
+        Tuple of (destination_latitudes, destination_longitudes) arrays in degrees
+    """
+    lat1 = np.radians(lat)
+    lon1 = np.radians(lon)
+    bearing_rad = np.radians(bearing)
+    angular_distance = np.asarray(distance, dtype=float) / EARTH_RADIUS_METERS
+
+    sin_lat1 = np.sin(lat1)
+    cos_lat1 = np.cos(lat1)
+    sin_ad = np.sin(angular_distance)
+    cos_ad = np.cos(angular_distance)
+
+    lat2 = np.arcsin(sin_lat1 * cos_ad + cos_lat1 * sin_ad * np.cos(bearing_rad))
+    lon2 = lon1 + np.arctan2(
+        np.sin(bearing_rad) * sin_ad * cos_lat1, cos_ad - sin_lat1 * np.sin(lat2)
+    )
+
+    lon2_deg = ((np.degrees(lon2) + 180) % 360) - 180
+    return np.degrees(lat2), lon2_deg
+
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the great circle distance between two points on Earth.
@@ -0,0 +1,371 @@
+"""Geodesic models: spherical (default) and WGS84 ellipsoidal.
+
+``SphericalGeodesic`` wraps the haversine functions of ``geo_utils``.
+``WGS84Geodesic`` solves the direct and inverse problems on the WGS84
+ellipsoid with Vincenty's formulae (sub-millimetre accuracy), vectorized with
+NumPy. Short direct projections, which is what hornet flight distances are,
+take a fast path that works in a local frame using the ellipsoid's meridional
+and prime-vertical radii of curvature; for single projections those radii are
+memoized per latitude band, so repeated projections around one apiary cost a
+cache lookup instead of the iterative solution.
+
+Select a model per ``HiveCalculator`` with ``HiveCalculator(geodesic="wgs84")``.
+"""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from .geo_utils import (
+    EARTH_RADIUS_METERS,
+    bearing_between_points,
+    destination_points,
+    geo_origin,
+    haversine_distance,
+)
+
+# WGS84 ellipsoid
+WGS84_A = 6378137.0  # semi-major axis, meters
+WGS84_F = 1 / 298.257223563  # flattening
+WGS84_B = WGS84_A * (1 - WGS84_F)  # semi-minor axis, meters
+WGS84_E2 = WGS84_F * (2 - WGS84_F)  # first eccentricity squared
+
+_CONVERGENCE = 1e-12  # radians
+_MAX_ITERATIONS = 200
+
+
+class SphericalGeodesic:
+    """Great-circle geodesics on a sphere of radius ``EARTH_RADIUS_METERS``."""
+
+    name = "spherical"
+
+    def destination(
+        self, lat: float, lon: float, bearing: float, distance: float
+    ) -> tuple[float, float]:
+        """Destination of one projection (identical to ``geo_utils.destination_point``)."""
+        return geo_origin(lat, lon).destination(bearing, distance)
+
+    def distance_and_bearing(
+        self, lat1: float, lon1: float, lat2: float, lon2: float
+    ) -> tuple[float, float]:
+        """Distance in meters and initial bearing in degrees from point 1 to point 2."""
+        return (
+            haversine_distance(lat1, lon1, lat2, lon2),
+            bearing_between_points(lat1, lon1, lat2, lon2),
+        )
+
+    def direct(
+        self, lat: np.ndarray, lon: np.ndarray, bearing: np.ndarray, distance: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized destination points."""
+        return destination_points(lat, lon, bearing, distance)
+
+    def inverse(
+        self, lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized distances (meters) and initial bearings (degrees)."""
+        return _spherical_inverse(lat1, lon1, lat2, lon2)
+
+
+def _spherical_inverse(lat1, lon1, lat2, lon2) -> tuple[np.ndarray, np.ndarray]:
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    delta_phi = phi2 - phi1
+    delta_lambda = np.radians(np.asarray(lon2) - np.asarray(lon1))
+
+    a = np.sin(delta_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+    a = np.clip(a, 0.0, 1.0)
+    distance = EARTH_RADIUS_METERS * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    y = np.sin(delta_lambda) * np.cos(phi2)
+    x = np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(delta_lambda)
+    bearing = (np.degrees(np.arctan2(y, x)) + 360) % 360
+    return distance, bearing
+
+
+def _radii(sin_phi):
+    """Meridional and prime-vertical radii of curvature (scalar or array)."""
+    w = np.sqrt(1 - WGS84_E2 * sin_phi * sin_phi)
+    return WGS84_A * (1 - WGS84_E2) / (w * w * w), WGS84_A / w
+
+
+@lru_cache(maxsize=8192)
+def _band_radii(band: int, band_degrees: float) -> tuple[float, float]:
+    """Radii of curvature at the center of a latitude band (memoized)."""
+    meridional, prime_vertical = _radii(math.sin(math.radians(band * band_degrees)))
+    return float(meridional), float(prime_vertical)
+
+
+class WGS84Geodesic:
+    """
+    Geodesics on the WGS84 ellipsoid.
+
+    Direct projections up to ``fast_path_max_distance`` below 80° latitude use
+    a local midpoint solution (radii of curvature and azimuth evaluated at the
+    midpoint of the line), which stays within 0.5 mm of Vincenty up to 2 km.
+    Scalar projections look the radii up per latitude band of ``band_degrees``
+    in a memoized cache. Longer lines and all inverse calculations use
+    Vincenty's iterative formulae.
+    """
+
+    name = "wgs84"
+
+    FAST_PATH_MAX_LATITUDE = 80.0
+
+    def __init__(self, fast_path_max_distance: float = 2000.0, band_degrees: float = 0.001):
+        """
+        Initialize the model.
+
+        Args:
+            fast_path_max_distance: Longest projection (meters) solved with the fast path;
+                0 disables it
+            band_degrees: Width of the latitude bands whose radii are cached
+        """
+        self.fast_path_max_distance = fast_path_max_distance
+        self.band_degrees = band_degrees
+
+    def _use_fast_path(self, lat, distance):
+        return (distance <= self.fast_path_max_distance) & (
+            np.abs(lat) < self.FAST_PATH_MAX_LATITUDE
+        )
+
+    def destination(
+        self, lat: float, lon: float, bearing: float, distance: float
+    ) -> tuple[float, float]:
+        """Destination of one projection."""
+        if not self._use_fast_path(lat, distance):
+            lat2, lon2 = vincenty_direct(
+                np.array([lat]), np.array([lon]), np.array([bearing]), np.array([distance])
+            )
+            return float(lat2[0]), float(lon2[0])
+
+        bearing_rad = math.radians(bearing)
+        lat_rad = math.radians(lat)
+        meridional, prime_vertical = _band_radii(round(lat / self.band_degrees), self.band_degrees)
+        d_lat = distance * math.cos(bearing_rad) / meridional
+        d_lon = distance * math.sin(bearing_rad) / (prime_vertical * math.cos(lat_rad))
+        for _ in range(2):
+            mid_lat = lat_rad + d_lat / 2
+            mid_bearing = bearing_rad + d_lon / 2 * math.sin(mid_lat)
+            meridional, prime_vertical = _band_radii(
+                round(math.degrees(mid_lat) / self.band_degrees), self.band_degrees
+            )
+            d_lat = distance * math.cos(mid_bearing) / meridional
+            d_lon = distance * math.sin(mid_bearing) / (prime_vertical * math.cos(mid_lat))
+        return lat + math.degrees(d_lat), ((lon + math.degrees(d_lon) + 180) % 360) - 180
+
+    def distance_and_bearing(
+        self, lat1: float, lon1: float, lat2: float, lon2: float
+    ) -> tuple[float, float]:
+        """Distance in meters and initial bearing in degrees from point 1 to point 2."""
+        distance, bearing = vincenty_inverse(
+            np.array([lat1]), np.array([lon1]), np.array([lat2]), np.array([lon2])
+        )
+        return float(distance[0]), float(bearing[0])
+
+    def direct(
+        self, lat: np.ndarray, lon: np.ndarray, bearing: np.ndarray, distance: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized destination points."""
+        lat, lon, bearing, distance = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (lat, lon, bearing, distance))
+        )
+        fast = self._use_fast_path(lat, distance)
+        if fast.all():
+            return _local_direct(lat, lon, bearing, distance)
+
+        lat2 = np.empty(lat.shape)
+        lon2 = np.empty(lat.shape)
+        lat2[fast], lon2[fast] = _local_direct(lat[fast], lon[fast], bearing[fast], distance[fast])
+        slow = ~fast
+        lat2[slow], lon2[slow] = vincenty_direct(
+            lat[slow], lon[slow], bearing[slow], distance[slow]
+        )
+        return lat2, lon2
+
+    def inverse(
+        self, lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized distances (meters) and initial bearings (degrees)."""
+        return vincenty_inverse(lat1, lon1, lat2, lon2)
+
+
+def _local_direct(lat, lon, bearing, distance) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Short-line direct solution in a local frame (vectorized).
+
+    Evaluates the radii and the azimuth at the midpoint of the line (the
+    azimuth turns by ``delta_lon * sin(lat)`` along a geodesic), which makes
+    the error third order in distance.
+    """
+    bearing_rad = np.radians(bearing)
+    lat_rad = np.radians(lat)
+    meridional, prime_vertical = _radii(np.sin(lat_rad))
+    d_lat = distance * np.cos(bearing_rad) / meridional
+    d_lon = distance * np.sin(bearing_rad) / (prime_vertical * np.cos(lat_rad))
+    for _ in range(2):
+        mid_lat = lat_rad + d_lat / 2
+        mid_bearing = bearing_rad + d_lon / 2 * np.sin(mid_lat)
+        meridional, prime_vertical = _radii(np.sin(mid_lat))
+        d_lat = distance * np.cos(mid_bearing) / meridional
+        d_lon = distance * np.sin(mid_bearing) / (prime_vertical * np.cos(mid_lat))
+    return lat + np.degrees(d_lat), ((lon + np.degrees(d_lon) + 180) % 360) - 180
+
+
+def _series_ab(u_squared: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vincenty's series coefficients A and B."""
+    a = 1 + u_squared / 16384 * (4096 + u_squared * (-768 + u_squared * (320 - 175 * u_squared)))
+    b = u_squared / 1024 * (256 + u_squared * (-128 + u_squared * (74 - 47 * u_squared)))
+    return a, b
+
+
+def _delta_sigma(b, sin_sigma, cos_sigma, cos_2sigma_m):
+    return (
+        b
+        * sin_sigma
+        * (
+            cos_2sigma_m
+            + b
+            / 4
+            * (
+                cos_sigma * (-1 + 2 * cos_2sigma_m**2)
+                - b / 6 * cos_2sigma_m * (-3 + 4 * sin_sigma**2) * (-3 + 4 * cos_2sigma_m**2)
+            )
+        )
+    )
+
+
+def vincenty_direct(
+    lat: np.ndarray, lon: np.ndarray, bearing: np.ndarray, distance: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vincenty's direct solution on WGS84 (vectorized).
+
+    Args:
+        lat, lon: Start points in degrees
+        bearing: Initial azimuths in degrees
+        distance: Geodesic distances in meters
+
+    Returns:
+        Tuple of (latitudes, longitudes) in degrees
+    """
+    phi1 = np.radians(lat)
+    alpha1 = np.radians(bearing)
+    s = np.asarray(distance, dtype=float)
+    sin_alpha1, cos_alpha1 = np.sin(alpha1), np.cos(alpha1)
+
+    tan_u1 = (1 - WGS84_F) * np.tan(phi1)
+    cos_u1 = 1 / np.sqrt(1 + tan_u1**2)
+    sin_u1 = tan_u1 * cos_u1
+    sigma1 = np.arctan2(tan_u1, cos_alpha1)
+    sin_alpha = cos_u1 * sin_alpha1
+    cos_sq_alpha = 1 - sin_alpha**2
+    u_squared = cos_sq_alpha * (WGS84_A**2 - WGS84_B**2) / WGS84_B**2
+    a, b = _series_ab(u_squared)
+
+    sigma = s / (WGS84_B * a)
+    for _ in range(_MAX_ITERATIONS):
+        cos_2sigma_m = np.cos(2 * sigma1 + sigma)
+        sin_sigma, cos_sigma = np.sin(sigma), np.cos(sigma)
+        new_sigma = s / (WGS84_B * a) + _delta_sigma(b, sin_sigma, cos_sigma, cos_2sigma_m)
+        converged = np.all(np.abs(new_sigma - sigma) < _CONVERGENCE)
+        sigma = new_sigma
+        if converged:
+            break
+
+    cos_2sigma_m = np.cos(2 * sigma1 + sigma)
+    sin_sigma, cos_sigma = np.sin(sigma), np.cos(sigma)
+    x = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1
+    phi2 = np.arctan2(
+        sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+        (1 - WGS84_F) * np.sqrt(sin_alpha**2 + x**2),
+    )
+    lam = np.arctan2(sin_sigma * sin_alpha1, cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1)
+    c = WGS84_F / 16 * cos_sq_alpha * (4 + WGS84_F * (4 - 3 * cos_sq_alpha))
+    big_l = lam - (1 - c) * WGS84_F * sin_alpha * (
+        sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (-1 + 2 * cos_2sigma_m**2))
+    )
+    lon2 = ((np.asarray(lon, dtype=float) + np.degrees(big_l) + 180) % 360) - 180
+    return np.degrees(phi2), lon2
+
+
+def vincenty_inverse(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vincenty's inverse solution on WGS84 (vectorized).
+
+    Nearly antipodal pairs, for which the iteration does not converge, fall
+    back to the spherical solution.
+
+    Returns:
+        Tuple of (distances in meters, initial bearings in degrees)
+    """
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (lat1, lon1, lat2, lon2))
+    )
+    big_l = np.radians(lon2 - lon1)
+    tan_u1 = (1 - WGS84_F) * np.tan(np.radians(lat1))
+    tan_u2 = (1 - WGS84_F) * np.tan(np.radians(lat2))
+    cos_u1 = 1 / np.sqrt(1 + tan_u1**2)
+    cos_u2 = 1 / np.sqrt(1 + tan_u2**2)
+    sin_u1, sin_u2 = tan_u1 * cos_u1, tan_u2 * cos_u2
+
+    lam = big_l.copy()
+    converged = np.zeros(lam.shape, dtype=bool)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for _ in range(_MAX_ITERATIONS):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.sqrt(
+                (cos_u2 * sin_lam) ** 2 + (cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam) ** 2
+            )
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(sin_sigma > 0, cos_u1 * cos_u2 * sin_lam / sin_sigma, 0.0)
+            cos_sq_alpha = 1 - sin_alpha**2
+            cos_2sigma_m = np.where(
+                cos_sq_alpha > 0, cos_sigma - 2 * sin_u1 * sin_u2 / cos_sq_alpha, 0.0
+            )
+            c = WGS84_F / 16 * cos_sq_alpha * (4 + WGS84_F * (4 - 3 * cos_sq_alpha))
+            new_lam = big_l + (1 - c) * WGS84_F * sin_alpha * (
+                sigma + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (-1 + 2 * cos_2sigma_m**2))
+            )
+            converged = np.abs(new_lam - lam) < _CONVERGENCE
+            lam = new_lam
+            if converged.all():
+                break
+
+    sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+    u_squared = cos_sq_alpha * (WGS84_A**2 - WGS84_B**2) / WGS84_B**2
+    a, b = _series_ab(u_squared)
+    distance = WGS84_B * a * (sigma - _delta_sigma(b, sin_sigma, cos_sigma, cos_2sigma_m))
+    bearing = np.degrees(np.arctan2(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam))
+    bearing = (bearing + 360) % 360
+
+    if not converged.all():
+        fallback_distance, fallback_bearing = _spherical_inverse(lat1, lon1, lat2, lon2)
+        distance = np.where(converged, distance, fallback_distance)
+        bearing = np.where(converged, bearing, fallback_bearing)
+    return distance, bearing
+
+
+GEODESIC_MODELS = {"spherical": SphericalGeodesic, "wgs84": WGS84Geodesic}
+
+
+def get_geodesic(
+    model: str | SphericalGeodesic | WGS84Geodesic,
+) -> SphericalGeodesic | WGS84Geodesic:
+    """
+    Resolve a geodesic model by name ("spherical" or "wgs84") or pass an instance through.
+
+    Raises:
+        ValueError: For unknown model names
+    """
+    if not isinstance(model, str):
+        return model
+    try:
+        return GEODESIC_MODELS[model]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown geodesic model: {model}. Use one of {', '.join(GEODESIC_MODELS)}"
+        ) from None
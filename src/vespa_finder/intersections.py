@@ -0,0 +1,257 @@
+"""Pairwise intersections of observation bearing rays.
+
+Every observation defines a ray from the observer along its bearing, out to
+its estimated distance plus confidence radius (its maximum plausible range).
+Where rays from different observers cross, a nest is likely. Testing all pairs
+is O(n²); here rays are bucketed into a uniform grid by bounding box, and only
+rays sharing a grid cell are tested, so city-scale sessions with many
+thousands of observations stay fast.
+
+Each intersection is weighted by how well it agrees with both rays:
+``sin(crossing angle)`` (shallow crossings are poorly conditioned) times a
+Gaussian of how far the crossing lies from each ray's estimated distance,
+in units of its confidence radius.
+"""
+
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from .calculator import HiveCalculator
+from .distance_models import wall_clock_times
+from .geo_utils import EARTH_RADIUS_METERS
+from .models import Observation
+
+DEFAULT_MIN_ANGLE = 5.0  # degrees; shallower crossings are ignored
+DEFAULT_MIN_SEPARATION = 10.0  # meters; rays from (nearly) the same spot are ignored
+
+
+@dataclass
+class RayIntersections:
+    """Intersection points of bearing ray pairs, stored as columns."""
+
+    latitude: np.ndarray
+    longitude: np.ndarray
+    weight: np.ndarray  # 0..1
+    angle: np.ndarray  # crossing angle in degrees, 0..90
+    first: np.ndarray  # index of the first observation of the pair
+    second: np.ndarray  # index of the second observation of the pair
+    pairs_tested: int = 0  # pairs whose ray bounding boxes overlap
+
+    def __len__(self) -> int:
+        return len(self.latitude)
+
+
+def intersect_observations(
+    observations: Sequence[Observation],
+    calculator: HiveCalculator | None = None,
+    method: str = "empirical",
+    **options,
+) -> RayIntersections:
+    """
+    Intersect the bearing rays of a list of observations.
+
+    Args:
+        observations: Observations (indices in the result refer to this sequence)
+        calculator: Calculator providing distances, confidence and geodesic model
+        method: "empirical" (recommended) or "theoretical"
+        **options: Passed to ``intersect_rays``
+
+    Returns:
+        RayIntersections for all crossing pairs
+    """
+    return intersect_rays(
+        [o.latitude for o in observations],
+        [o.longitude for o in observations],
+        [o.bearing for o in observations],
+        [o.round_trip_time for o in observations],
+        speed=[np.nan if o.speed is None else o.speed for o in observations],
+        timestamp=wall_clock_times(o.timestamp for o in observations),
+        temperature=[np.nan if o.temperature is None else o.temperature for o in observations],
+        calculator=calculator,
+        method=method,
+        **options,
+    )
+
+
+def intersect_rays(
+    latitude: np.ndarray,
+    longitude: np.ndarray,
+    bearing: np.ndarray,
+    round_trip_time: np.ndarray,
+    speed: np.ndarray | None = None,
+    calculator: HiveCalculator | None = None,
+    method: str = "empirical",
+    min_angle: float = DEFAULT_MIN_ANGLE,
+    min_separation: float = DEFAULT_MIN_SEPARATION,
+    cell_size: float | None = None,
+    observation_weight: np.ndarray | None = None,
+    timestamp: np.ndarray | None = None,
+    temperature: np.ndarray | None = None,
+) -> RayIntersections:
+    """
+    Intersect bearing rays given as columns (e.g. an archive slice).
+
+    Args:
+        latitude, longitude: Observer positions in degrees
+        bearing: Flight bearings in degrees
+        round_trip_time: Round trip times in seconds
+        speed: Flight speeds in m/s (NaN where unknown); required for "theoretical"
+        calculator: Calculator providing distances, confidence and geodesic model
+        method: "empirical" (recommended) or "theoretical"
+        min_angle: Ignore pairs crossing at less than this angle (degrees)
+        min_separation: Ignore pairs whose observers are closer than this (meters)
+        cell_size: Grid cell size in meters (default: median ray length)
+        observation_weight: Optional weight per observation (e.g. ``quality.QualityScores.weight``);
+            each intersection's weight is multiplied by both observations' weights
+        timestamp: Observation times (datetime64, NaT where unknown), for distance models
+            that depend on the time of day
+        temperature: Air temperatures in °C (NaN where unknown)
+
+    Returns:
+        RayIntersections for all crossing pairs
+    """
+    calculator = calculator or HiveCalculator()
+    latitude = np.asarray(latitude, dtype=float)
+    longitude = np.asarray(longitude, dtype=float)
+    bearing = np.asarray(bearing, dtype=float)
+
+    estimates = calculator.calculate_batch(
+        latitude,
+        longitude,
+        bearing,
+        round_trip_time,
+        speed=speed,
+        method=method,
+        timestamp=timestamp,
+        temperature=temperature,
+    )
+    distance = estimates.distance_from_observer
+    sigma = estimates.confidence_radius
+    max_range = distance + sigma
+
+    first, second = _candidate_pairs(latitude, longitude, bearing, max_range, calculator, cell_size)
+    pairs_tested = len(first)
+
+    # Position of each second observer relative to the first, in the first's
+    # azimuthal frame (x east, y north)
+    separation, azimuth = calculator.geodesic.inverse(
+        latitude[first], longitude[first], latitude[second], longitude[second]
+    )
+    azimuth = np.radians(azimuth)
+    offset_x, offset_y = separation * np.sin(azimuth), separation * np.cos(azimuth)
+
+    theta_1, theta_2 = np.radians(bearing[first]), np.radians(bearing[second])
+    dir1_x, dir1_y = np.sin(theta_1), np.cos(theta_1)
+    dir2_x, dir2_y = np.sin(theta_2), np.cos(theta_2)
+    cross = dir1_x * dir2_y - dir1_y * dir2_x  # sin of the crossing angle
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_1 = (offset_x * dir2_y - offset_y * dir2_x) / cross
+        t_2 = (offset_x * dir1_y - offset_y * dir1_x) / cross
+    keep = (
+        (np.abs(cross) >= np.sin(np.radians(min_angle)))
+        & (separation >= min_separation)
+        & (t_1 >= 0)
+        & (t_1 <= max_range[first])
+        & (t_2 >= 0)
+        & (t_2 <= max_range[second])
+    )
+    first, second, t_1, t_2, cross = first[keep], second[keep], t_1[keep], t_2[keep], cross[keep]
+
+    hit_lat, hit_lon = calculator.geodesic.direct(
+        latitude[first], longitude[first], bearing[first], t_1
+    )
+    weight = (
+        np.abs(cross)
+        * np.exp(-0.5 * ((t_1 - distance[first]) / sigma[first]) ** 2)
+        * np.exp(-0.5 * ((t_2 - distance[second]) / sigma[second]) ** 2)
+    )
+    if observation_weight is not None:
+        observation_weight = np.asarray(observation_weight, dtype=float)
+        weight *= observation_weight[first] * observation_weight[second]
+
+    return RayIntersections(
+        latitude=hit_lat,
+        longitude=hit_lon,
+        weight=weight,
+        angle=np.degrees(np.arcsin(np.minimum(np.abs(cross), 1.0))),
+        first=first,
+        second=second,
+        pairs_tested=pairs_tested,
+    )
+
+
+def _candidate_pairs(
+    latitude: np.ndarray,
+    longitude: np.ndarray,
+    bearing: np.ndarray,
+    max_range: np.ndarray,
+    calculator: HiveCalculator,
+    cell_size: float | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Index pairs (i < j) whose ray bounding boxes overlap, via a uniform grid.
+
+    Rays are projected equirectangularly about the region's mean latitude;
+    boxes are padded to absorb the projection's distortion.
+    """
+    empty = np.empty(0, dtype=np.intp)
+    if len(latitude) < 2:
+        return empty, empty
+
+    end_lat, end_lon = calculator.geodesic.direct(latitude, longitude, bearing, max_range)
+    scale_y = np.radians(EARTH_RADIUS_METERS)  # meters per degree latitude
+    scale_x = scale_y * np.cos(np.radians(latitude.mean()))
+    lon0 = longitude.mean()
+    start_x, end_x = (longitude - lon0) * scale_x, (end_lon - lon0) * scale_x
+    start_y, end_y = latitude * scale_y, end_lat * scale_y
+
+    pad = 0.01 * max_range + 1.0
+    min_x, max_x = np.minimum(start_x, end_x) - pad, np.maximum(start_x, end_x) + pad
+    min_y, max_y = np.minimum(start_y, end_y) - pad, np.maximum(start_y, end_y) + pad
+
+    if cell_size is None:
+        cell_size = float(np.median(max_range))
+    cell_size = max(cell_size, 1.0)
+    cell_x0, cell_x1 = np.floor(min_x / cell_size), np.floor(max_x / cell_size)
+    cell_y0, cell_y1 = np.floor(min_y / cell_size), np.floor(max_y / cell_size)
+
+    cells: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+    for index, (x0, x1, y0, y1) in enumerate(
+        zip(
+            cell_x0.astype(int).tolist(),
+            cell_x1.astype(int).tolist(),
+            cell_y0.astype(int).tolist(),
+            cell_y1.astype(int).tolist(),
+            strict=True,
+        )
+    ):
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cells[cx, cy].append(index)
+
+    firsts, seconds = [], []
+    for (cx, cy), members in cells.items():
+        if len(members) < 2:
+            continue
+        i, j = np.triu_indices(len(members), k=1)
+        members_array = np.array(members, dtype=np.intp)
+        i, j = members_array[i], members_array[j]
+        # Keep each overlapping pair once: in the cell holding its overlap's corner
+        corner_x = np.maximum(min_x[i], min_x[j])
+        corner_y = np.maximum(min_y[i], min_y[j])
+        keep = (
+            (corner_x <= np.minimum(max_x[i], max_x[j]))
+            & (corner_y <= np.minimum(max_y[i], max_y[j]))
+            & (np.floor(corner_x / cell_size) == cx)
+            & (np.floor(corner_y / cell_size) == cy)
+        )
+        firsts.append(i[keep])
+        seconds.append(j[keep])
+
+    if not firsts:
+        return empty, empty
+    return np.concatenate(firsts), np.concatenate(seconds)
@@ -0,0 +1,291 @@
+"""Local stand-in for the Waarneming.nl API, for integration and load testing.
+
+Run ``python -m vespa_finder.mock_api`` to start a mock server and measure
+end-to-end submission throughput and tail latency of ``WildlifeReporter``.
+"""
+# ruff: noqa: T201
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Self
+from urllib.parse import urlparse
+
+from .bulk_submit import RateLimiter, RetryPolicy, SubmissionReport
+from .calculator import HiveCalculator
+from .models import HiveLocation, Observation
+from .wildlife_api import WildlifeReporter
+
+
+@dataclass
+class MockServerConfig:
+    """Behaviour of the mock API."""
+
+    latency: float = 0.0  # seconds added to every response
+    latency_jitter: float = 0.0  # extra uniform random latency, seconds
+    error_rate: float = 0.0  # fraction of requests answered with HTTP 503
+    rate_limit: float | None = None  # requests per second before HTTP 429
+    burst: int = 10  # requests allowed back-to-back under the rate limit
+    retry_after: float = 1.0  # Retry-After sent with HTTP 429, seconds
+    api_key: str | None = None  # if set, only this bearer token is accepted
+    seed: int | None = None  # seed for latency and error sampling
+
+
+class MockWildlifeServer:
+    """
+    Threaded HTTP server implementing the Waarneming.nl observation contract.
+
+    ``POST`` to the path of ``WildlifeReporter.DATABASES["waarneming"]["api_url"]``
+    with a bearer token and a JSON observation returns ``201`` and
+    ``{"id": ..., "url": ...}``. Invalid requests get ``400``/``401``/``404``;
+    injected failures are ``503`` and throttled requests ``429`` with a
+    ``Retry-After`` header. Each connection is handled in its own thread and
+    keep-alive is supported, so pooled clients can be load tested.
+    """
+
+    PATH = urlparse(WildlifeReporter.DATABASES["waarneming"]["api_url"]).path
+    REQUIRED_FIELDS = ("species", "latitude", "longitude", "date")
+
+    def __init__(
+        self, config: MockServerConfig | None = None, host: str = "127.0.0.1", port: int = 0
+    ):
+        """
+        Initialize the server (call ``start`` or use it as a context manager).
+
+        Args:
+            config: Server behaviour (defaults to no latency and no errors)
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.config = config or MockServerConfig()
+        self.status_counts: Counter[int] = Counter()
+        self.accepted: list[dict] = []
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+        self._limiter = (
+            RateLimiter(self.config.rate_limit, burst=self.config.burst)
+            if self.config.rate_limit
+            else None
+        )
+        handler = type("Handler", (_MockHandler,), {"server_state": self})
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def api_url(self) -> str:
+        """Observation endpoint URL of the running server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{self.PATH}"
+
+    @property
+    def request_count(self) -> int:
+        """Number of requests answered."""
+        with self._lock:
+            return sum(self.status_counts.values())
+
+    def start(self) -> None:
+        """Serve in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="mock-wildlife-api",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.stop()
+
+    def handle(self, path: str, authorization: str | None, body: bytes) -> tuple[int, dict, dict]:
+        """
+        Produce the response to one request.
+
+        Returns:
+            (status code, extra headers, JSON body)
+        """
+        config = self.config
+        with self._lock:
+            delay = config.latency + self._random.uniform(0, config.latency_jitter)
+            inject_error = self._random.random() < config.error_rate
+        if delay > 0:
+            time.sleep(delay)
+
+        if path != self.PATH:
+            return self._record(404, {}, {"error": "Not found"})
+        if not authorization or not authorization.startswith("Bearer "):
+            return self._record(401, {}, {"error": "Authentication required"})
+        if config.api_key is not None and authorization != f"Bearer {config.api_key}":
+            return self._record(401, {}, {"error": "Invalid API key"})
+        if self._limiter is not None and not self._limiter.try_acquire():
+            return self._record(
+                429, {"Retry-After": f"{config.retry_after:g}"}, {"error": "Too many requests"}
+            )
+        if inject_error:
+            return self._record(503, {}, {"error": "Service unavailable"})
+
+        try:
+            observation = json.loads(body)
+        except ValueError:
+            return self._record(400, {}, {"error": "Body is not valid JSON"})
+        if not isinstance(observation, dict):
+            return self._record(400, {}, {"error": "Expected a JSON object"})
+        missing = [name for name in self.REQUIRED_FIELDS if name not in observation]
+        if missing:
+            return self._record(400, {}, {"error": f"Missing fields: {', '.join(missing)}"})
+
+        with self._lock:
+            self.accepted.append(observation)
+            observation_id = len(self.accepted)
+        return self._record(
+            201, {}, {"id": observation_id, "url": f"{self.api_url}/{observation_id}"}
+        )
+
+    def _record(self, status: int, headers: dict, body: dict) -> tuple[int, dict, dict]:
+        with self._lock:
+            self.status_counts[status] += 1
+        return status, headers, body
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """Request handler delegating to ``MockWildlifeServer.handle``."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    server_state: MockWildlifeServer
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        status, headers, payload = self.server_state.handle(
+            self.path, self.headers.get("Authorization"), body
+        )
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *_args):
+        pass
+
+
+def synthetic_reports(count: int, seed: int = 0) -> list[tuple[Observation, HiveLocation]]:
+    """
+    Generate plausible observation/estimate pairs around Brussels.
+
+    Args:
+        count: Number of pairs
+        seed: Random seed
+
+    Returns:
+        List of (observation, hive_location)
+    """
+    rng = random.Random(seed)
+    calculator = HiveCalculator()
+    start = datetime(2025, 9, 1, 9, 0)
+    reports = []
+    for i in range(count):
+        observation = Observation(
+            latitude=50.85 + rng.uniform(-0.05, 0.05),
+            longitude=4.35 + rng.uniform(-0.05, 0.05),
+            bearing=rng.uniform(0, 359.9),
+            round_trip_time=rng.uniform(30, 600),
+            timestamp=start + timedelta(seconds=i * 30),
+        )
+        reports.append((observation, calculator.calculate_from_single_observation(observation)))
+    return reports
+
+
+def run_load_test(
+    api_url: str,
+    count: int = 1000,
+    max_concurrency: int = 8,
+    api_key: str = "load-test",
+    retry_policy: RetryPolicy | None = None,
+) -> SubmissionReport:
+    """
+    Submit synthetic observations through ``WildlifeReporter`` and measure them.
+
+    Args:
+        api_url: Observation endpoint, usually ``MockWildlifeServer.api_url``
+        count: Number of observations to submit
+        max_concurrency: Requests in flight
+        api_key: Bearer token to send
+        retry_policy: Backoff policy for throttled/failed requests
+
+    Returns:
+        SubmissionReport with throughput and latency percentiles
+    """
+    reporter = WildlifeReporter(waarneming_api_url=api_url)
+    return reporter.report_bulk_to_waarneming(
+        synthetic_reports(count),
+        api_key=api_key,
+        max_concurrency=max_concurrency,
+        retry_policy=retry_policy,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Start a mock server and run a load test against it."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000, help="observations to submit")
+    parser.add_argument("--concurrency", type=int, default=8, help="requests in flight")
+    parser.add_argument("--latency", type=float, default=0.02, help="server latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.01, help="extra random latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 503s")
+    parser.add_argument("--rate-limit", type=float, default=None, help="requests/s before 429")
+    parser.add_argument(
+        "--serve", action="store_true", help="only run the server until interrupted"
+    )
+    parser.add_argument("--port", type=int, default=0, help="port to bind (default: any)")
+    args = parser.parse_args(argv)
+
+    config = MockServerConfig(
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        retry_after=0.1,
+        seed=0,
+    )
+    with MockWildlifeServer(config, port=args.port) as server:
+        if args.serve:
+            print(f"Mock Waarneming.nl API listening on {server.api_url}")
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                return
+
+        report = run_load_test(
+            server.api_url,
+            count=args.count,
+            max_concurrency=args.concurrency,
+            retry_policy=RetryPolicy(max_retries=8, backoff_base=0.05, backoff_max=2.0),
+        )
+        print(report.summary())
+        print(f"  Server responses: {dict(sorted(server.status_counts.items()))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,19 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+import numpy as np
 
-@dataclass
+_new = object.__new__
+
+
+@dataclass(slots=True)
 class Observation:
-    """A single hornet observation with tracking data."""
+    """
+    A single hornet observation with tracking data.
+
+    Values are validated on construction; rows that were validated before
+    (archives, binary files) can skip that with ``trusted()``.
+    """
 
     latitude: float  # -90 to 90
     longitude: float  # -180 to 180
@@ -16,6 +25,7 @@ class Observation:
     timestamp: datetime = None
     notes: str = ""
     hornet_color_mark: str | None = None  # Track individual hornets
+    temperature: float | None = None  # °C at observation time (optional, for distance models)
 
     def __post_init__(self):
         """Validate input data."""
@@ -33,11 +43,44 @@ class Observation:
             raise ValueError(f"Round trip time must be positive, got {self.round_trip_time}")
         if self.speed is not None and self.speed <= 0:
             raise ValueError(f"Speed must be positive, got {self.speed}")
+        if self.temperature is not None and not -40 <= self.temperature <= 60:
+            raise ValueError(f"Temperature must be between -40 and 60 °C, got {self.temperature}")
 
         # Normalize bearing: 360° equals 0° in compass notation (using tolerance for float comparison)
         if abs(self.bearing - 360.0) < 1e-9:
             self.bearing = 0.0
 
+    @classmethod
+    def trusted(
+        cls,
+        latitude: float,
+        longitude: float,
+        bearing: float,
+        round_trip_time: float,
+        speed: float | None,
+        timestamp: datetime | None,
+        notes: str = "",
+        hornet_color_mark: str | None = None,
+        temperature: float | None = None,
+    ) -> "Observation":
+        """
+        Build an observation from values that were already validated.
+
+        Skips ``__post_init__``: no range checks, no bearing normalization and
+        no default timestamp. Only for rows that passed validation before.
+        """
+        observation = _new(cls)
+        observation.latitude = latitude
+        observation.longitude = longitude
+        observation.bearing = bearing
+        observation.round_trip_time = round_trip_time
+        observation.speed = speed
+        observation.timestamp = timestamp
+        observation.notes = notes
+        observation.hornet_color_mark = hornet_color_mark
+        observation.temperature = temperature
+        return observation
+
     @property
     def estimated_distance_empirical(self) -> float:
         """
@@ -84,7 +127,7 @@ class Observation:
         return self.estimated_distance_empirical
 
 
-@dataclass
+@dataclass(slots=True)
 class HiveLocation:
     """Calculated hive location from observations."""
 
@@ -111,3 +154,33 @@ class HiveLocation:
             f"  Confidence: ±{self.confidence_radius:.0f}m\n"
             f"  Method: {self.calculation_method}"
         )
+
+
+@dataclass
+class HiveLocationBatch:
+    """Hive locations calculated for many observations, stored as columns."""
+
+    latitude: np.ndarray
+    longitude: np.ndarray
+    confidence_radius: np.ndarray  # meters
+    distance_from_observer: np.ndarray  # meters
+    bearing_from_observer: np.ndarray  # degrees
+    calculation_method: str = "single_observation_empirical"
+
+    def __len__(self) -> int:
+        return len(self.latitude)
+
+    def to_hive_locations(self) -> list[HiveLocation]:
+        """Materialize the batch as HiveLocation objects (all stamped with the same time)."""
+        method, now = self.calculation_method, datetime.now()
+        return [
+            HiveLocation(lat, lon, radius, distance, bearing, method, now)
+            for lat, lon, radius, distance, bearing in zip(
+                self.latitude.tolist(),
+                self.longitude.tolist(),
+                self.confidence_radius.tolist(),
+                self.distance_from_observer.tolist(),
+                self.bearing_from_observer.tolist(),
+                strict=True,
+            )
+        ]
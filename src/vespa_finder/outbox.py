@@ -0,0 +1,329 @@
+"""Durable offline outbox for wildlife reports.
+
+Reports that cannot be submitted (no connectivity in the field) are stored in
+a local SQLite database and submitted later by a background drainer. Each
+report is keyed by an idempotency key derived from its observation, so the
+same observation is never queued or submitted twice.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from .bulk_submit import RateLimiter, RetryPolicy, WaarnemingBulkSubmitter
+from .models import Observation
+
+logger = logging.getLogger(__name__)
+
+
+def idempotency_key(observation: Observation, database: str = "waarneming") -> str:
+    """
+    Derive a stable key identifying an observation report.
+
+    Coordinates are rounded to ~0.1 m and times to the second, so re-entering
+    the same field record produces the same key.
+
+    Args:
+        observation: Observation being reported
+        database: Target database id
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = "|".join(
+        [
+            database,
+            f"{observation.latitude:.6f}",
+            f"{observation.longitude:.6f}",
+            f"{observation.bearing:.1f}",
+            f"{observation.round_trip_time:.1f}",
+            observation.timestamp.isoformat(timespec="seconds"),
+            observation.hornet_color_mark or "",
+        ]
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class OutboxItem:
+    """A queued report."""
+
+    rowid: int
+    key: str
+    database: str
+    payload: dict
+    attempts: int
+
+
+@dataclass
+class DrainResult:
+    """Counts from one pass over the outbox."""
+
+    sent: int = 0
+    failed: int = 0  # Rejected permanently (e.g. HTTP 400)
+    deferred: int = 0  # Rescheduled for a later attempt
+    offline: bool = False  # Stopped early because the API was unreachable
+
+
+class ReportOutbox:
+    """
+    Persistent queue of reports awaiting submission, backed by SQLite.
+
+    Items are read in fixed-size pages, so outboxes with tens of thousands of
+    entries are never loaded into memory at once. The database runs in WAL
+    mode with ``synchronous=NORMAL``; ``enqueue_many`` writes a whole batch in
+    one transaction so fsyncs are amortized over the batch.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS outbox (
+            rowid INTEGER PRIMARY KEY,
+            key TEXT NOT NULL UNIQUE,
+            database TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL DEFAULT 0,
+            created_at REAL NOT NULL,
+            remote_id TEXT,
+            last_error TEXT
+        );
+        CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) an outbox.
+
+        Args:
+            path: SQLite database file, or ":memory:" for a transient outbox
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(
+        self, observation: Observation, payload: dict, database: str = "waarneming"
+    ) -> bool:
+        """
+        Queue a report unless the same observation is already known.
+
+        Args:
+            observation: Observation the report describes (used for the idempotency key)
+            payload: Prepared submission data
+            database: Target database id
+
+        Returns:
+            True if queued, False if it was a duplicate
+        """
+        return self.enqueue_many([(observation, payload)], database=database) == 1
+
+    def enqueue_many(
+        self, reports: Iterable[tuple[Observation, dict]], database: str = "waarneming"
+    ) -> int:
+        """
+        Queue many reports in a single transaction.
+
+        Args:
+            reports: (observation, payload) pairs
+            database: Target database id
+
+        Returns:
+            Number of newly queued reports (duplicates are skipped)
+        """
+        now = time.time()
+        rows = (
+            (idempotency_key(observation, database), database, json.dumps(payload), now)
+            for observation, payload in reports
+        )
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            cursor = self._conn.executemany(
+                "INSERT OR IGNORE INTO outbox (key, database, payload, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            return cursor.rowcount
+
+    def count(self, status: str = STATUS_PENDING) -> int:
+        """Number of items with the given status."""
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE status = ?", (status,)
+            ).fetchone()
+        return count
+
+    def iter_due(self, batch_size: int = 500, now: float | None = None) -> Iterator[OutboxItem]:
+        """
+        Iterate over pending items whose next attempt is due, oldest first.
+
+        Items are fetched ``batch_size`` at a time using keyset pagination, so
+        memory use does not grow with the size of the outbox.
+        """
+        now = time.time() if now is None else now
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT rowid, key, database, payload, attempts FROM outbox "
+                    "WHERE status = ? AND next_attempt_at <= ? AND rowid > ? "
+                    "ORDER BY rowid LIMIT ?",
+                    (self.STATUS_PENDING, now, last_rowid, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for rowid, key, database, payload, attempts in rows:
+                yield OutboxItem(rowid, key, database, json.loads(payload), attempts)
+            last_rowid = rows[-1][0]
+
+    def mark_sent(self, key: str, remote_id: str | int | None = None) -> None:
+        """Record a successful submission."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = attempts + 1, remote_id = ?, "
+                "last_error = NULL WHERE key = ?",
+                (self.STATUS_SENT, None if remote_id is None else str(remote_id), key),
+            )
+
+    def mark_retry(self, key: str, error: str, retry_at: float) -> None:
+        """Record a failed attempt and schedule the next one."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET attempts = attempts + 1, last_error = ?, "
+                "next_attempt_at = ? WHERE key = ?",
+                (error, retry_at, key),
+            )
+
+    def mark_failed(self, key: str, error: str) -> None:
+        """Record a permanent failure; the item will not be retried."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = attempts + 1, last_error = ? "
+                "WHERE key = ?",
+                (self.STATUS_FAILED, error, key),
+            )
+
+    def purge_sent(self) -> int:
+        """Delete submitted items. Their keys are forgotten, so they could be re-queued."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM outbox WHERE status = ?", (self.STATUS_SENT,))
+            return cursor.rowcount
+
+
+class OutboxDrainer:
+    """
+    Submit queued Waarneming.nl reports in the background when online.
+
+    Each pass submits due items at a limited rate, then the drainer sleeps for
+    ``poll_interval`` (or until ``notify`` is called). If the API is
+    unreachable the pass stops early; rejected items are marked failed and
+    other failures are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        outbox: ReportOutbox,
+        submitter: WaarnemingBulkSubmitter,
+        rate: float = 2.0,
+        batch_size: int = 200,
+        poll_interval: float = 60.0,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        """
+        Initialize the drainer.
+
+        Args:
+            outbox: Outbox to drain
+            submitter: Submitter used for each request (its own retries apply per attempt)
+            rate: Maximum submissions per second
+            batch_size: Items read from the outbox per query
+            poll_interval: Seconds between passes
+            retry_policy: Backoff between attempts of the same item
+        """
+        self.outbox = outbox
+        self.submitter = submitter
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retry_policy = retry_policy or RetryPolicy(backoff_base=30.0, backoff_max=3600.0)
+        self._limiter = RateLimiter(rate)
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def drain_once(self) -> DrainResult:
+        """Submit every item that is currently due."""
+        result = DrainResult()
+        for item in self.outbox.iter_due(batch_size=self.batch_size):
+            if self._stop.is_set():
+                break
+            if item.database != "waarneming":
+                continue
+
+            self._limiter.acquire()
+            outcome = self.submitter.submit_one(item.payload, index=item.rowid)
+            if outcome.success:
+                self.outbox.mark_sent(item.key, outcome.observation_id)
+                result.sent += 1
+            elif outcome.status_code is None or outcome.status_code in (
+                self.retry_policy.retry_statuses
+            ):
+                retry_at = time.time() + self.retry_policy.delay(item.attempts)
+                self.outbox.mark_retry(item.key, outcome.error or "", retry_at)
+                result.deferred += 1
+                if outcome.status_code is None:
+                    result.offline = True
+                    break
+            else:
+                self.outbox.mark_failed(item.key, outcome.error or "")
+                result.failed += 1
+        return result
+
+    def start(self) -> None:
+        """Start draining in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="outbox-drainer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def notify(self) -> None:
+        """Wake the drainer early, e.g. after queueing a report or regaining connectivity."""
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                result = self.drain_once()
+            except Exception:
+                logger.exception("Outbox drain pass failed")
+                result = DrainResult(offline=True)
+
+            if result.sent or result.failed:
+                logger.info(f"Outbox drained: {result.sent} sent, {result.failed} rejected")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
@@ -0,0 +1,442 @@
+"""Apache Arrow / Parquet export and import of campaign data.
+
+Requires the optional ``pyarrow`` dependency
+(``pip install "vespa-finder[parquet]"``); it is imported on first use.
+
+Observations are written with a fixed schema: ``float64`` coordinates and
+measurements, nullable ``speed`` and ``temperature``, ``timestamp[us]``
+timestamps (aware values are converted to UTC and their UTC offset is kept in
+the nullable ``tz_offset`` column, in seconds), and dictionary-encoded
+``hornet_color_mark`` and ``calculation_method`` columns. Files written
+before the temperature column existed read it as null. Data is written one
+record batch (row group) at a time; archive exports and imports move whole
+column arrays and never create per-row Python objects.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime, timedelta, timezone
+from itertools import batched
+
+import numpy as np
+
+from .__version__ import __version__
+from .archive import ArchiveSlice, ObservationArchive
+from .binary_format import NAIVE_TIMESTAMP
+from .models import HiveLocation, HiveLocationBatch, Observation
+
+DEFAULT_ROW_GROUP_SIZE = 65536
+
+
+def _import_pyarrow():
+    """Import pyarrow and pyarrow.parquet, with an actionable error if missing."""
+    try:
+        import pyarrow as pa  # noqa: PLC0415 - optional dependency
+        import pyarrow.parquet as pq  # noqa: PLC0415
+    except ImportError as e:
+        raise ImportError(
+            'Parquet support requires pyarrow. Install it with: pip install "vespa-finder[parquet]"'
+        ) from e
+    return pa, pq
+
+
+def observation_schema():
+    """Arrow schema used for observation files."""
+    pa, _ = _import_pyarrow()
+    return pa.schema(
+        [
+            pa.field("latitude", pa.float64(), nullable=False),
+            pa.field("longitude", pa.float64(), nullable=False),
+            pa.field("bearing", pa.float64(), nullable=False),
+            pa.field("round_trip_time", pa.float64(), nullable=False),
+            pa.field("speed", pa.float64()),
+            pa.field("temperature", pa.float64()),
+            pa.field("timestamp", pa.timestamp("us"), nullable=False),
+            pa.field("tz_offset", pa.int32()),  # seconds east of UTC, null if naive
+            pa.field("notes", pa.string()),
+            pa.field("hornet_color_mark", pa.dictionary(pa.int32(), pa.string())),
+        ],
+        metadata={"vespa_finder.kind": "observations", "vespa_finder.version": __version__},
+    )
+
+
+def hive_location_schema():
+    """Arrow schema used for hive location files."""
+    pa, _ = _import_pyarrow()
+    return pa.schema(
+        [
+            pa.field("latitude", pa.float64(), nullable=False),
+            pa.field("longitude", pa.float64(), nullable=False),
+            pa.field("confidence_radius", pa.float64(), nullable=False),
+            pa.field("distance_from_observer", pa.float64(), nullable=False),
+            pa.field("bearing_from_observer", pa.float64(), nullable=False),
+            pa.field("calculation_method", pa.dictionary(pa.int32(), pa.string())),
+            pa.field("timestamp", pa.timestamp("us")),
+        ],
+        metadata={"vespa_finder.kind": "hive_locations", "vespa_finder.version": __version__},
+    )
+
+
+def _naive_utc(timestamp: datetime | None) -> datetime | None:
+    if timestamp is not None and timestamp.tzinfo is not None:
+        return timestamp.astimezone(UTC).replace(tzinfo=None)
+    return timestamp
+
+
+def _utc_offset(timestamp: datetime | None) -> int | None:
+    if timestamp is None or timestamp.tzinfo is None:
+        return None
+    return int(timestamp.utcoffset().total_seconds())
+
+
+def _dictionary_column(pa, codes: np.ndarray, dictionary: list[str]):
+    """Dictionary array from 1-based codes, where 0 means null."""
+    codes = np.asarray(codes)
+    indices = pa.array((codes.astype(np.int64) - 1).astype(np.int32), mask=codes == 0)
+    return pa.DictionaryArray.from_arrays(indices, pa.array(dictionary, type=pa.string()))
+
+
+def _encode_strings(values: Iterable[str | None]) -> tuple[np.ndarray, list[str]]:
+    """Dictionary-encode strings as 1-based codes (0 for None)."""
+    dictionary: dict[str, int] = {}
+    codes = [0 if v is None else dictionary.setdefault(v, len(dictionary) + 1) for v in values]
+    return np.array(codes, dtype=np.uint32), list(dictionary)
+
+
+def _observation_batch(pa, schema, chunk: tuple[Observation, ...]):
+    mark_codes, marks = _encode_strings(o.hornet_color_mark for o in chunk)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array([o.latitude for o in chunk], type=pa.float64()),
+            pa.array([o.longitude for o in chunk], type=pa.float64()),
+            pa.array([o.bearing for o in chunk], type=pa.float64()),
+            pa.array([o.round_trip_time for o in chunk], type=pa.float64()),
+            pa.array([o.speed for o in chunk], type=pa.float64()),
+            pa.array([o.temperature for o in chunk], type=pa.float64()),
+            pa.array([_naive_utc(o.timestamp) for o in chunk], type=pa.timestamp("us")),
+            pa.array([_utc_offset(o.timestamp) for o in chunk], type=pa.int32()),
+            pa.array([o.notes for o in chunk], type=pa.string()),
+            _dictionary_column(pa, mark_codes, marks),
+        ],
+        schema=schema,
+    )
+
+
+def _slice_batch(pa, schema, columns: ArchiveSlice, marks: list[str]):
+    speed = np.asarray(columns.speed)
+    temperature = np.asarray(columns.temperature)
+    tz_offset = np.asarray(columns.tz_offset)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(columns.latitude),
+            pa.array(columns.longitude),
+            pa.array(columns.bearing),
+            pa.array(columns.round_trip_time),
+            pa.array(speed, mask=np.isnan(speed)),
+            pa.array(temperature, mask=np.isnan(temperature)),
+            pa.array(columns.timestamp, type=pa.timestamp("us")),
+            pa.array(tz_offset, mask=tz_offset == NAIVE_TIMESTAMP),
+            pa.nulls(len(columns), type=pa.string()),  # Notes are not archived
+            _dictionary_column(pa, columns.mark, marks),
+        ],
+        schema=schema,
+    )
+
+
+def write_observations_parquet(
+    path: str,
+    observations: Iterable[Observation],
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "zstd",
+) -> int:
+    """
+    Write observations to a Parquet file, one row group per ``row_group_size`` rows.
+
+    Args:
+        path: Output file
+        observations: Observations (consumed lazily)
+        row_group_size: Rows per record batch / row group
+        compression: Parquet compression codec
+
+    Returns:
+        Number of rows written
+    """
+    pa, pq = _import_pyarrow()
+    schema = observation_schema()
+    count = 0
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        for chunk in batched(observations, row_group_size):
+            _write_row_group(pa, writer, _observation_batch(pa, schema, chunk))
+            count += len(chunk)
+    return count
+
+
+def export_archive_parquet(
+    source: ObservationArchive | ArchiveSlice,
+    path: str,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "zstd",
+) -> int:
+    """
+    Export an archive (or a time-range slice of one) to Parquet.
+
+    Column arrays are handed to Arrow directly from the memory-mapped files,
+    one row group at a time.
+
+    Args:
+        source: Archive or ArchiveSlice to export
+        path: Output file
+        row_group_size: Rows per record batch / row group
+        compression: Parquet compression codec
+
+    Returns:
+        Number of rows written
+    """
+    pa, pq = _import_pyarrow()
+    schema = observation_schema()
+    if isinstance(source, ObservationArchive):
+        source = source.rows(0, len(source))
+    marks = source.marks
+
+    total = len(source)
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        for start in range(0, total, row_group_size):
+            stop = min(start + row_group_size, total)
+            chunk = ArchiveSlice(
+                {name: column[start:stop] for name, column in source.columns.items()},
+                marks,
+                source.start + start,
+            )
+            _write_row_group(pa, writer, _slice_batch(pa, schema, chunk, marks))
+    return total
+
+
+def write_hive_locations_parquet(
+    path: str,
+    locations: Iterable[HiveLocation] | HiveLocationBatch,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "zstd",
+) -> int:
+    """
+    Write hive locations (objects or a HiveLocationBatch) to a Parquet file.
+
+    Returns:
+        Number of rows written
+    """
+    pa, pq = _import_pyarrow()
+    schema = hive_location_schema()
+    count = 0
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        if isinstance(locations, HiveLocationBatch):
+            total = len(locations)
+            for start in range(0, total, row_group_size):
+                stop = min(start + row_group_size, total)
+                numeric = [
+                    pa.array(np.asarray(getattr(locations, name)[start:stop], dtype=float))
+                    for name in schema.names[:5]
+                ]
+                batch = pa.RecordBatch.from_arrays(
+                    [
+                        *numeric,
+                        _dictionary_column(
+                            pa,
+                            np.ones(stop - start, dtype=np.uint32),
+                            [locations.calculation_method],
+                        ),
+                        pa.nulls(stop - start, type=pa.timestamp("us")),
+                    ],
+                    schema=schema,
+                )
+                _write_row_group(pa, writer, batch)
+            return total
+
+        for chunk in batched(locations, row_group_size):
+            method_codes, methods = _encode_strings(h.calculation_method for h in chunk)
+            _write_row_group(
+                pa,
+                writer,
+                pa.RecordBatch.from_arrays(
+                    [
+                        pa.array([h.latitude for h in chunk], type=pa.float64()),
+                        pa.array([h.longitude for h in chunk], type=pa.float64()),
+                        pa.array([h.confidence_radius for h in chunk], type=pa.float64()),
+                        pa.array([h.distance_from_observer for h in chunk], type=pa.float64()),
+                        pa.array([h.bearing_from_observer for h in chunk], type=pa.float64()),
+                        _dictionary_column(pa, method_codes, methods),
+                        pa.array([_naive_utc(h.timestamp) for h in chunk], type=pa.timestamp("us")),
+                    ],
+                    schema=schema,
+                ),
+            )
+            count += len(chunk)
+    return count
+
+
+def _write_row_group(pa, writer, batch) -> None:
+    """Write one record batch as one row group."""
+    writer.write_table(pa.Table.from_batches([batch]), row_group_size=batch.num_rows)
+
+
+def _iter_batches(path: str, batch_size: int):
+    _, pq = _import_pyarrow()
+    return pq.ParquetFile(path).iter_batches(batch_size=batch_size)
+
+
+def iter_parquet_columns(
+    path: str, batch_size: int = DEFAULT_ROW_GROUP_SIZE
+) -> Iterator[dict[str, np.ndarray | list]]:
+    """
+    Stream a Parquet file as dictionaries of NumPy columns.
+
+    Numeric and timestamp columns become arrays (nulls as NaN / NaT);
+    string and dictionary columns become lists with None for nulls.
+
+    Args:
+        path: Parquet file written by this module (or with compatible columns)
+        batch_size: Maximum rows per yielded batch
+    """
+    pa, _ = _import_pyarrow()
+    for batch in _iter_batches(path, batch_size):
+        columns = {}
+        for name, column in zip(batch.schema.names, batch.columns, strict=True):
+            if pa.types.is_dictionary(column.type) or pa.types.is_string(column.type):
+                columns[name] = column.to_pylist()
+            else:
+                columns[name] = column.to_numpy(zero_copy_only=False)
+        yield columns
+
+
+def read_observations_parquet(
+    path: str, batch_size: int = DEFAULT_ROW_GROUP_SIZE
+) -> list[Observation]:
+    """Read all observations from a Parquet file."""
+    observations = []
+    for columns in iter_parquet_columns(path, batch_size=batch_size):
+        count = len(columns["latitude"])
+        notes = columns.get("notes") or [None] * count
+        marks = columns.get("hornet_color_mark") or [None] * count
+        temperatures = columns.get("temperature", np.full(count, np.nan))
+        offsets = columns.get("tz_offset", np.full(count, np.nan))  # NaN where naive
+        zones = {
+            offset: timezone(timedelta(seconds=offset))
+            for offset in np.unique(offsets[~np.isnan(offsets)]).astype(int).tolist()
+        }
+        for lat, lon, bearing, rtt, speed, timestamp, offset, note, mark, temperature in zip(
+            columns["latitude"].tolist(),
+            columns["longitude"].tolist(),
+            columns["bearing"].tolist(),
+            columns["round_trip_time"].tolist(),
+            columns["speed"].tolist(),
+            columns["timestamp"].astype("M8[us]").tolist(),
+            offsets.tolist(),
+            notes,
+            marks,
+            temperatures.tolist(),
+            strict=True,
+        ):
+            observations.append(
+                Observation(
+                    latitude=lat,
+                    longitude=lon,
+                    bearing=bearing,
+                    round_trip_time=rtt,
+                    speed=None if speed != speed else speed,  # NaN check
+                    timestamp=timestamp
+                    if offset != offset  # NaN check: naive
+                    else timestamp.replace(tzinfo=UTC).astimezone(zones[int(offset)]),
+                    notes=note if note is not None else "",
+                    hornet_color_mark=mark,
+                    temperature=None if temperature != temperature else temperature,
+                )
+            )
+    return observations
+
+
+def read_hive_locations_parquet(
+    path: str, batch_size: int = DEFAULT_ROW_GROUP_SIZE
+) -> list[HiveLocation]:
+    """Read all hive locations from a Parquet file."""
+    locations = []
+    for columns in iter_parquet_columns(path, batch_size=batch_size):
+        for lat, lon, radius, distance, bearing, method, timestamp in zip(
+            columns["latitude"].tolist(),
+            columns["longitude"].tolist(),
+            columns["confidence_radius"].tolist(),
+            columns["distance_from_observer"].tolist(),
+            columns["bearing_from_observer"].tolist(),
+            columns["calculation_method"],
+            columns["timestamp"].astype("M8[us]").tolist(),
+            strict=True,
+        ):
+            locations.append(
+                HiveLocation(
+                    latitude=lat,
+                    longitude=lon,
+                    confidence_radius=radius,
+                    distance_from_observer=distance,
+                    bearing_from_observer=bearing,
+                    calculation_method=method or "single_observation_empirical",
+                    timestamp=timestamp,
+                )
+            )
+    return locations
+
+
+def import_parquet_to_archive(
+    path: str, archive: ObservationArchive, batch_size: int = DEFAULT_ROW_GROUP_SIZE
+) -> int:
+    """
+    Append the observations of a Parquet file to an archive, batch by batch.
+
+    Columns are converted to NumPy arrays; color marks are remapped onto the
+    archive's mark dictionary per batch dictionary, not per row. Notes are dropped;
+    a missing temperature column is imported as unknown.
+
+    Returns:
+        Number of rows appended
+    """
+    pa, _ = _import_pyarrow()
+    total = 0
+    for batch in _iter_batches(path, batch_size):
+        columns = {
+            name: batch.column(name).to_numpy(zero_copy_only=False)
+            for name in (
+                "latitude",
+                "longitude",
+                "bearing",
+                "round_trip_time",
+                "speed",
+                "timestamp",
+            )
+        }
+        if "temperature" in batch.schema.names:
+            columns["temperature"] = batch.column("temperature").to_numpy(zero_copy_only=False)
+        else:
+            columns["temperature"] = np.full(batch.num_rows, np.nan)
+        if "tz_offset" in batch.schema.names:
+            columns["tz_offset"] = (
+                batch.column("tz_offset").fill_null(NAIVE_TIMESTAMP).to_numpy(zero_copy_only=False)
+            )
+        else:
+            columns["tz_offset"] = np.full(batch.num_rows, NAIVE_TIMESTAMP, dtype=np.int32)
+
+        marks = list(archive.marks)
+        if "hornet_color_mark" in batch.schema.names:
+            mark_column = batch.column("hornet_color_mark")
+            if not pa.types.is_dictionary(mark_column.type):
+                mark_column = mark_column.dictionary_encode()
+            codes = {mark: i + 1 for i, mark in enumerate(marks)}
+            for mark in mark_column.dictionary.to_pylist():
+                if mark not in codes:
+                    marks.append(mark)
+                    codes[mark] = len(marks)
+            # Code 0 first, so null indices (-1 below) and empty dictionaries map to no mark
+            lookup = np.array(
+                [0, *(codes[mark] for mark in mark_column.dictionary.to_pylist())], dtype=np.uint32
+            )
+            indices = mark_column.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+            columns["mark"] = lookup[indices + 1]
+        else:
+            columns["mark"] = np.zeros(batch.num_rows, dtype=np.uint32)
+
+        total += archive.append_columns(columns, marks=marks)
+    return total
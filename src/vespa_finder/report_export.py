@@ -0,0 +1,124 @@
+"""Bulk export of wildlife database submissions for many observations."""
+
+import csv
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from .models import HiveLocation, Observation
+from .wildlife_api import observatoire_record, vespawatch_record, waarneming_payload
+
+
+@dataclass
+class BulkReportResult:
+    """Files written by a bulk export."""
+
+    count: int = 0
+    files: dict[str, str] = field(default_factory=dict)  # database id -> path
+
+
+class BulkReportWriter:
+    """
+    Write per-database submission files for a batch of observations.
+
+    Records are built by the same functions as ``WildlifeReporter``'s
+    per-observation reports: CSV files for the manual Vespawatch and
+    Observatoire portals and a JSON array of Waarneming.nl API payloads. All
+    three files are written in one streaming pass, with date/time strings
+    formatted once per distinct minute.
+    """
+
+    VESPAWATCH_FILE = "vespawatch.csv"
+    OBSERVATOIRE_FILE = "observatoire.csv"
+    WAARNEMING_FILE = "waarneming.json"
+
+    # Column order matches wildlife_api.vespawatch_record
+    VESPAWATCH_COLUMNS = (
+        "species",
+        "observation_date",
+        "observation_time",
+        "observer_location",
+        "estimated_hive_location",
+        "distance_from_observer",
+        "bearing",
+        "round_trip_time",
+        "method",
+        "confidence",
+        "notes",
+    )
+
+    # Column order matches wildlife_api.observatoire_record
+    OBSERVATOIRE_COLUMNS = (
+        "species",
+        "date_observation",
+        "heure_observation",
+        "lieu_observation",
+        "emplacement_nid_estime",
+        "distance_observateur",
+        "cap",
+        "temps_parcours",
+        "methode",
+        "precision",
+        "remarques",
+    )
+
+    def write(
+        self, reports: Iterable[tuple[Observation, HiveLocation]], output_dir: str
+    ) -> BulkReportResult:
+        """
+        Export reports for all databases.
+
+        Args:
+            reports: (observation, hive_location) pairs; consumed lazily
+            output_dir: Directory for the output files (created if missing)
+
+        Returns:
+            BulkReportResult with the record count and file paths
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        paths = {
+            "vespawatch": os.path.join(output_dir, self.VESPAWATCH_FILE),
+            "observatoire": os.path.join(output_dir, self.OBSERVATOIRE_FILE),
+            "waarneming": os.path.join(output_dir, self.WAARNEMING_FILE),
+        }
+
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        minute_cache: dict[tuple[int, int, int, int, int], tuple[str, str, str]] = {}
+
+        count = 0
+        with (
+            open(paths["vespawatch"], "w", newline="", encoding="utf-8") as vespawatch_file,
+            open(paths["observatoire"], "w", newline="", encoding="utf-8") as observatoire_file,
+            open(paths["waarneming"], "w", encoding="utf-8") as waarneming_file,
+        ):
+            vespawatch_row = csv.writer(vespawatch_file).writerow
+            observatoire_row = csv.writer(observatoire_file).writerow
+            write_json = waarneming_file.write
+
+            vespawatch_row(self.VESPAWATCH_COLUMNS)
+            observatoire_row(self.OBSERVATOIRE_COLUMNS)
+            write_json("[")
+
+            for observation, hive in reports:
+                ts = observation.timestamp
+                minute = (ts.year, ts.month, ts.day, ts.hour, ts.minute)
+                formatted = minute_cache.get(minute)
+                if formatted is None:
+                    formatted = (
+                        f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d}",
+                        f"{ts.day:02d}/{ts.month:02d}/{ts.year:04d}",
+                        f"{ts.hour:02d}:{ts.minute:02d}",
+                    )
+                    minute_cache[minute] = formatted
+                date_iso, date_fr, time_hm = formatted
+
+                vespawatch_row(vespawatch_record(observation, hive, date_iso, time_hm).values())
+                observatoire_row(observatoire_record(observation, hive, date_fr, time_hm).values())
+                write_json(",\n" if count else "\n")
+                write_json(encode(waarneming_payload(observation, hive, date_iso, time_hm)))
+                count += 1
+
+            write_json("\n]\n" if count else "]\n")
+
+        return BulkReportResult(count=count, files=paths)
@@ -0,0 +1,176 @@
+"""Ranked search plans for nest removal crews.
+
+Instead of sweeping a hive estimate's whole confidence disc, crews walk an
+ordered list of small search cells. ``search_surface`` turns hive estimates
+into a nest likelihood surface on a grid of such cells (e.g. 25 m), and
+``plan_search`` orders the most probable cells greedily: from the current
+position, walk next to the cell with the highest probability per meter of
+walking (plus one cell of searching). That front-loads the probability found
+per distance walked, and it is fast: a 2 km disc plans in well under a second.
+"""
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from .density import DensityGrid, kernel_density
+from .geo_utils import EARTH_RADIUS_METERS
+from .models import HiveLocation
+
+DEFAULT_CELL_SIZE = 25.0  # meters
+DEFAULT_COVERAGE = 0.95  # stop once the plan holds this share of the probability
+DEFAULT_MAX_CELLS = 4000
+
+_METERS_PER_DEGREE = math.radians(EARTH_RADIUS_METERS)
+
+
+@dataclass
+class SearchPlan:
+    """Search cells in walking order, stored as columns."""
+
+    latitude: np.ndarray  # cell centers
+    longitude: np.ndarray
+    probability: np.ndarray  # probability that the nest is in the cell
+    cumulative_probability: np.ndarray
+    walked: np.ndarray  # meters walked on arrival at the cell, from the start
+    cell_size: float  # meters
+
+    def __len__(self) -> int:
+        return len(self.latitude)
+
+    @property
+    def total_distance(self) -> float:
+        """Walking distance of the whole plan in meters."""
+        return float(self.walked[-1]) if len(self) else 0.0
+
+    def cells_for(self, probability: float) -> int:
+        """Number of cells to search to reach a cumulative probability (all if unreachable)."""
+        return min(
+            int(np.searchsorted(self.cumulative_probability, probability - 1e-12)) + 1, len(self)
+        )
+
+
+def search_surface(
+    hive_locations: Sequence[HiveLocation],
+    cell_size: float = DEFAULT_CELL_SIZE,
+    radius: float | None = None,
+    center: tuple[float, float] | None = None,
+) -> DensityGrid:
+    """
+    Nest likelihood over a disc, on a grid of search cells.
+
+    Each estimate contributes a Gaussian with its confidence radius as
+    standard deviation; cells outside the disc are zero.
+
+    Args:
+        hive_locations: One or more hive estimates
+        cell_size: Search cell size in meters
+        radius: Disc radius in meters (default: reaches three confidence radii
+            beyond every estimate)
+        center: Disc center (default: mean of the estimates)
+
+    Returns:
+        DensityGrid with square cells of about ``cell_size`` meters
+    """
+    if not hive_locations:
+        raise ValueError("Need at least one hive location")
+    latitude = np.array([h.latitude for h in hive_locations])
+    longitude = np.array([h.longitude for h in hive_locations])
+    sigma = np.array([h.confidence_radius for h in hive_locations])
+    if center is None:
+        center = (float(latitude.mean()), float(longitude.mean()))
+    center_lat, center_lon = center
+    meters_per_lon = _METERS_PER_DEGREE * math.cos(math.radians(center_lat))
+
+    if radius is None:
+        offsets = np.hypot(
+            (latitude - center_lat) * _METERS_PER_DEGREE, (longitude - center_lon) * meters_per_lon
+        )
+        radius = float((offsets + 3 * sigma).max())
+
+    size = max(1, math.ceil(2 * radius / cell_size))
+    half = size * cell_size / 2
+    bounds = (
+        center_lat - half / _METERS_PER_DEGREE,
+        center_lon - half / meters_per_lon,
+        center_lat + half / _METERS_PER_DEGREE,
+        center_lon + half / meters_per_lon,
+    )
+    grid = kernel_density(latitude, longitude, sigma, bounds=bounds, size=size)
+
+    rows, cols = grid.cell_centers()
+    north = (rows[:, None] - center_lat) * _METERS_PER_DEGREE
+    east = (cols[None, :] - center_lon) * meters_per_lon
+    grid.values[north**2 + east**2 > radius**2] = 0.0
+    return grid
+
+
+def plan_search(
+    surface: DensityGrid,
+    start: tuple[float, float] | None = None,
+    coverage: float = DEFAULT_COVERAGE,
+    max_cells: int = DEFAULT_MAX_CELLS,
+) -> SearchPlan:
+    """
+    Order search cells by probability found per meter walked (greedy).
+
+    Args:
+        surface: Likelihood surface, e.g. from ``search_surface`` or ``density.hive_density``
+        start: Crew's start position (default: most probable cell)
+        coverage: Plan cells until they hold this share of the probability
+        max_cells: Upper bound on the number of cells planned
+
+    Returns:
+        SearchPlan in walking order
+    """
+    values = surface.values
+    total = values.sum()
+    if total <= 0:
+        raise ValueError("Likelihood surface is empty")
+    height, width = surface.cell_size
+    center_lat = (surface.north + surface.south) / 2
+    cell_height = height * _METERS_PER_DEGREE
+    cell_width = width * _METERS_PER_DEGREE * math.cos(math.radians(center_lat))
+    cell_size = math.sqrt(cell_height * cell_width)
+
+    # Candidate cells: most probable first, until the coverage target is met
+    probability = values.ravel() / total
+    order = np.argsort(probability)[::-1]
+    count = int(np.searchsorted(np.cumsum(probability[order]), coverage - 1e-12)) + 1
+    order = order[: min(count, max_cells, np.count_nonzero(probability))]
+    rows, cols = np.divmod(order, values.shape[1])
+    candidate_p = probability[order]
+    candidate_x = cols * cell_width
+    candidate_y = -rows * cell_height
+
+    if start is None:
+        x, y = candidate_x[0], candidate_y[0]
+    else:
+        x = (start[1] - surface.west) / width * cell_width - cell_width / 2
+        y = -((surface.north - start[0]) / height * cell_height - cell_height / 2)
+
+    remaining = np.ones(len(order), dtype=bool)
+    visit = np.empty(len(order), dtype=np.intp)
+    walked = np.empty(len(order))
+    distance_walked = 0.0
+    for step in range(len(order)):
+        distance = np.hypot(candidate_x - x, candidate_y - y)
+        score = np.where(remaining, candidate_p / (distance + cell_size), -1.0)
+        best = int(np.argmax(score))
+        distance_walked += distance[best]
+        visit[step], walked[step] = best, distance_walked
+        remaining[best] = False
+        x, y = candidate_x[best], candidate_y[best]
+
+    latitudes, longitudes = surface.cell_centers()
+    planned_p = candidate_p[visit]
+    return SearchPlan(
+        latitude=latitudes[rows[visit]],
+        longitude=longitudes[cols[visit]],
+        probability=planned_p,
+        cumulative_probability=np.cumsum(planned_p),
+        walked=walked,
+        cell_size=cell_size,
+    )
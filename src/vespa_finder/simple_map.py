@@ -3,7 +3,7 @@
 import html
 import os
 
-from .geo_utils import destination_point
+from .geo_utils import geo_origin
 from .models import HiveLocation, Observation
 
 
@@ -238,8 +238,8 @@ class SimpleMapGenerator:
 
     def _get_arrow_endpoint(self, obs: Observation) -> str:
         """Calculate arrow endpoint coordinates."""
-        arrow_lat, arrow_lon = destination_point(
-            obs.latitude, obs.longitude, obs.bearing, self.FLIGHT_DIRECTION_ARROW_LENGTH_METERS
+        arrow_lat, arrow_lon = geo_origin(obs.latitude, obs.longitude).destination(
+            obs.bearing, self.FLIGHT_DIRECTION_ARROW_LENGTH_METERS
         )
         return f"{arrow_lat}, {arrow_lon}"
 
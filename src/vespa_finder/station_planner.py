@@ -0,0 +1,233 @@
+"""Recommend where to set the next bait station.
+
+Each observation constrains the nest to an ellipse around its single
+estimate: along the bearing by the round-trip timing error, across it by the
+bearing error at that distance. ``nest_posterior`` fuses these into one
+Gaussian (information-weighted) in local east/north meters. A new station at
+range ``r`` from the nest adds a bearing whose cross-track error is
+``r * sin(bearing uncertainty)``; by the matrix determinant lemma the
+posterior determinant shrinks by ``1 + vᵀPv / σ²``, where ``v`` is the unit
+vector across the new bearing, so candidates are scored in closed form,
+vectorized over the whole grid. ``recommend_stations`` returns the top-k.
+"""
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from .calculator import HiveCalculator
+from .distance_models import wall_clock_times
+from .geo_utils import EARTH_RADIUS_METERS
+from .models import Observation
+
+DEFAULT_SPACING = 50.0  # meters between candidate locations
+DEFAULT_MIN_DISTANCE = 100.0  # closer to the nest, bearings are poorly defined
+DEFAULT_MAX_DISTANCE = 1000.0  # beyond typical foraging range, bait stays unvisited
+DEFAULT_SEPARATION = 150.0  # minimum distance between recommended stations
+
+_METERS_PER_DEGREE = math.radians(EARTH_RADIUS_METERS)
+
+
+@dataclass
+class NestPosterior:
+    """Gaussian estimate of the nest position."""
+
+    latitude: float
+    longitude: float
+    covariance: np.ndarray  # 2x2, east/north in m²
+
+    @property
+    def area(self) -> float:
+        """Area of the one-sigma error ellipse in m²."""
+        return math.pi * math.sqrt(max(np.linalg.det(self.covariance), 0.0))
+
+    def offsets(self, latitude, longitude) -> tuple[np.ndarray, np.ndarray]:
+        """East and north offsets in meters of points from the nest estimate."""
+        east = (
+            (np.asarray(longitude, dtype=float) - self.longitude)
+            * _METERS_PER_DEGREE
+            * math.cos(math.radians(self.latitude))
+        )
+        north = (np.asarray(latitude, dtype=float) - self.latitude) * _METERS_PER_DEGREE
+        return east, north
+
+
+@dataclass
+class StationCandidates:
+    """Candidate station locations, best first, stored as columns."""
+
+    latitude: np.ndarray
+    longitude: np.ndarray
+    score: np.ndarray  # expected fractional reduction of the posterior area, 0..1
+    distance: np.ndarray  # meters from the nest estimate
+    bearing: np.ndarray  # expected flight bearing from the station to the nest, degrees
+    posterior: NestPosterior
+
+    def __len__(self) -> int:
+        return len(self.latitude)
+
+
+def nest_posterior(
+    observations: Sequence[Observation],
+    calculator: HiveCalculator | None = None,
+    method: str = "empirical",
+) -> NestPosterior:
+    """
+    Fuse observations into a Gaussian estimate of the nest position.
+
+    Args:
+        observations: One or more observations
+        calculator: Calculator for the single estimates (default: HiveCalculator())
+        method: "empirical" (recommended) or "theoretical"
+    """
+    if not observations:
+        raise ValueError("Need at least one observation")
+    calculator = calculator or HiveCalculator()
+    bearing = np.array([obs.bearing for obs in observations], dtype=float)
+    estimates = calculator.calculate_batch(
+        np.array([obs.latitude for obs in observations]),
+        np.array([obs.longitude for obs in observations]),
+        bearing,
+        np.array([obs.round_trip_time for obs in observations]),
+        speed=np.array(
+            [np.nan if obs.speed is None else obs.speed for obs in observations], dtype=float
+        ),
+        method=method,
+        timestamp=wall_clock_times(obs.timestamp for obs in observations),
+        temperature=np.array(
+            [np.nan if obs.temperature is None else obs.temperature for obs in observations],
+            dtype=float,
+        ),
+    )
+
+    # Split each confidence radius into its cross-track (bearing) and along-track part
+    floor = calculator.MIN_CONFIDENCE_RADIUS_METERS / math.sqrt(2)
+    cross = np.maximum(
+        estimates.distance_from_observer * math.sin(math.radians(calculator.BEARING_UNCERTAINTY)),
+        floor,
+    )
+    along = np.sqrt(np.maximum(estimates.confidence_radius**2 - cross**2, floor**2))
+
+    # Information matrices per observation, in east/north about the first estimate
+    theta = np.radians(bearing)
+    u = np.stack([np.sin(theta), np.cos(theta)], axis=1)
+    w = np.stack([np.cos(theta), -np.sin(theta)], axis=1)
+    information = (
+        u[:, :, None] * u[:, None, :] / along[:, None, None] ** 2
+        + w[:, :, None] * w[:, None, :] / cross[:, None, None] ** 2
+    )
+    reference = NestPosterior(
+        float(estimates.latitude[0]), float(estimates.longitude[0]), np.eye(2)
+    )
+    east, north = reference.offsets(estimates.latitude, estimates.longitude)
+    means = np.stack([east, north], axis=1)
+
+    covariance = np.linalg.inv(information.sum(axis=0))
+    mean_east, mean_north = covariance @ np.einsum("nij,nj->i", information, means)
+    return NestPosterior(
+        latitude=reference.latitude + float(mean_north) / _METERS_PER_DEGREE,
+        longitude=reference.longitude
+        + float(mean_east) / (_METERS_PER_DEGREE * math.cos(math.radians(reference.latitude))),
+        covariance=covariance,
+    )
+
+
+def area_reduction(
+    posterior: NestPosterior,
+    latitude,
+    longitude,
+    bearing_uncertainty: float = HiveCalculator.BEARING_UNCERTAINTY,
+) -> np.ndarray:
+    """
+    Expected fractional reduction of the posterior area from one more bearing.
+
+    Args:
+        posterior: Current nest estimate
+        latitude, longitude: Candidate station positions (arrays)
+        bearing_uncertainty: Bearing error of the new observation in degrees
+
+    Returns:
+        ``1 - sqrt(det P_new / det P)`` per candidate, in [0, 1)
+    """
+    east, north = posterior.offsets(latitude, longitude)
+    distance = np.hypot(east, north)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Unit vector across the bearing from the candidate to the nest
+        across_east, across_north = north / distance, -east / distance
+        cov = posterior.covariance
+        spread = (
+            cov[0, 0] * across_east**2
+            + 2 * cov[0, 1] * across_east * across_north
+            + cov[1, 1] * across_north**2
+        )
+        sigma = distance * math.sin(math.radians(bearing_uncertainty))
+        reduction = 1 - 1 / np.sqrt(1 + spread / sigma**2)
+    return np.where(distance > 0, reduction, 0.0)
+
+
+def recommend_stations(
+    observations: Sequence[Observation],
+    k: int = 5,
+    calculator: HiveCalculator | None = None,
+    method: str = "empirical",
+    spacing: float = DEFAULT_SPACING,
+    min_distance: float = DEFAULT_MIN_DISTANCE,
+    max_distance: float = DEFAULT_MAX_DISTANCE,
+    separation: float = DEFAULT_SEPARATION,
+) -> StationCandidates:
+    """
+    Best locations for the next bait station.
+
+    Candidates lie on a square grid around the current nest estimate, between
+    ``min_distance`` and ``max_distance`` from it. The best are picked greedily,
+    skipping candidates within ``separation`` of one already picked so the
+    recommendations are distinct places rather than neighbouring grid points.
+
+    Args:
+        observations: Observations so far
+        k: Number of locations to recommend
+        calculator: Calculator for the estimates (default: HiveCalculator())
+        method: "empirical" (recommended) or "theoretical"
+        spacing: Grid spacing in meters
+        min_distance, max_distance: Candidate range from the nest estimate in meters
+        separation: Minimum distance between recommendations in meters
+
+    Returns:
+        StationCandidates, best first (fewer than ``k`` if the grid runs out)
+    """
+    calculator = calculator or HiveCalculator()
+    posterior = nest_posterior(observations, calculator, method)
+
+    steps = np.arange(-max_distance, max_distance + spacing / 2, spacing)
+    east, north = (grid.ravel() for grid in np.meshgrid(steps, steps))
+    distance = np.hypot(east, north)
+    inside = (distance >= min_distance) & (distance <= max_distance)
+    east, north, distance = east[inside], north[inside], distance[inside]
+
+    latitude = posterior.latitude + north / _METERS_PER_DEGREE
+    longitude = posterior.longitude + east / (
+        _METERS_PER_DEGREE * math.cos(math.radians(posterior.latitude))
+    )
+    score = area_reduction(posterior, latitude, longitude, calculator.BEARING_UNCERTAINTY)
+
+    picked: list[int] = []
+    available = np.ones(len(score), dtype=bool)
+    for index in np.argsort(score, kind="stable")[::-1]:
+        if len(picked) == k:
+            break
+        if not available[index]:
+            continue
+        picked.append(index)
+        available &= np.hypot(east - east[index], north - north[index]) >= separation
+
+    picked = np.array(picked, dtype=np.intp)
+    return StationCandidates(
+        latitude=latitude[picked],
+        longitude=longitude[picked],
+        score=score[picked],
+        distance=distance[picked],
+        bearing=np.degrees(np.arctan2(-east[picked], -north[picked])) % 360,
+        posterior=posterior,
+    )
@@ -0,0 +1,312 @@
+"""Aggregate repeated round trips of individually marked hornets.
+
+A hornet marked with a color dot returns to the same bait station again and
+again; each round trip is a noisy sample of the same bearing and distance.
+``TrackAggregator`` groups observations by color mark and station and keeps
+streaming statistics per track (circular mean and concentration of the
+bearings, P² median of the round-trip times), each updated in O(1) time and
+memory per observation. A track's fused observation then gives one estimate
+from the calculator, and tracks of the same hornet from different stations
+are triangulated.
+"""
+
+import math
+from collections.abc import Iterable
+from datetime import datetime
+
+from .calculator import HiveCalculator
+from .circular import resultant_direction, von_mises_kappa
+from .models import HiveLocation, Observation
+
+DEFAULT_STATION_PRECISION = 4  # decimal places of lat/lon (~10 m) that identify a station
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate (Jain & Chlamtac's P² algorithm).
+
+    Keeps five markers instead of the samples; exact for up to five samples.
+    """
+
+    __slots__ = ("_desired", "_heights", "_increments", "_positions", "count", "quantile")
+
+    def __init__(self, quantile: float = 0.5):
+        self.quantile = quantile
+        self.count = 0
+        self._heights: list[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4.0]
+        self._increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    def add(self, value: float) -> None:
+        """Add one sample."""
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (
+                        positions[i + step] - positions[i]
+                    )
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> float | None:
+        """Current estimate (None before the first sample)."""
+        heights = self._heights
+        if not heights:
+            return None
+        if self.count <= 5:
+            rank = self.quantile * (len(heights) - 1)
+            low = math.floor(rank)
+            high = min(low + 1, len(heights) - 1)
+            return heights[low] + (rank - low) * (heights[high] - heights[low])
+        return heights[2]
+
+
+class Track:
+    """Streaming statistics of one marked hornet's round trips from one station."""
+
+    __slots__ = (
+        "_cos_sum",
+        "_lat_sum",
+        "_lon_sum",
+        "_sin_sum",
+        "_speed_count",
+        "_speed_sum",
+        "_temperature_count",
+        "_temperature_sum",
+        "count",
+        "first_seen",
+        "last_seen",
+        "mark",
+        "round_trip",
+        "station",
+    )
+
+    def __init__(self, mark: str, station: tuple[float, float]):
+        self.mark = mark
+        self.station = station
+        self.count = 0
+        self.round_trip = P2Quantile(0.5)
+        self.first_seen: datetime | None = None
+        self.last_seen: datetime | None = None
+        self._sin_sum = self._cos_sum = 0.0
+        self._lat_sum = self._lon_sum = 0.0
+        self._speed_sum = 0.0
+        self._speed_count = 0
+        self._temperature_sum = 0.0
+        self._temperature_count = 0
+
+    def add(self, observation: Observation) -> None:
+        """Add one round trip."""
+        self.count += 1
+        bearing = math.radians(observation.bearing)
+        self._sin_sum += math.sin(bearing)
+        self._cos_sum += math.cos(bearing)
+        self._lat_sum += observation.latitude
+        self._lon_sum += observation.longitude
+        self.round_trip.add(observation.round_trip_time)
+        if observation.speed is not None:
+            self._speed_sum += observation.speed
+            self._speed_count += 1
+        if observation.temperature is not None:
+            self._temperature_sum += observation.temperature
+            self._temperature_count += 1
+        timestamp = observation.timestamp
+        if self.first_seen is None or timestamp < self.first_seen:
+            self.first_seen = timestamp
+        if self.last_seen is None or timestamp > self.last_seen:
+            self.last_seen = timestamp
+
+    @property
+    def mean_bearing(self) -> float:
+        """Circular mean of the bearings in degrees."""
+        return float(resultant_direction(self._sin_sum, self._cos_sum))
+
+    @property
+    def resultant_length(self) -> float:
+        """Mean resultant length of the bearings (1 = identical, 0 = uniform)."""
+        return math.hypot(self._sin_sum, self._cos_sum) / self.count if self.count else 0.0
+
+    @property
+    def concentration(self) -> float:
+        """Von Mises concentration (kappa) estimate of the bearings."""
+        return float(von_mises_kappa(self.resultant_length, self.count)) if self.count else 0.0
+
+    @property
+    def median_round_trip(self) -> float | None:
+        """Streaming median of the round-trip times in seconds."""
+        return self.round_trip.value
+
+    @property
+    def mean_speed(self) -> float | None:
+        """Mean of the recorded speeds, if any."""
+        return self._speed_sum / self._speed_count if self._speed_count else None
+
+    @property
+    def mean_temperature(self) -> float | None:
+        """Mean of the recorded temperatures, if any."""
+        return self._temperature_sum / self._temperature_count if self._temperature_count else None
+
+    @property
+    def latitude(self) -> float:
+        return self._lat_sum / self.count
+
+    @property
+    def longitude(self) -> float:
+        return self._lon_sum / self.count
+
+    def to_observation(self) -> Observation:
+        """Fused observation: mean position and bearing, median round trip."""
+        return Observation(
+            latitude=self.latitude,
+            longitude=self.longitude,
+            bearing=self.mean_bearing,
+            round_trip_time=self.median_round_trip,
+            speed=self.mean_speed,
+            timestamp=self.last_seen,
+            temperature=self.mean_temperature,
+            notes=f"Fused from {self.count} round trips",
+            hornet_color_mark=self.mark,
+        )
+
+
+class TrackAggregator:
+    """Group observations into per-mark, per-station tracks."""
+
+    def __init__(
+        self,
+        calculator: HiveCalculator | None = None,
+        station_precision: int = DEFAULT_STATION_PRECISION,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            calculator: Calculator used for fused estimates
+            station_precision: Decimal places of latitude/longitude that identify
+                a station (observations rounding to the same position share it)
+        """
+        self.calculator = calculator or HiveCalculator()
+        self.station_precision = station_precision
+        self.tracks: dict[tuple[str, tuple[float, float]], Track] = {}
+        self.by_mark: dict[str, list[Track]] = {}
+        self.unmarked = 0
+
+    def station_of(self, observation: Observation) -> tuple[float, float]:
+        """Station key of an observation."""
+        return (
+            round(observation.latitude, self.station_precision),
+            round(observation.longitude, self.station_precision),
+        )
+
+    def add(self, observation: Observation) -> Track | None:
+        """
+        Add one observation to its track.
+
+        Returns:
+            The updated track, or None for observations without a color mark
+        """
+        mark = observation.hornet_color_mark
+        if not mark:
+            self.unmarked += 1
+            return None
+        key = (mark, self.station_of(observation))
+        track = self.tracks.get(key)
+        if track is None:
+            track = self.tracks[key] = Track(*key)
+            self.by_mark.setdefault(mark, []).append(track)
+        track.add(observation)
+        return track
+
+    def extend(self, observations: Iterable[Observation]) -> int:
+        """Add a stream of observations; returns how many were marked."""
+        return sum(self.add(observation) is not None for observation in observations)
+
+    def tracks_for(self, mark: str) -> list[Track]:
+        """All tracks of one mark, most round trips first."""
+        return sorted(self.by_mark.get(mark, ()), key=lambda track: track.count, reverse=True)
+
+    def marks(self) -> list[str]:
+        """Distinct marks seen so far."""
+        return sorted(self.by_mark)
+
+    def estimate_track(self, track: Track, method: str = "empirical") -> HiveLocation:
+        """Single estimate from a track's fused observation."""
+        hive = self.calculator.calculate_from_single_observation(track.to_observation(), method)
+        hive.calculation_method = f"track_{track.count}_trips_{method}"
+        return hive
+
+    def estimate(
+        self, mark: str, method: str = "empirical", min_trips: int = 1
+    ) -> HiveLocation | None:
+        """
+        Fused estimate for one marked hornet.
+
+        Tracks from a single station give a single-observation estimate;
+        tracks from two or more stations are triangulated.
+
+        Args:
+            mark: Color mark
+            method: "empirical" (recommended) or "theoretical"
+            min_trips: Ignore tracks with fewer round trips
+
+        Returns:
+            HiveLocation, or None if no track has enough round trips
+        """
+        tracks = [track for track in self.tracks_for(mark) if track.count >= min_trips]
+        if not tracks:
+            return None
+        if len(tracks) == 1:
+            return self.estimate_track(tracks[0], method)
+        observations = [track.to_observation() for track in tracks]
+        estimates = [
+            self.calculator.calculate_from_single_observation(observation, method)
+            for observation in observations
+        ]
+        return self.calculator.triangulate_estimates(observations, estimates, method=method)
+
+    def estimates(self, method: str = "empirical", min_trips: int = 1) -> dict[str, HiveLocation]:
+        """Fused estimate per mark (marks without enough round trips are left out)."""
+        results = {}
+        for mark in self.marks():
+            hive = self.estimate(mark, method=method, min_trips=min_trips)
+            if hive is not None:
+                results[mark] = hive
+        return results
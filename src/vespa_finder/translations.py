@@ -70,6 +70,29 @@ Click 'View Map' to reopen""",
         "save_error_message": "Could not save:\n{error}",
         "map_error_title": "Map Error",
         "map_error_message": "Could not generate map:\n{error}",
+        # Background task status
+        "status_ready": "Ready",
+        "status_calculating": "Calculating hive location...",
+        "status_rendering_map": "Rendering map...",
+        "status_opening_map": "Opening map in browser...",
+        # Live preview
+        "live_preview": "Live preview (no map)",
+        "live_preview_result": "≈ {coordinates}\n   {distance:.0f} m, ±{radius:.0f} m",
+        "live_preview_invalid": "Enter valid values to preview",
+        # Session panel
+        "session_panel_title": "SESSION OBSERVATIONS",
+        "session_col_index": "#",
+        "session_col_time": "Time",
+        "session_col_position": "Position",
+        "session_col_bearing": "Bearing",
+        "session_col_round_trip": "Round trip",
+        "session_col_distance": "Distance",
+        "session_col_mark": "Mark",
+        "session_select_all": "Select All",
+        "session_clear_selection": "Deselect All",
+        "session_map_selection": "Map Selection",
+        "session_select_more": "{count} selected - select at least 2 observations to triangulate",
+        "session_estimate": "🎯 Triangulated ({count} obs): {coordinates} ±{radius:.0f} m",
         "gps_help_title": "GPS Help",
         "gps_help_message": """Right-click on your location in Google Maps
 and select 'What's here?' to get coordinates.
@@ -197,6 +220,29 @@ Cliquez sur 'Voir la Carte' pour rouvrir""",
         "save_error_message": "Impossible de sauvegarder :\n{error}",
         "map_error_title": "Erreur de Carte",
         "map_error_message": "Impossible de générer la carte :\n{error}",
+        # Statut des tâches en arrière-plan
+        "status_ready": "Prêt",
+        "status_calculating": "Calcul de la position du nid...",
+        "status_rendering_map": "Génération de la carte...",
+        "status_opening_map": "Ouverture de la carte dans le navigateur...",
+        # Aperçu en direct
+        "live_preview": "Aperçu en direct (sans carte)",
+        "live_preview_result": "≈ {coordinates}\n   {distance:.0f} m, ±{radius:.0f} m",
+        "live_preview_invalid": "Saisissez des valeurs valides pour l'aperçu",
+        # Panneau de session
+        "session_panel_title": "OBSERVATIONS DE LA SESSION",
+        "session_col_index": "#",
+        "session_col_time": "Heure",
+        "session_col_position": "Position",
+        "session_col_bearing": "Cap",
+        "session_col_round_trip": "Aller-retour",
+        "session_col_distance": "Distance",
+        "session_col_mark": "Marque",
+        "session_select_all": "Tout Sélectionner",
+        "session_clear_selection": "Tout Désélectionner",
+        "session_map_selection": "Carte de la Sélection",
+        "session_select_more": "{count} sélectionnée(s) - sélectionnez au moins 2 observations pour trianguler",
+        "session_estimate": "🎯 Triangulation ({count} obs.) : {coordinates} ±{radius:.0f} m",
         "gps_help_title": "Aide GPS",
         "gps_help_message": """Clic droit sur votre position dans Google Maps
 et sélectionnez 'Plus d\'infos sur cet endroit' pour obtenir les coordonnées.
@@ -5,8 +5,10 @@ import os
 
 import folium
 
-from .geo_utils import destination_point
+from .density import DensityGrid
+from .geo_utils import geo_origin
 from .models import HiveLocation, Observation
+from .station_planner import StationCandidates
 
 
 class MapGenerationError(Exception):
@@ -23,6 +25,8 @@ class MapVisualizer:
         observations: list[Observation],
         hive_locations: list[HiveLocation],
         output_file: str = "hornet_map.html",
+        density: DensityGrid | None = None,
+        stations: StationCandidates | None = None,
     ) -> str:
         """
         Create an interactive HTML map.
@@ -31,6 +35,8 @@ class MapVisualizer:
             observations: List of observations to display
             hive_locations: List of calculated hive locations
             output_file: Output filename for HTML map
+            density: Optional nest-pressure raster (``vespa_finder.density``) to overlay
+            stations: Optional recommended bait stations (``vespa_finder.station_planner``)
 
         Returns:
             Path to created HTML file
@@ -45,6 +51,16 @@ class MapVisualizer:
         # Create map
         m = folium.Map(location=[center_lat, center_lon], zoom_start=14, tiles="OpenStreetMap")
 
+        # Nest-pressure overlay, below the markers
+        if density is not None:
+            folium.raster_layers.ImageOverlay(
+                image=density.to_rgba(),
+                bounds=density.bounds,
+                opacity=0.7,
+                mercator_project=True,
+                name="Nest pressure",
+            ).add_to(m)
+
         # Add observation points
         for i, obs in enumerate(observations, 1):
             # Observation marker
@@ -57,8 +73,8 @@ class MapVisualizer:
 
             # Draw arrow showing flight direction
             arrow_length = 100  # meters
-            arrow_end_lat, arrow_end_lon = destination_point(
-                obs.latitude, obs.longitude, obs.bearing, arrow_length
+            arrow_end_lat, arrow_end_lon = geo_origin(obs.latitude, obs.longitude).destination(
+                obs.bearing, arrow_length
             )
 
             folium.PolyLine(
@@ -102,6 +118,28 @@ class MapVisualizer:
                 popup=f"Confidence: ±{hive.confidence_radius:.0f}m",
             ).add_to(m)
 
+        # Recommended next bait stations
+        if stations is not None:
+            for rank, (lat, lon, score, bearing) in enumerate(
+                zip(
+                    stations.latitude.tolist(),
+                    stations.longitude.tolist(),
+                    stations.score.tolist(),
+                    stations.bearing.tolist(),
+                    strict=True,
+                ),
+                1,
+            ):
+                folium.Marker(
+                    location=[lat, lon],
+                    popup=(
+                        f"Suggested station {rank}: expected area reduction {score:.0%}, "
+                        f"hive bearing {bearing:.0f}°"
+                    ),
+                    tooltip=f"Suggested station {rank}",
+                    icon=folium.Icon(color="green", icon="flag", prefix="fa"),
+                ).add_to(m)
+
         # Add legend
         legend_html = self._create_legend(len(observations), len(hive_locations))
         m.get_root().html.add_child(folium.Element(legend_html))
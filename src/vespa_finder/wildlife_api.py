@@ -1,12 +1,18 @@
 """Wildlife database API integration for reporting hornet observations."""
 
-from typing import ClassVar
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, ClassVar
 
 import requests
 
 from .__version__ import __repository__, __version__
+from .bulk_submit import RetryPolicy, SubmissionReport, WaarnemingBulkSubmitter
 from .models import HiveLocation, Observation
 
+if TYPE_CHECKING:
+    from .outbox import ReportOutbox
+    from .report_export import BulkReportResult
+
 
 class WildlifeAPIError(Exception):
     """Exception raised when wildlife API operations fail."""
@@ -14,6 +20,71 @@ class WildlifeAPIError(Exception):
     pass
 
 
+# Per-record report fields, shared by WildlifeReporter and the bulk export.
+# Dates and times are passed in preformatted, so bulk exports can format each
+# distinct minute once.
+
+
+def vespawatch_record(
+    observation: Observation, hive_location: HiveLocation, date: str, time: str
+) -> dict[str, str]:
+    """Vespawatch submission fields (``date`` as YYYY-MM-DD, ``time`` as HH:MM)."""
+    return {
+        "species": "Vespa velutina (Asian hornet)",
+        "observation_date": date,
+        "observation_time": time,
+        "observer_location": f"{observation.latitude}, {observation.longitude}",
+        "estimated_hive_location": f"{hive_location.latitude}, {hive_location.longitude}",
+        "distance_from_observer": f"{hive_location.distance_from_observer:.0f} meters",
+        "bearing": f"{observation.bearing}°",
+        "round_trip_time": f"{observation.round_trip_time:.0f} seconds",
+        "method": "Vespawatchers empirical method (100m/min)",
+        "confidence": f"±{hive_location.confidence_radius:.0f} meters",
+        "notes": observation.notes or "Submitted via VespaFinder",
+    }
+
+
+def waarneming_payload(
+    observation: Observation, hive_location: HiveLocation, date: str, time: str
+) -> dict[str, str | int | float]:
+    """Waarneming.nl API payload (``date`` as YYYY-MM-DD, ``time`` as HH:MM)."""
+    return {
+        "species": "Vespa velutina",
+        "latitude": observation.latitude,
+        "longitude": observation.longitude,
+        "date": date,
+        "time": time,
+        "count": 1,
+        "notes": (
+            f"Asian hornet observation. Estimated hive location: "
+            f"{hive_location.latitude}, {hive_location.longitude} (±{hive_location.confidence_radius:.0f}m). "
+            f"Method: Vespawatchers empirical (100m/min). "
+            f"Distance: {hive_location.distance_from_observer:.0f}m, Bearing: {observation.bearing}°"
+        ),
+        "accuracy": hive_location.confidence_radius,
+        "source": f"VespaFinder {__version__}",
+    }
+
+
+def observatoire_record(
+    observation: Observation, hive_location: HiveLocation, date: str, time: str
+) -> dict[str, str]:
+    """Observatoire Biodiversité Wallonie fields (``date`` as DD/MM/YYYY, ``time`` as HH:MM)."""
+    return {
+        "species": "Frelon asiatique (Vespa velutina)",
+        "date_observation": date,
+        "heure_observation": time,
+        "lieu_observation": f"{observation.latitude}, {observation.longitude}",
+        "emplacement_nid_estime": f"{hive_location.latitude}, {hive_location.longitude}",
+        "distance_observateur": f"{hive_location.distance_from_observer:.0f} mètres",
+        "cap": f"{observation.bearing}°",
+        "temps_parcours": f"{observation.round_trip_time:.0f} secondes",
+        "methode": "Méthode empirique Vespawatchers (100m/min)",
+        "precision": f"±{hive_location.confidence_radius:.0f} mètres",
+        "remarques": observation.notes or "Soumis via VespaFinder",
+    }
+
+
 class WildlifeReporter:
     """
     Report hornet observations to wildlife conservation databases.
@@ -21,6 +92,8 @@ class WildlifeReporter:
     Supports multiple European databases for Asian hornet reporting.
     """
 
+    REQUEST_TIMEOUT = 30  # seconds
+
     # Wildlife database endpoints
     DATABASES: ClassVar[dict] = {
         "vespawatch": {
@@ -44,8 +117,24 @@ class WildlifeReporter:
         },
     }
 
-    def __init__(self):
-        """Initialize wildlife reporter."""
+    # Static Waarneming.nl entry of the combined report
+    COMBINED_WAARNEMING_ENTRY: ClassVar[dict] = {
+        "database": "waarneming",
+        "status": "api_available",
+        "requires_auth": True,
+        "website": "https://waarneming.nl",
+        "api_info": "API key required for automatic submission",
+    }
+
+    def __init__(self, waarneming_api_url: str | None = None):
+        """
+        Initialize wildlife reporter.
+
+        Args:
+            waarneming_api_url: Override of the Waarneming.nl observations endpoint,
+                e.g. a local MockWildlifeServer for testing
+        """
+        self.waarneming_api_url = waarneming_api_url or self.DATABASES["waarneming"]["api_url"]
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -87,12 +176,20 @@ class WildlifeReporter:
         }
 
     def report_to_waarneming(
-        self, observation: Observation, hive_location: HiveLocation, api_key: str | None = None
+        self,
+        observation: Observation,
+        hive_location: HiveLocation,
+        api_key: str | None = None,
+        outbox: "ReportOutbox | None" = None,
     ) -> dict[str, str | bool]:
         """
         Report to Waarneming.nl API.
 
         Note: This requires an API key from Waarneming.nl.
+
+        If an outbox is given and the API cannot be reached (timeout or no
+        connection), the report is queued there for later submission instead
+        of raising, and the result status is "queued".
         """
         if not api_key:
             raise WildlifeAPIError(
@@ -100,22 +197,19 @@ class WildlifeReporter:
                 "Please obtain an API key from https://waarneming.nl"
             )
 
-        db_info = self.DATABASES["waarneming"]
-        if not db_info["api_url"]:
+        if not self.waarneming_api_url:
             raise WildlifeAPIError("Waarneming.nl API endpoint not configured")
 
         # Prepare observation data
         observation_data = self._prepare_waarneming_data(observation, hive_location)
 
         try:
-            # Add authentication
-            self.session.headers["Authorization"] = f"Bearer {api_key}"
-
-            # Submit observation
+            # Authentication is sent per request so the shared session is never mutated
             response = self.session.post(
-                db_info["api_url"],
+                self.waarneming_api_url,
                 json=observation_data,
-                timeout=30,
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=self.REQUEST_TIMEOUT,
             )
 
             response.raise_for_status()
@@ -129,17 +223,70 @@ class WildlifeReporter:
                 "message": "Observation successfully submitted to Waarneming.nl",
             }
 
-        except requests.exceptions.Timeout as e:
-            raise WildlifeAPIError(
-                "Waarneming.nl API request timed out (30 seconds). Please try again."
-            ) from e
-        except requests.exceptions.ConnectionError as e:
-            raise WildlifeAPIError(f"Failed to connect to Waarneming.nl API: {e}") from e
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            if outbox is None:
+                if isinstance(e, requests.exceptions.Timeout):
+                    raise WildlifeAPIError(
+                        f"Waarneming.nl API request timed out ({self.REQUEST_TIMEOUT} seconds). "
+                        "Please try again."
+                    ) from e
+                raise WildlifeAPIError(f"Failed to connect to Waarneming.nl API: {e}") from e
+
+            queued = outbox.enqueue(observation, observation_data, database="waarneming")
+            return {
+                "database": "waarneming",
+                "status": "queued",
+                "duplicate": not queued,
+                "message": "Waarneming.nl unreachable; observation queued for later submission",
+            }
         except requests.exceptions.RequestException as e:
             raise WildlifeAPIError(f"Failed to submit to Waarneming.nl: {e}") from e
-        finally:
-            # Clean up authentication header
-            self.session.headers.pop("Authorization", None)
+
+    def report_bulk_to_waarneming(
+        self,
+        reports: Iterable[tuple[Observation, HiveLocation]],
+        api_key: str | None = None,
+        max_concurrency: int = 8,
+        retry_policy: RetryPolicy | None = None,
+    ) -> SubmissionReport:
+        """
+        Report many observations to Waarneming.nl concurrently.
+
+        Intended for end-of-day uploads: requests run with bounded concurrency
+        over a pooled session and transient failures (429/5xx, network errors)
+        are retried with exponential backoff and jitter. Individual failures are
+        recorded in the returned report instead of raising.
+
+        Args:
+            reports: (observation, hive_location) pairs to submit
+            api_key: Waarneming.nl API key
+            max_concurrency: Maximum number of requests in flight
+            retry_policy: Backoff policy (defaults to RetryPolicy())
+
+        Returns:
+            SubmissionReport with per-observation results, throughput and latency
+        """
+        if not api_key:
+            raise WildlifeAPIError(
+                "Waarneming.nl API requires authentication. "
+                "Please obtain an API key from https://waarneming.nl"
+            )
+
+        if not self.waarneming_api_url:
+            raise WildlifeAPIError("Waarneming.nl API endpoint not configured")
+
+        payloads = (
+            self._prepare_waarneming_data(observation, hive_location)
+            for observation, hive_location in reports
+        )
+        with WaarnemingBulkSubmitter(
+            api_key,
+            api_url=self.waarneming_api_url,
+            max_concurrency=max_concurrency,
+            retry_policy=retry_policy,
+            timeout=self.REQUEST_TIMEOUT,
+        ) as submitter:
+            return submitter.submit_all(payloads)
 
     def report_to_observatoire(
         self, observation: Observation, hive_location: HiveLocation
@@ -164,58 +311,34 @@ class WildlifeReporter:
         self, observation: Observation, hive_location: HiveLocation
     ) -> dict[str, str]:
         """Prepare data for Vespawatch submission."""
-        return {
-            "species": "Vespa velutina (Asian hornet)",
-            "observation_date": observation.timestamp.strftime("%Y-%m-%d"),
-            "observation_time": observation.timestamp.strftime("%H:%M"),
-            "observer_location": f"{observation.latitude}, {observation.longitude}",
-            "estimated_hive_location": f"{hive_location.latitude}, {hive_location.longitude}",
-            "distance_from_observer": f"{hive_location.distance_from_observer:.0f} meters",
-            "bearing": f"{observation.bearing}°",
-            "round_trip_time": f"{observation.round_trip_time:.0f} seconds",
-            "method": "Vespawatchers empirical method (100m/min)",
-            "confidence": f"±{hive_location.confidence_radius:.0f} meters",
-            "notes": observation.notes or "Submitted via VespaFinder",
-        }
+        return vespawatch_record(
+            observation,
+            hive_location,
+            observation.timestamp.strftime("%Y-%m-%d"),
+            observation.timestamp.strftime("%H:%M"),
+        )
 
     def _prepare_waarneming_data(
         self, observation: Observation, hive_location: HiveLocation
     ) -> dict[str, str | int | float]:
         """Prepare data for Waarneming.nl API."""
-        return {
-            "species": "Vespa velutina",
-            "latitude": observation.latitude,
-            "longitude": observation.longitude,
-            "date": observation.timestamp.strftime("%Y-%m-%d"),
-            "time": observation.timestamp.strftime("%H:%M"),
-            "count": 1,
-            "notes": (
-                f"Asian hornet observation. Estimated hive location: "
-                f"{hive_location.latitude}, {hive_location.longitude} (±{hive_location.confidence_radius:.0f}m). "
-                f"Method: Vespawatchers empirical (100m/min). "
-                f"Distance: {hive_location.distance_from_observer:.0f}m, Bearing: {observation.bearing}°"
-            ),
-            "accuracy": hive_location.confidence_radius,
-            "source": f"VespaFinder {__version__}",
-        }
+        return waarneming_payload(
+            observation,
+            hive_location,
+            observation.timestamp.strftime("%Y-%m-%d"),
+            observation.timestamp.strftime("%H:%M"),
+        )
 
     def _prepare_observatoire_data(
         self, observation: Observation, hive_location: HiveLocation
     ) -> dict[str, str]:
         """Prepare data for Observatoire Biodiversité Wallonie submission."""
-        return {
-            "species": "Frelon asiatique (Vespa velutina)",
-            "date_observation": observation.timestamp.strftime("%d/%m/%Y"),
-            "heure_observation": observation.timestamp.strftime("%H:%M"),
-            "lieu_observation": f"{observation.latitude}, {observation.longitude}",
-            "emplacement_nid_estime": f"{hive_location.latitude}, {hive_location.longitude}",
-            "distance_observateur": f"{hive_location.distance_from_observer:.0f} mètres",
-            "cap": f"{observation.bearing}°",
-            "temps_parcours": f"{observation.round_trip_time:.0f} secondes",
-            "methode": "Méthode empirique Vespawatchers (100m/min)",
-            "precision": f"±{hive_location.confidence_radius:.0f} mètres",
-            "remarques": observation.notes or "Soumis via VespaFinder",
-        }
+        return observatoire_record(
+            observation,
+            hive_location,
+            observation.timestamp.strftime("%d/%m/%Y"),
+            observation.timestamp.strftime("%H:%M"),
+        )
 
     def generate_combined_report(
         self, observation: Observation, hive_location: HiveLocation
@@ -223,16 +346,31 @@ class WildlifeReporter:
         """Generate a combined report for all databases."""
         return {
             "vespawatch": self.report_to_vespawatch(observation, hive_location),
-            "waarneming": {
-                "database": "waarneming",
-                "status": "api_available",
-                "requires_auth": True,
-                "website": "https://waarneming.nl",
-                "api_info": "API key required for automatic submission",
-            },
+            "waarneming": dict(self.COMBINED_WAARNEMING_ENTRY),
             "observatoire": self.report_to_observatoire(observation, hive_location),
         }
 
+    def export_bulk_reports(
+        self, reports: Iterable[tuple[Observation, HiveLocation]], output_dir: str
+    ) -> "BulkReportResult":
+        """
+        Write submission files for many observations to all databases.
+
+        Creates vespawatch.csv and observatoire.csv (one row per observation,
+        for the manual portals) and waarneming.json (an array of API payloads)
+        in a single streaming pass. See BulkReportWriter.
+
+        Args:
+            reports: (observation, hive_location) pairs
+            output_dir: Directory for the output files
+
+        Returns:
+            BulkReportResult with the record count and file paths
+        """
+        from .report_export import BulkReportWriter  # noqa: PLC0415 - imports this module
+
+        return BulkReportWriter().write(reports, output_dir)
+
     def get_reporting_guide(self, country: str = "belgium") -> str:
         """Get reporting guide for specific country/region."""
         guides = {
@@ -0,0 +1,284 @@
+"""Background task execution for the GUI.
+
+Slow work (calculations, map rendering, opening the browser) runs on a small
+thread pool so the Tk event loop never blocks. Results, errors and progress
+updates are queued by the worker threads and delivered on the main thread by
+polling through ``root.after``, since Tk widgets must only be touched from the
+thread that created them.
+"""
+
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCancelledError(Exception):
+    """Raised inside a task when its job has been cancelled or superseded."""
+
+    pass
+
+
+class CancelToken:
+    """Thread-safe cancellation flag shared between the GUI and a worker."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation of the associated job."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation has been requested."""
+        return self._event.is_set()
+
+
+class TaskContext:
+    """Handle given to a running task for progress reporting and cancellation checks."""
+
+    def __init__(self, token: CancelToken, report: Callable[[float, str], None]) -> None:
+        self.token = token
+        self._report = report
+
+    def report_progress(self, fraction: float, message: str = "") -> None:
+        """
+        Report progress of the running task.
+
+        Args:
+            fraction: Completed fraction between 0.0 and 1.0
+            message: Short status text to display
+        """
+        self._report(max(0.0, min(1.0, fraction)), message)
+
+    def raise_if_cancelled(self) -> None:
+        """Abort the task if it has been cancelled."""
+        if self.token.cancelled:
+            raise TaskCancelledError("Task was cancelled")
+
+
+@dataclass
+class _Job:
+    """Bookkeeping for a submitted task."""
+
+    name: str
+    token: CancelToken
+    on_success: Callable[[Any], None] | None
+    on_error: Callable[[BaseException], None] | None
+    on_progress: Callable[[float, str], None] | None
+
+
+class BackgroundTaskRunner:
+    """
+    Run callables off the Tk main thread and marshal their results back.
+
+    Jobs are identified by name: submitting a new job under a name that is still
+    running cancels the previous one, and any result it produces afterwards is
+    discarded as stale.
+
+    Example:
+        runner = BackgroundTaskRunner(root.after)
+        runner.submit("calculate", work, on_success=show_results)
+    """
+
+    POLL_INTERVAL_MS = 50  # How often queued results are checked while jobs run
+
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], Any],
+        max_workers: int = 2,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            schedule: Main-thread scheduler with the signature of ``tk.Misc.after``
+            max_workers: Number of worker threads
+        """
+        self._schedule = schedule
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="vespa-worker"
+        )
+        self._events: queue.SimpleQueue = queue.SimpleQueue()
+        self._active: dict[str, _Job] = {}
+        self._pending = 0
+        self._polling = False
+
+    @property
+    def busy(self) -> bool:
+        """Whether any submitted job has not been delivered yet."""
+        return self._pending > 0
+
+    def is_running(self, name: str) -> bool:
+        """Whether a job with the given name is currently active."""
+        return name in self._active
+
+    def submit(
+        self,
+        name: str,
+        func: Callable[[TaskContext], Any],
+        on_success: Callable[[Any], None] | None = None,
+        on_error: Callable[[BaseException], None] | None = None,
+        on_progress: Callable[[float, str], None] | None = None,
+    ) -> CancelToken:
+        """
+        Submit a job, cancelling any previous job with the same name.
+
+        Must be called from the main thread. Callbacks are invoked on the main
+        thread; ``on_error`` is not called for cancelled jobs.
+
+        Args:
+            name: Job name used to detect stale results
+            func: Callable run in a worker thread, receives a TaskContext
+            on_success: Called with the return value of ``func``
+            on_error: Called with the exception raised by ``func``
+            on_progress: Called with (fraction, message) progress updates
+
+        Returns:
+            CancelToken that can be used to cancel the job
+        """
+        self.cancel(name)
+
+        job = _Job(name, CancelToken(), on_success, on_error, on_progress)
+        self._active[name] = job
+        self._pending += 1
+
+        context = TaskContext(
+            job.token,
+            lambda fraction, message: self._events.put(("progress", job, (fraction, message))),
+        )
+        self._executor.submit(self._run, job, func, context)
+        self._ensure_polling()
+        return job.token
+
+    def cancel(self, name: str) -> None:
+        """Cancel the active job with the given name, if any."""
+        job = self._active.pop(name, None)
+        if job is not None:
+            job.token.cancel()
+
+    def shutdown(self) -> None:
+        """Cancel all jobs and stop the worker threads without waiting."""
+        for name in list(self._active):
+            self.cancel(name)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job: _Job, func: Callable[[TaskContext], Any], context: TaskContext) -> None:
+        """Execute a job in a worker thread and queue its outcome."""
+        try:
+            if job.token.cancelled:
+                raise TaskCancelledError("Task was cancelled before it started")
+            result = func(context)
+        except TaskCancelledError:
+            self._events.put(("cancelled", job, None))
+        except Exception as e:
+            self._events.put(("error", job, e))
+        else:
+            self._events.put(("success", job, result))
+
+    def _ensure_polling(self) -> None:
+        if not self._polling:
+            self._polling = True
+            self._schedule(self.POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self) -> None:
+        """Deliver queued events on the main thread."""
+        while True:
+            try:
+                kind, job, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            self._dispatch(kind, job, payload)
+
+        if self._pending > 0:
+            self._schedule(self.POLL_INTERVAL_MS, self._poll)
+        else:
+            self._polling = False
+
+    def _dispatch(self, kind: str, job: _Job, payload: Any) -> None:
+        if kind != "progress":
+            self._pending -= 1
+            if self._active.get(job.name) is job:
+                del self._active[job.name]
+
+        # Results of cancelled or superseded jobs are stale
+        if job.token.cancelled:
+            return
+
+        try:
+            if kind == "progress":
+                if job.on_progress is not None:
+                    job.on_progress(*payload)
+            elif kind == "success":
+                if job.on_success is not None:
+                    job.on_success(payload)
+            elif kind == "error":
+                if job.on_error is not None:
+                    job.on_error(payload)
+                else:
+                    logger.error(f"Unhandled error in background job '{job.name}': {payload}")
+        except Exception:
+            logger.exception(f"Error in callback for background job '{job.name}'")
+
+
+class Debouncer:
+    """
+    Coalesce bursts of calls into a single callback after a quiet period.
+
+    Used for live recalculation while the user types: each ``trigger`` restarts
+    the timer, and the callback runs once no new trigger arrived for ``delay_ms``.
+    """
+
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], Any],
+        cancel: Callable[[Any], None],
+        delay_ms: int,
+        callback: Callable[[], None],
+    ) -> None:
+        """
+        Initialize the debouncer.
+
+        Args:
+            schedule: Main-thread scheduler with the signature of ``tk.Misc.after``
+            cancel: Cancels a scheduled call, like ``tk.Misc.after_cancel``
+            delay_ms: Quiet period before the callback runs
+            callback: Function to run
+        """
+        self._schedule = schedule
+        self._cancel = cancel
+        self.delay_ms = delay_ms
+        self._callback = callback
+        self._pending_id: Any = None
+
+    @property
+    def pending(self) -> bool:
+        """Whether a callback is scheduled but has not run yet."""
+        return self._pending_id is not None
+
+    def trigger(self, *_args: Any) -> None:
+        """Restart the quiet period; extra arguments (e.g. Tk events) are ignored."""
+        self.cancel()
+        self._pending_id = self._schedule(self.delay_ms, self._fire)
+
+    def cancel(self) -> None:
+        """Drop the scheduled callback, if any."""
+        if self._pending_id is not None:
+            self._cancel(self._pending_id)
+            self._pending_id = None
+
+    def flush(self) -> None:
+        """Run a pending callback immediately."""
+        if self._pending_id is not None:
+            self.cancel()
+            self._callback()
+
+    def _fire(self) -> None:
+        self._pending_id = None
+        self._callback()
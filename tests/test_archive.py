@@ -0,0 +1,206 @@
+"""Tests for the memory-mapped observation archive."""
+
+import pickle
+from datetime import UTC, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from vespa_finder.archive import ArchiveError, ObservationArchive
+from vespa_finder.binary_format import NAIVE_TIMESTAMP
+from vespa_finder.calculator import HiveCalculator
+from vespa_finder.models import Observation
+from vespa_finder.quality import FLAG_NIGHT, score_observations
+
+START = datetime(2025, 8, 1, 8, 0)
+
+
+def make_observations(count, offset=0):
+    return [
+        Observation(
+            latitude=50.8 + i * 1e-5,
+            longitude=4.3 + (i % 50) * 1e-5,
+            bearing=(i * 3.7) % 360,
+            round_trip_time=30 + i % 300,
+            speed=None if i % 4 else 5.0,
+            timestamp=START + timedelta(minutes=offset + i),
+            hornet_color_mark=[None, "red", "yellow"][i % 3],
+            temperature=None if i % 5 else 12.0 + i % 20,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Archive with 1000 observations one minute apart and a small index stride."""
+    archive = ObservationArchive.create(str(tmp_path / "season"), index_stride=64)
+    archive.append(make_observations(1000))
+    return archive
+
+
+class TestObservationArchive:
+    """Tests for ObservationArchive."""
+
+    def test_round_trip(self, archive):
+        """Archived observations should come back unchanged (notes are not archived)."""
+        assert archive.rows(0, len(archive)).to_observations() == make_observations(1000)
+
+    def test_round_trip_keeps_time_zones(self, tmp_path):
+        """Aware timestamps should come back with their clock time and UTC offset."""
+        archive = ObservationArchive.create(str(tmp_path / "zones"))
+        timestamps = [
+            datetime(2025, 8, 1, 7, 30, tzinfo=timezone(timedelta(hours=2))),
+            datetime(2025, 8, 1, 6, 0),
+            datetime(2025, 8, 1, 4, 0, tzinfo=timezone(timedelta(hours=-5))),
+            datetime(2025, 8, 1, 9, 15, tzinfo=UTC),
+        ]
+        archive.append(Observation(50.8, 4.3, 90.0, 60.0, timestamp=ts) for ts in timestamps)
+
+        restored = [o.timestamp for o in archive.rows(0, len(archive)).to_observations()]
+
+        assert [(ts.isoformat(), ts.utcoffset()) for ts in restored] == [
+            (ts.isoformat(), ts.utcoffset()) for ts in timestamps
+        ]
+
+    def test_time_range_matches_linear_scan(self, archive):
+        """Sparse-index lookups should match a full scan for any bounds."""
+        timestamps = np.array([o.timestamp for o in make_observations(1000)], dtype="M8[us]")
+        for start_min, end_min in [(0, 1000), (10, 20), (63, 65), (64, 128), (-5, 3), (990, 2000)]:
+            start = START + timedelta(minutes=start_min, seconds=30)
+            end = START + timedelta(minutes=end_min)
+            expected = np.nonzero(
+                (timestamps >= np.datetime64(start)) & (timestamps < np.datetime64(end))
+            )[0]
+
+            result = archive.time_range(start, end)
+
+            assert len(result) == len(expected)
+            if len(expected):
+                assert result.start == expected[0]
+
+    def test_time_range_is_zero_copy(self, archive):
+        """Slices should be views into the mapped column files."""
+        result = archive.time_range(START + timedelta(minutes=100), START + timedelta(minutes=200))
+
+        assert len(result) == 100
+        assert np.shares_memory(result.latitude, archive.column("latitude"))
+
+    @pytest.mark.parametrize("model", ["empirical", "conditions"])
+    def test_calculate_batch_matches_single(self, archive, model):
+        """Batch estimates for a slice should match per-observation estimates."""
+        calculator = HiveCalculator(distance_model=model)
+        result = archive.time_range(START, START + timedelta(minutes=50))
+
+        batch = result.calculate(calculator)
+
+        for observation, estimate in zip(
+            result.to_observations(), batch.to_hive_locations(), strict=True
+        ):
+            single = calculator.calculate_from_single_observation(observation)
+            assert estimate.latitude == pytest.approx(single.latitude, abs=1e-12)
+            assert estimate.longitude == pytest.approx(single.longitude, abs=1e-12)
+            assert estimate.confidence_radius == pytest.approx(single.confidence_radius)
+            assert estimate.distance_from_observer == pytest.approx(single.distance_from_observer)
+
+    def test_score_quality_matches_observations(self, archive):
+        """Slice quality scores should match scoring the materialized observations."""
+        result = archive.rows(0, 400)
+        batch = result.score_quality()
+        listed = score_observations(result.to_observations())
+
+        np.testing.assert_array_equal(batch.flags, listed.flags)
+        np.testing.assert_array_equal(batch.weight, listed.weight)
+
+    def test_score_quality_uses_recorded_clock_time(self, tmp_path):
+        """Night checks on archived aware timestamps should use local, not UTC, hours."""
+        paris = timezone(timedelta(hours=2))
+        observations = [
+            Observation(50.8, 4.3, 90.0, 60.0, timestamp=datetime(2025, 8, 1, 7, 30, tzinfo=paris)),
+            Observation(
+                50.9, 4.4, 90.0, 60.0, timestamp=datetime(2025, 8, 1, 23, 30, tzinfo=paris)
+            ),
+        ]
+        archive = ObservationArchive.create(str(tmp_path / "zones"))
+        archive.append(observations)
+
+        archived = archive.rows(0, len(archive)).score_quality()
+
+        assert archived.flags.tolist() == score_observations(observations).flags.tolist()
+        assert archived.flags.tolist() == [0, FLAG_NIGHT]
+
+    def test_theoretical_batch_requires_speed(self, archive):
+        """The theoretical method should reject rows without speed."""
+        with pytest.raises(ValueError):
+            archive.rows(0, 10).calculate(method="theoretical")
+
+    def test_append_and_reopen(self, archive):
+        """Appends should extend the index and survive reopening."""
+        archive.append(make_observations(200, offset=1000))
+        reopened = ObservationArchive(archive.path)
+
+        assert len(reopened) == 1200
+        tail = reopened.time_range(START + timedelta(minutes=1100))
+        assert len(tail) == 100
+        assert tail.color_marks()[:3] == ["red", "yellow", None]
+
+    def test_rejects_out_of_order_append(self, archive):
+        """Observations older than the archive should be rejected."""
+        with pytest.raises(ArchiveError):
+            archive.append(make_observations(5))
+        assert len(ObservationArchive(archive.path)) == 1000
+
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [
+            ("latitude", 200.0),
+            ("longitude", -181.0),
+            ("bearing", 400.0),
+            ("bearing", np.nan),
+            ("round_trip_time", -5.0),
+            ("speed", -1.0),
+            ("temperature", 80.0),
+            ("tz_offset", 25 * 3600),
+            ("timestamp", np.datetime64("NaT", "us")),
+        ],
+    )
+    def test_append_columns_validates(self, tmp_path, name, value):
+        """Raw columns should be range-checked like Observation fields."""
+        archive = ObservationArchive.create(str(tmp_path / "raw"))
+        columns = {
+            "latitude": [50.8, 50.9],
+            "longitude": [4.3, 4.4],
+            "bearing": [90.0, 360.0],
+            "round_trip_time": [60.0, 90.0],
+            "speed": [np.nan, 5.0],
+            "temperature": [np.nan, 20.0],
+            "timestamp": np.array([START, START + timedelta(minutes=1)], dtype="M8[us]"),
+            "tz_offset": [NAIVE_TIMESTAMP, 7200],
+            "mark": [0, 0],
+        }
+        assert archive.append_columns(columns) == 2
+
+        columns[name] = np.array(columns[name])
+        columns[name][1] = value
+        with pytest.raises(ArchiveError):
+            archive.append_columns(columns)
+        assert len(ObservationArchive(archive.path)) == 2
+
+    def test_pickle_reopens_mapping(self, archive):
+        """Pickling should transfer only the path, not the data."""
+        payload = pickle.dumps(archive)
+        clone = pickle.loads(payload)
+
+        assert len(payload) < 500
+        assert len(clone) == 1000
+        assert np.array_equal(clone.column("bearing"), archive.column("bearing"))
+
+    def test_not_an_archive(self, tmp_path):
+        """Opening a plain directory should fail clearly."""
+        with pytest.raises(ArchiveError):
+            ObservationArchive(str(tmp_path))
+
+    def test_empty_archive(self, tmp_path):
+        """An empty archive should return empty slices."""
+        archive = ObservationArchive.create(str(tmp_path / "empty"))
+        assert len(archive.time_range(START, START + timedelta(days=1))) == 0
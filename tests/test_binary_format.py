@@ -0,0 +1,153 @@
+"""Tests for the binary observation/hive location format."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from vespa_finder.binary_format import (
+    KIND_OBSERVATIONS,
+    BinaryFormatError,
+    RecordFile,
+    observations_to_records,
+    read_hive_locations,
+    read_observations,
+    write_hive_locations,
+    write_observations,
+    write_records,
+)
+from vespa_finder.models import HiveLocation, Observation
+
+
+def make_observations(count, start=datetime(2025, 8, 1, 9, 30, 0, 123456)):
+    return [
+        Observation(
+            latitude=50.8 + i * 1e-7,
+            longitude=4.3 - i * 3e-7,
+            bearing=(i * 0.1) % 360,
+            round_trip_time=60.5 + i % 17,
+            speed=None if i % 2 else 4.2 + i * 0.01,
+            timestamp=start + timedelta(seconds=i),
+            notes="" if i % 3 else f"note {i}, près du bois",
+            hornet_color_mark=[None, "red", "blue/white"][i % 3],
+            temperature=None if i % 4 else 18.5 + i * 0.01,
+        )
+        for i in range(count)
+    ]
+
+
+class TestObservationRoundTrip:
+    """Round-trip tests for observations."""
+
+    def test_exact_round_trip(self, tmp_path):
+        """Every field should survive a write/read cycle unchanged."""
+        path = tmp_path / "obs.vfb"
+        observations = make_observations(100)
+        observations.append(
+            Observation(
+                latitude=-33.1234567890123,
+                longitude=151.987654321,
+                bearing=359.999,
+                round_trip_time=0.1,
+                timestamp=datetime(2025, 1, 1, 12, tzinfo=timezone(timedelta(hours=2))),
+            )
+        )
+
+        write_observations(str(path), observations)
+
+        assert read_observations(str(path)) == observations
+
+    def test_append_adds_block(self, tmp_path):
+        """Appending should keep earlier records and add new ones."""
+        path = str(tmp_path / "obs.vfb")
+        first, second = make_observations(10), make_observations(5, datetime(2025, 9, 1))
+
+        write_observations(path, first)
+        write_observations(path, second, append=True)
+
+        archive = RecordFile(path)
+        assert len(archive.blocks) == 2
+        assert len(archive) == 15
+        assert archive.to_observations() == first + second
+
+    def test_records_are_memory_mapped(self, tmp_path):
+        """A single-block file should expose its records without copying."""
+        path = str(tmp_path / "obs.vfb")
+        write_observations(path, make_observations(20))
+
+        records = RecordFile(path).records
+
+        assert isinstance(records.base, np.memmap) or isinstance(records, np.memmap)
+        assert records["latitude"][5] == pytest.approx(50.8 + 5e-7)
+        assert np.isnan(records["speed"][1])
+
+    def test_empty_collection(self, tmp_path):
+        """An empty collection should round-trip."""
+        path = str(tmp_path / "empty.vfb")
+        write_observations(path, [])
+        assert read_observations(path) == []
+
+    def test_large_file_opens_quickly(self, tmp_path):
+        """Mapping a million records should not depend on parsing them."""
+        path = str(tmp_path / "big.vfb")
+        records, strings = observations_to_records(make_observations(1000))
+        write_records(path, KIND_OBSERVATIONS, np.tile(records, 1000), strings)
+
+        start = time.perf_counter()
+        records = RecordFile(path).records
+        mean_latitude = records["latitude"].mean()
+        elapsed = time.perf_counter() - start
+
+        assert len(records) == 1_000_000
+        assert mean_latitude == pytest.approx(50.80005, abs=1e-4)
+        assert elapsed < 0.5
+
+
+class TestHiveLocationRoundTrip:
+    """Round-trip tests for hive locations."""
+
+    def test_exact_round_trip(self, tmp_path):
+        """Hive locations should round-trip."""
+        path = str(tmp_path / "hives.vfb")
+        locations = [
+            HiveLocation(50.1, 4.2, 55.5, 812.25, 123.4, "triangulation_3_points_empirical"),
+            HiveLocation(50.2, 4.3, 60.0, 100.0, 0.0),
+        ]
+
+        write_hive_locations(path, locations)
+
+        assert read_hive_locations(path) == locations
+
+
+class TestErrors:
+    """Tests for invalid files."""
+
+    def test_not_a_binary_file(self, tmp_path):
+        """Foreign files should be rejected."""
+        path = tmp_path / "bad.vfb"
+        path.write_bytes(b"hello world, this is text")
+        with pytest.raises(BinaryFormatError):
+            RecordFile(str(path))
+
+    def test_truncated_file(self, tmp_path):
+        """Truncated blocks should be detected."""
+        path = tmp_path / "obs.vfb"
+        write_observations(str(path), make_observations(3))
+        path.write_bytes(path.read_bytes()[:-20])
+        with pytest.raises(BinaryFormatError):
+            RecordFile(str(path))
+
+    def test_append_kind_mismatch(self, tmp_path):
+        """Appending hive locations to an observation file should fail."""
+        path = str(tmp_path / "obs.vfb")
+        write_observations(path, make_observations(3))
+        with pytest.raises(BinaryFormatError):
+            write_hive_locations(path, [HiveLocation(50, 4, 50, 100, 0)], append=True)
+
+    def test_wrong_materialization(self, tmp_path):
+        """Reading observations from a hive location file should fail."""
+        path = str(tmp_path / "hives.vfb")
+        write_hive_locations(path, [HiveLocation(50, 4, 50, 100, 0)])
+        with pytest.raises(BinaryFormatError):
+            read_observations(path)
@@ -0,0 +1,226 @@
+"""Tests for bulk Waarneming.nl submission against a local stub server."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from vespa_finder.bulk_submit import RetryPolicy, SubmissionReport, WaarnemingBulkSubmitter
+from vespa_finder.models import HiveLocation, Observation
+from vespa_finder.wildlife_api import WildlifeAPIError, WildlifeReporter
+
+FAST_RETRIES = RetryPolicy(max_retries=3, backoff_base=0.001, backoff_max=0.01)
+
+
+class StubState:
+    """Scripted behaviour and request log shared with the stub handler."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = []
+        self.responses = []  # Status codes to return before succeeding
+
+    def next_status(self):
+        with self.lock:
+            return self.responses.pop(0) if self.responses else 201
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal stand-in for the Waarneming.nl observations endpoint."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, so connection pooling is exercised
+    state: StubState
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.state.lock:
+            self.state.requests.append((self.headers.get("Authorization"), body))
+            observation_id = len(self.state.requests)
+
+        status = self.state.next_status()
+        payload = json.dumps({"id": observation_id, "url": f"/obs/{observation_id}"}).encode()
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Run the stub API on a free local port."""
+    state = StubState()
+    handler = type("Handler", (StubHandler,), {"state": state})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/v1/observations"
+    yield url, state
+    server.shutdown()
+    server.server_close()
+
+
+def make_payloads(count):
+    return [{"species": "Vespa velutina", "count": 1, "n": i} for i in range(count)]
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    def test_delay_bounded_by_backoff(self):
+        """Jittered delay should never exceed the exponential ceiling."""
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+        for attempt in range(10):
+            assert 0 <= policy.delay(attempt) <= min(5.0, 2**attempt)
+
+    def test_retry_after_respected(self):
+        """A server-requested delay should be honoured, capped at backoff_max."""
+        policy = RetryPolicy(backoff_base=0.001, backoff_max=2.0)
+        assert policy.delay(0, retry_after=1.5) >= 1.5
+        assert policy.delay(0, retry_after=60) <= 2.0
+
+
+class TestWaarnemingBulkSubmitter:
+    """Tests for WaarnemingBulkSubmitter."""
+
+    def test_submit_all_success(self, stub_server):
+        """All payloads should be submitted with per-request auth headers."""
+        url, state = stub_server
+        with WaarnemingBulkSubmitter("secret", api_url=url, max_concurrency=4) as submitter:
+            report = submitter.submit_all(make_payloads(20))
+
+        assert report.total == 20
+        assert report.succeeded == 20
+        assert [r.index for r in report.results] == list(range(20))
+        assert all(auth == "Bearer secret" for auth, _ in state.requests)
+        assert sorted(body["n"] for _, body in state.requests) == list(range(20))
+        assert "Authorization" not in submitter.session.headers
+
+    def test_retries_transient_errors(self, stub_server):
+        """429 and 5xx responses should be retried until success."""
+        url, state = stub_server
+        state.responses = [429, 503, 500]
+        with WaarnemingBulkSubmitter(
+            "secret", api_url=url, max_concurrency=1, retry_policy=FAST_RETRIES
+        ) as submitter:
+            result = submitter.submit_one({"n": 0})
+
+        assert result.success
+        assert result.attempts == 4
+        assert result.observation_id == 4
+
+    def test_gives_up_after_max_retries(self, stub_server):
+        """Persistent server errors should be reported, not raised."""
+        url, state = stub_server
+        state.responses = [503] * 10
+        with WaarnemingBulkSubmitter(
+            "secret", api_url=url, max_concurrency=1, retry_policy=FAST_RETRIES
+        ) as submitter:
+            result = submitter.submit_one({"n": 0})
+
+        assert not result.success
+        assert result.attempts == FAST_RETRIES.max_retries + 1
+        assert result.status_code == 503
+
+    def test_client_error_not_retried(self, stub_server):
+        """4xx errors other than 429 should fail immediately."""
+        url, state = stub_server
+        state.responses = [400]
+        with WaarnemingBulkSubmitter("secret", api_url=url, retry_policy=FAST_RETRIES) as submitter:
+            result = submitter.submit_one({"n": 0})
+
+        assert not result.success
+        assert result.attempts == 1
+        assert len(state.requests) == 1
+
+    def test_connection_error_reported(self):
+        """Unreachable servers should produce failed results after retrying."""
+        with WaarnemingBulkSubmitter(
+            "secret", api_url="http://127.0.0.1:9/api", retry_policy=FAST_RETRIES
+        ) as submitter:
+            report = submitter.submit_all(make_payloads(2))
+
+        assert report.failed == 2
+        assert all(r.attempts == FAST_RETRIES.max_retries + 1 for r in report.results)
+
+    def test_requires_api_key(self):
+        """An API key is mandatory."""
+        with pytest.raises(ValueError, match="API key"):
+            WaarnemingBulkSubmitter("")
+
+
+class TestSubmissionReport:
+    """Tests for SubmissionReport statistics."""
+
+    def test_percentiles_and_summary(self, stub_server):
+        """Report should expose throughput and latency percentiles."""
+        url, _state = stub_server
+        with WaarnemingBulkSubmitter("secret", api_url=url, max_concurrency=8) as submitter:
+            report = submitter.submit_all(make_payloads(50))
+
+        assert report.throughput > 0
+        assert report.latency_percentile(50) <= report.latency_percentile(99)
+        assert "Submitted 50 observations" in report.summary()
+
+    def test_empty_report(self):
+        """An empty report should not divide by zero."""
+        report = SubmissionReport()
+        assert report.throughput == 0.0
+        assert report.latency_percentile(95) == 0.0
+
+
+class TestWildlifeReporterBulk:
+    """Tests for WildlifeReporter Waarneming.nl submission."""
+
+    def setup_method(self):
+        """Create a reporter and sample data."""
+        self.reporter = WildlifeReporter()
+        self.observation = Observation(
+            latitude=52.37, longitude=4.89, bearing=90.0, round_trip_time=300
+        )
+        self.hive = HiveLocation(
+            latitude=52.37,
+            longitude=4.897,
+            confidence_radius=100.0,
+            distance_from_observer=500.0,
+            bearing_from_observer=90.0,
+        )
+
+    def use_stub(self, url):
+        self.reporter.waarneming_api_url = url
+
+    def test_single_report_does_not_mutate_session(self, stub_server):
+        """Authentication should be sent per request, not stored on the session."""
+        url, state = stub_server
+        self.use_stub(url)
+
+        result = self.reporter.report_to_waarneming(self.observation, self.hive, api_key="k")
+
+        assert result["status"] == "success"
+        assert state.requests[0][0] == "Bearer k"
+        assert "Authorization" not in self.reporter.session.headers
+
+    def test_bulk_report(self, stub_server):
+        """Bulk reporting should submit prepared Waarneming.nl payloads."""
+        url, state = stub_server
+        self.use_stub(url)
+
+        report = self.reporter.report_bulk_to_waarneming(
+            [(self.observation, self.hive)] * 10, api_key="k", retry_policy=FAST_RETRIES
+        )
+
+        assert report.succeeded == 10
+        assert all(body["species"] == "Vespa velutina" for _, body in state.requests)
+
+    def test_bulk_report_requires_api_key(self):
+        """Missing API keys should raise WildlifeAPIError."""
+        with pytest.raises(WildlifeAPIError, match="authentication"):
+            self.reporter.report_bulk_to_waarneming([(self.observation, self.hive)])
@@ -298,6 +298,108 @@ class TestHiveCalculatorTriangulation:
 
         assert "theoretical" in hive.calculation_method
 
+    def test_triangulate_precomputed_estimates(self):
+        """Combining cached estimates should match the full triangulation."""
+        observations = [
+            Observation(latitude=48.8584, longitude=2.2945, bearing=45.0, round_trip_time=300),
+            Observation(latitude=48.8600, longitude=2.2900, bearing=90.0, round_trip_time=280),
+            Observation(latitude=48.8560, longitude=2.2970, bearing=30.0, round_trip_time=310),
+        ]
+        estimates = [self.calculator.calculate_from_single_observation(o) for o in observations]
+
+        combined = self.calculator.triangulate_estimates(observations, estimates)
+        full = self.calculator.calculate_from_multiple_observations(observations)
+
+        assert combined.latitude == full.latitude
+        assert combined.longitude == full.longitude
+        assert combined.confidence_radius == full.confidence_radius
+        assert combined.calculation_method == full.calculation_method
+
+    def test_triangulate_estimates_length_mismatch(self):
+        """Each observation needs exactly one estimate."""
+        observations = [
+            Observation(latitude=48.8584, longitude=2.2945, bearing=45.0, round_trip_time=300),
+            Observation(latitude=48.8600, longitude=2.2900, bearing=90.0, round_trip_time=280),
+        ]
+        estimates = [self.calculator.calculate_from_single_observation(observations[0])]
+
+        with pytest.raises(ValueError, match="one estimate per observation"):
+            self.calculator.triangulate_estimates(observations, estimates)
+
+    def test_triangulation_weights(self):
+        """Weights should pull the centroid; zero weight leaves an estimate out."""
+        observations = [
+            Observation(latitude=48.8584, longitude=2.2945, bearing=45.0, round_trip_time=300),
+            Observation(latitude=48.8600, longitude=2.2900, bearing=90.0, round_trip_time=280),
+            Observation(latitude=48.8560, longitude=2.2970, bearing=30.0, round_trip_time=310),
+        ]
+        estimates = [self.calculator.calculate_from_single_observation(o) for o in observations]
+
+        unit = self.calculator.calculate_from_multiple_observations(observations, weights=[1, 1, 1])
+        plain = self.calculator.calculate_from_multiple_observations(observations)
+        assert unit.latitude == pytest.approx(plain.latitude)
+        assert unit.longitude == pytest.approx(plain.longitude)
+        assert unit.confidence_radius == pytest.approx(plain.confidence_radius)
+
+        without_last = self.calculator.triangulate_estimates(
+            observations, estimates, weights=[1.0, 1.0, 0.0]
+        )
+        pair = self.calculator.triangulate_estimates(observations[:2], estimates[:2])
+        assert without_last.latitude == pytest.approx(pair.latitude)
+        assert without_last.longitude == pytest.approx(pair.longitude)
+        assert without_last.confidence_radius == pytest.approx(pair.confidence_radius)
+
+        heavy = self.calculator.triangulate_estimates(
+            observations, estimates, weights=[10.0, 1.0, 1.0]
+        )
+        first = estimates[0]
+        assert haversine_distance(
+            heavy.latitude, heavy.longitude, first.latitude, first.longitude
+        ) < (haversine_distance(plain.latitude, plain.longitude, first.latitude, first.longitude))
+
+    def test_triangulation_invalid_weights(self):
+        """Weights must be one non-negative value per observation, not all zero."""
+        observations = [
+            Observation(latitude=48.8584, longitude=2.2945, bearing=45.0, round_trip_time=300),
+            Observation(latitude=48.8600, longitude=2.2900, bearing=90.0, round_trip_time=280),
+        ]
+        for weights in ([1.0], [1.0, -1.0], [0.0, 0.0]):
+            with pytest.raises(ValueError):
+                self.calculator.calculate_from_multiple_observations(observations, weights=weights)
+
+
+class TestHiveCalculatorBatch:
+    """Tests for calculate_batch."""
+
+    def test_matches_single_observation(self):
+        """Batch results should match calculate_from_single_observation per row."""
+        calculator = HiveCalculator()
+        observations = [
+            Observation(latitude=50.85, longitude=4.35, bearing=45, round_trip_time=120, speed=5),
+            Observation(latitude=48.86, longitude=2.29, bearing=270, round_trip_time=600, speed=3),
+        ]
+
+        for method in ("empirical", "theoretical"):
+            batch = calculator.calculate_batch(
+                [o.latitude for o in observations],
+                [o.longitude for o in observations],
+                [o.bearing for o in observations],
+                [o.round_trip_time for o in observations],
+                speed=[o.speed for o in observations],
+                method=method,
+            )
+            for estimate, observation in zip(batch.to_hive_locations(), observations, strict=True):
+                single = calculator.calculate_from_single_observation(observation, method=method)
+                assert estimate.latitude == pytest.approx(single.latitude, abs=1e-12)
+                assert estimate.longitude == pytest.approx(single.longitude, abs=1e-12)
+                assert estimate.confidence_radius == pytest.approx(single.confidence_radius)
+                assert estimate.calculation_method == single.calculation_method
+
+    def test_unknown_method(self):
+        """Unknown methods should raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown method"):
+            HiveCalculator().calculate_batch([50.0], [4.0], [0.0], [60.0], method="magic")
+
 
 class TestHiveCalculatorConstants:
     """Tests for calculator constants."""
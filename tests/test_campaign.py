@@ -0,0 +1,174 @@
+"""Tests for time-ordered campaigns."""
+
+import random
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from vespa_finder.calculator import HiveCalculator
+from vespa_finder.campaign import Campaign
+from vespa_finder.models import Observation
+
+START = datetime(2026, 8, 1, 9, 0)
+
+
+def observation(minutes, bearing=90.0, mark=None, latitude=50.85):
+    return Observation(
+        latitude,
+        4.35,
+        bearing,
+        300.0,
+        timestamp=START + timedelta(minutes=minutes),
+        hornet_color_mark=mark,
+    )
+
+
+class TestCampaign:
+    """Tests for Campaign."""
+
+    def test_out_of_order_appends_stay_sorted(self):
+        """Appends in any order should keep the campaign sorted by time."""
+        minutes = list(range(0, 600, 7))
+        random.Random(1).shuffle(minutes)
+        campaign = Campaign()
+        for minute in minutes:
+            campaign.add(observation(minute))
+
+        times = [o.timestamp for o in campaign]
+        assert times == sorted(times)
+        assert len(campaign) == len(minutes)
+        assert campaign.start == START
+        assert campaign.end == START + timedelta(minutes=max(minutes))
+
+    def test_equal_timestamps_keep_arrival_order(self):
+        """Ties should keep arrival order, and the returned position is correct."""
+        campaign = Campaign([observation(10)])
+        first, second = observation(5, bearing=1.0), observation(5, bearing=2.0)
+        assert campaign.add(first) == 0
+        assert campaign.add(second) == 1
+        assert [o.bearing for o in campaign] == [1.0, 2.0, 90.0]
+
+    def test_window_matches_linear_scan(self):
+        """Window queries should match filtering the observations directly."""
+        observations = [observation(m) for m in range(0, 1000, 13)]
+        campaign = Campaign(reversed(observations))
+        start, end = START + timedelta(minutes=100), START + timedelta(minutes=400)
+
+        expected = [o for o in observations if start <= o.timestamp < end]
+        assert campaign.window(start, end) == expected
+        assert campaign.window(end=end) == [o for o in observations if o.timestamp < end]
+        assert campaign.window(end, start) == []
+
+    def test_last(self):
+        """The last two hours should be counted back from the latest observation."""
+        campaign = Campaign(observation(m) for m in range(0, 600, 30))
+        recent = campaign.last(timedelta(hours=2))
+        assert [o.timestamp for o in recent] == [
+            START + timedelta(minutes=m) for m in range(450, 600, 30)
+        ]
+        assert campaign.last(timedelta(hours=1), now=START) == [campaign.window()[0]]
+        assert Campaign().last(timedelta(hours=1)) == []
+
+    def test_days(self):
+        """Observations should group by calendar day."""
+        campaign = Campaign(observation(m) for m in (0, 60, 24 * 60, 3 * 24 * 60 + 5))
+        assert campaign.days() == [date(2026, 8, 1), date(2026, 8, 2), date(2026, 8, 4)]
+        assert len(campaign.day(date(2026, 8, 1))) == 2
+        assert campaign.day(date(2026, 8, 3)) == []
+
+    def test_days_timezone_aware(self):
+        """Aware timestamps should work the same way."""
+        campaign = Campaign(
+            Observation(50.85, 4.35, 90.0, 300.0, timestamp=datetime(2026, 8, d, 12, tzinfo=UTC))
+            for d in (1, 1, 2)
+        )
+        assert campaign.days() == [date(2026, 8, 1), date(2026, 8, 2)]
+        assert len(campaign.day(date(2026, 8, 1))) == 2
+
+    def test_triangulate_window(self):
+        """Window triangulation should match triangulating the window directly."""
+        calculator = HiveCalculator()
+        observations = [observation(m, bearing=80.0 + m % 20) for m in range(0, 300, 10)]
+        campaign = Campaign(observations, calculator=calculator)
+        start, end = START + timedelta(minutes=50), START + timedelta(minutes=150)
+
+        result = campaign.triangulate(start, end)
+        expected = calculator.calculate_from_multiple_observations(
+            [o for o in observations if start <= o.timestamp < end]
+        )
+        assert result.latitude == pytest.approx(expected.latitude)
+        assert result.longitude == pytest.approx(expected.longitude)
+        assert result.confidence_radius == pytest.approx(expected.confidence_radius)
+
+        single = campaign.triangulate(START, START + timedelta(minutes=5))
+        assert "single_observation" in single.calculation_method
+        assert campaign.triangulate(START - timedelta(days=1), START) is None
+
+    def test_rolling(self):
+        """Rolling windows should cover the campaign, including the latest observation."""
+        campaign = Campaign(observation(m) for m in range(0, 360, 20))
+        results = campaign.rolling(timedelta(hours=2), step=timedelta(hours=1))
+
+        ends = [end for end, _ in results]
+        assert ends[0] == START + timedelta(hours=2)
+        assert ends[-1] == campaign.end + timedelta(microseconds=1)
+        assert ends == sorted(set(ends))
+        assert all(hive is not None for _, hive in results)
+        # Non-overlapping windows by default
+        default = campaign.rolling(timedelta(hours=2))
+        assert [end for end, _ in default][:2] == [
+            START + timedelta(hours=2),
+            START + timedelta(hours=4),
+        ]
+        with pytest.raises(ValueError):
+            campaign.rolling(timedelta(0))
+
+    def test_rolling_updates_after_append(self):
+        """Appending should change later windows without rebuilding the campaign."""
+        campaign = Campaign(observation(m) for m in range(0, 120, 10))
+        before = campaign.triangulate(START + timedelta(minutes=60), START + timedelta(minutes=120))
+        campaign.add(observation(90, bearing=120.0))
+        after = campaign.triangulate(START + timedelta(minutes=60), START + timedelta(minutes=120))
+        assert after.latitude != before.latitude
+
+    def test_timeline(self):
+        """Activity counts per bin should include empty bins and filter by mark."""
+        campaign = Campaign(
+            [
+                observation(0, mark="red"),
+                observation(10),
+                observation(130, mark="red"),
+                observation(135, mark="blue"),
+            ]
+        )
+        assert campaign.timeline() == [
+            (datetime(2026, 8, 1, 9), 2),
+            (datetime(2026, 8, 1, 10), 0),
+            (datetime(2026, 8, 1, 11), 2),
+        ]
+        assert [count for _, count in campaign.timeline(mark="red")] == [1, 0, 1]
+        assert [count for _, count in campaign.timeline(mark="green")] == [0, 0, 0]
+
+        # Incremental: an earlier observation extends the timeline backwards
+        campaign.add(observation(-60))
+        assert campaign.timeline()[0] == (datetime(2026, 8, 1, 8), 1)
+
+    def test_timeline_bins(self):
+        """Bin size and range should be configurable."""
+        campaign = Campaign(
+            (observation(m) for m in range(0, 240, 15)), bin_size=timedelta(hours=2)
+        )
+        assert campaign.timeline() == [
+            (datetime(2026, 8, 1, 8), 4),
+            (datetime(2026, 8, 1, 10), 8),
+            (datetime(2026, 8, 1, 12), 4),
+        ]
+        window = campaign.timeline(datetime(2026, 8, 1, 10), datetime(2026, 8, 1, 12))
+        assert window == [(datetime(2026, 8, 1, 10), 8)]
+        with pytest.raises(ValueError):
+            Campaign(bin_size=timedelta(0))
+
+    def test_requires_timestamp(self):
+        """Observations without a timestamp cannot be placed in time."""
+        with pytest.raises(ValueError):
+            Campaign().add(Observation.trusted(50.85, 4.35, 90.0, 300.0, None, None))
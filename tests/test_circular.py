@@ -0,0 +1,90 @@
+"""Tests for circular statistics."""
+
+import numpy as np
+import pytest
+
+from vespa_finder.calculator import HiveCalculator
+from vespa_finder.circular import (
+    circular_mean,
+    circular_std,
+    circular_variance,
+    mean_longitude,
+    resultant_direction,
+    resultant_length,
+    von_mises_kappa,
+    wrapped_difference,
+)
+from vespa_finder.models import Observation
+
+
+class TestCircularStatistics:
+    """Tests for the circular statistics functions."""
+
+    def test_mean_across_north(self):
+        """The mean of bearings either side of north should be north."""
+        assert circular_mean([350.0, 10.0]) == pytest.approx(0.0, abs=1e-12)
+        assert circular_mean([350.0, 20.0]) == pytest.approx(5.0)
+        assert 0 <= circular_mean([359.9999999999, 0.0000000001]) < 360
+
+    def test_weighted_mean_and_undefined_mean(self):
+        """Weights should pull the mean; opposite angles have no mean."""
+        assert circular_mean([0.0, 90.0], weights=[1.0, 0.0]) == pytest.approx(0.0)
+        assert np.isnan(circular_mean([0.0, 180.0]))
+
+    def test_spread_measures(self):
+        """Identical angles have R=1; uniform angles R~0."""
+        uniform = np.arange(0.0, 360.0, 1.0)
+
+        assert resultant_length([42.0] * 5) == pytest.approx(1.0)
+        assert resultant_length(uniform) == pytest.approx(0.0, abs=1e-12)
+        assert circular_variance(uniform) == pytest.approx(1.0)
+        assert circular_std([42.0] * 5) == pytest.approx(0.0, abs=1e-5)
+
+    def test_kappa_recovers_von_mises_concentration(self):
+        """Concentration estimates should recover the sampling kappa."""
+        rng = np.random.default_rng(0)
+        for kappa in (0.5, 2.0, 10.0):
+            samples = np.degrees(rng.vonmises(0.0, kappa, 200_000))
+            estimate = von_mises_kappa(resultant_length(samples), len(samples))
+            assert estimate == pytest.approx(kappa, rel=0.05)
+        assert von_mises_kappa(1.0) == np.inf
+
+    def test_vectorized_along_axis(self):
+        """Batches should reduce along an axis in one call."""
+        bearings = np.random.default_rng(1).uniform(0, 360, (1000, 1000))
+
+        means = circular_mean(bearings, axis=1)
+        lengths = resultant_length(bearings, axis=1)
+
+        assert means.shape == lengths.shape == (1000,)
+        assert means[3] == pytest.approx(circular_mean(bearings[3]))
+        assert von_mises_kappa(lengths, 1000).shape == (1000,)
+
+    def test_wrapped_difference_and_direction(self):
+        """Differences wrap into [-180, 180); summed components give a direction."""
+        assert wrapped_difference(10.0, 350.0) == 20.0
+        assert wrapped_difference(350.0, 10.0) == -20.0
+        assert np.array_equal(wrapped_difference([0.0, 90.0], 270.0), [90.0, -180.0])
+        assert resultant_direction(-1.0, 0.0) == 270.0
+
+    def test_mean_longitude_across_antimeridian(self):
+        """Longitudes either side of 180° should average to 180°, not 0°."""
+        assert abs(mean_longitude([179.0, -179.0])) == pytest.approx(180.0)
+        assert mean_longitude([4.35, 4.36]) == pytest.approx(4.355)
+
+
+class TestTriangulationAcrossAntimeridian:
+    """Triangulation should average longitudes circularly."""
+
+    def test_estimates_either_side_of_antimeridian(self):
+        """Estimates straddling 180° should triangulate near 180°, not near 0°."""
+        calculator = HiveCalculator()
+        observations = [
+            Observation(latitude=-16.80, longitude=179.995, bearing=90.0, round_trip_time=600),
+            Observation(latitude=-16.80, longitude=-179.995, bearing=270.0, round_trip_time=600),
+        ]
+
+        hive = calculator.calculate_from_multiple_observations(observations)
+
+        assert abs(hive.longitude) > 179.9
+        assert hive.distance_from_observer < 2000
@@ -0,0 +1,137 @@
+"""Tests for ingest deduplication."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from vespa_finder.dedup import Deduplicator, deduplicate
+from vespa_finder.models import Observation
+
+START = datetime(2026, 7, 1, 12, 0, 0)
+
+
+def observation(seconds=0.0, latitude=50.85, longitude=4.35, bearing=90.0, rtt=300.0, mark=None):
+    return Observation(
+        latitude,
+        longitude,
+        bearing,
+        rtt,
+        timestamp=START + timedelta(seconds=seconds),
+        hornet_color_mark=mark,
+    )
+
+
+class TestDeduplicate:
+    """Tests for deduplicate / Deduplicator."""
+
+    def test_exact_repeat(self):
+        """A resubmitted observation should be dropped and reported."""
+        observations = [observation(), observation(30), observation(600, bearing=200.0)]
+        kept, merged = deduplicate(observations)
+        assert kept == [observations[0], observations[2]]
+        assert merged == [(1, 0)]
+
+    def test_within_tolerances(self):
+        """Small differences in position, bearing and round trip are still duplicates."""
+        first = observation()
+        near = observation(60, latitude=50.85005, longitude=4.35008, bearing=93.0, rtt=306.0)
+        kept, merged = deduplicate([first, near])
+        assert kept == [first]
+        assert merged == [(1, 0)]
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            observation(400),  # later than the time tolerance
+            observation(latitude=50.8503),  # ~33 m away
+            observation(bearing=100.0),
+            observation(rtt=330.0),
+        ],
+    )
+    def test_outside_tolerances(self, other):
+        """Observations differing beyond any tolerance are kept."""
+        kept, merged = deduplicate([observation(), other])
+        assert len(kept) == 2
+        assert merged == []
+
+    def test_bearing_wraps(self):
+        """Bearings either side of north should compare across the seam."""
+        kept, _merged = deduplicate([observation(bearing=358.0), observation(bearing=2.0)])
+        assert len(kept) == 1
+
+    def test_cell_boundary(self):
+        """Duplicates either side of a hash cell boundary should be found."""
+        deduplicator = Deduplicator(distance_tolerance=15.0)
+        first = observation()
+        row, _col = deduplicator._cell(first)
+        # Step north until the second lands in the next cell
+        second = observation(latitude=50.85 + 5 / 111194.9)
+        while deduplicator._cell(second)[0] == row:
+            second = observation(latitude=second.latitude + 5 / 111194.9)
+        assert deduplicator.add(first) is None
+        assert deduplicator.add(second) == 0
+
+    @pytest.mark.parametrize("longitude", [140.0, -120.0, 175.0])
+    def test_far_from_greenwich(self, longitude):
+        """Pairs a few meters apart north-south should merge at any longitude."""
+        deduplicator = Deduplicator(distance_tolerance=15.0)
+        missed = 0
+        for i in range(200):
+            first = observation(60 * i, latitude=30.0 + i * 0.1, longitude=longitude)
+            second = observation(60 * i + 5, latitude=first.latitude + 8e-5, longitude=longitude)
+            deduplicator.add(first)
+            missed += deduplicator.add(second) is None
+        assert missed == 0
+
+    def test_poleward_of_first_observation(self):
+        """Cells sized at the first latitude should still cover observations nearer a pole."""
+        deduplicator = Deduplicator(distance_tolerance=15.0)
+        deduplicator.add(observation(latitude=10.0, longitude=100.0))
+        first = observation(60, latitude=70.0, longitude=100.0)
+        # ~12 m east at 70° N: more than one 10° N cell width away in degrees
+        second = observation(70, latitude=70.0, longitude=100.0 + 12 / (111194.9 * 0.342))
+        assert deduplicator.add(first) is None
+        assert deduplicator.add(second) == 1
+
+    def test_color_marks(self):
+        """Different color marks are different hornets; a missing mark matches any."""
+        kept, _ = deduplicate([observation(mark="red"), observation(mark="blue")])
+        assert len(kept) == 2
+        kept, merged = deduplicate([observation(mark="red"), observation(10)])
+        assert len(kept) == 1
+        assert merged == [(1, 0)]
+
+    def test_custom_tolerances(self):
+        """Tolerances should be configurable."""
+        kept, _ = deduplicate([observation(), observation(400)], time_tolerance=600)
+        assert len(kept) == 1
+
+    def test_window_bounds_memory(self):
+        """Only observations inside the time window are remembered."""
+        deduplicator = Deduplicator(time_tolerance=60)
+        kept = list(
+            deduplicator.filter(observation(30 * i, bearing=i * 7 % 360) for i in range(1000))
+        )
+        assert len(kept) == 1000
+        assert deduplicator.remembered <= 3
+        assert deduplicator.kept == 1000
+
+    def test_out_of_order_window(self):
+        """A wider window should catch duplicates arriving out of time order."""
+        stream = [observation(0), observation(1000, bearing=10.0), observation(20)]
+        kept, _ = deduplicate(stream)
+        assert len(kept) == 3
+        kept, merged = deduplicate(stream, window=1200)
+        assert len(kept) == 2
+        assert merged == [(2, 0)]
+
+    def test_duplicate_of_kept(self):
+        """Chained duplicates should point at the kept observation."""
+        kept, merged = deduplicate([observation(), observation(10), observation(20)])
+        assert len(kept) == 1
+        assert merged == [(1, 0), (2, 0)]
+
+    def test_invalid_tolerance(self):
+        """Non-positive distance tolerance should raise."""
+        with pytest.raises(ValueError):
+            Deduplicator(distance_tolerance=0)
@@ -0,0 +1,116 @@
+"""Tests for kernel density rasters."""
+
+import io
+
+import numpy as np
+import pytest
+
+from vespa_finder.calculator import HiveCalculator
+from vespa_finder.density import DensityGrid, hive_density, kernel_density
+from vespa_finder.exporters import write_ascii_grid
+from vespa_finder.geo_utils import destination_point
+from vespa_finder.models import HiveLocation
+
+
+def cell_area_km2(grid):
+    height, width = grid.cell_size
+    latitude = np.radians((grid.north + grid.south) / 2)
+    return (height * 111.19492664) * (width * 111.19492664 * np.cos(latitude))
+
+
+def direct_density(grid, latitude, longitude, sigma):
+    """Exact sum of Gaussians at the cell centers (per km²)."""
+    rows, cols = grid.cell_centers()
+    lat_m = (rows[:, None, None] - latitude) * 111194.92664
+    lon_m = (cols[None, :, None] - longitude) * 111194.92664 * np.cos(np.radians(latitude))
+    kernels = np.exp(-(lat_m**2 + lon_m**2) / (2 * sigma**2)) / (2 * np.pi * sigma**2)
+    return kernels.sum(axis=2) * 1e6
+
+
+class TestKernelDensity:
+    """Tests for kernel_density / hive_density."""
+
+    def test_single_kernel_peak(self):
+        """A single kernel should peak at its center with the Gaussian's height."""
+        for sigma in (100.0, 130.0, 175.0):
+            grid = kernel_density([50.85], [4.35], [sigma], size=300)
+
+            lat, lon, peak = grid.peak()
+            assert lat == pytest.approx(50.85, abs=grid.cell_size[0])
+            assert lon == pytest.approx(4.35, abs=grid.cell_size[1])
+            assert peak == pytest.approx(1e6 / (2 * np.pi * sigma**2), rel=0.02)
+
+    def test_matches_direct_summation(self):
+        """FFT density should match an exact sum of kernels with mixed widths."""
+        rng = np.random.default_rng(0)
+        latitude = 50.85 + rng.normal(0, 0.005, 40)
+        longitude = 4.35 + rng.normal(0, 0.008, 40)
+        sigma = rng.uniform(60, 300, 40)
+
+        grid = kernel_density(latitude, longitude, sigma, size=200)
+        exact = direct_density(grid, latitude, longitude, sigma)
+
+        assert np.abs(grid.values - exact).max() < 0.03 * exact.max()
+
+    def test_mass_is_preserved(self):
+        """Weights should integrate to their sum over a box holding all kernels."""
+        grid = kernel_density(
+            [50.85, 50.86],
+            [4.35, 4.36],
+            [80.0, 150.0],
+            weight=[1.0, 2.5],
+            bounds=(50.84, 4.33, 50.87, 4.38),
+        )
+
+        assert grid.values.sum() * cell_area_km2(grid) == pytest.approx(3.5, rel=1e-3)
+
+    def test_hive_locations_and_batch(self):
+        """Objects and batches of estimates should give the same raster."""
+        batch = HiveCalculator().calculate_batch(
+            [50.85, 50.851, 50.86], [4.35, 4.352, 4.34], [10, 100, 250], [120, 300, 600]
+        )
+
+        from_batch = hive_density(batch, size=64)
+        from_objects = hive_density(batch.to_hive_locations(), size=64)
+
+        assert np.allclose(from_batch.values, from_objects.values)
+
+    def test_explicit_bounds_and_errors(self):
+        """Explicit bounds fix the raster; empty input needs bounds; widths must be positive."""
+        bounds = (50.8, 4.3, 50.9, 4.4)
+
+        grid = kernel_density([], [], [], bounds=bounds, size=50)
+        assert grid.values.max() == 0
+        assert (grid.south, grid.west, grid.north, grid.east) == bounds
+        with pytest.raises(ValueError):
+            kernel_density([], [], [])
+        with pytest.raises(ValueError):
+            kernel_density([50.85], [4.35], [0.0])
+
+
+class TestDensityGrid:
+    """Tests for DensityGrid helpers and export."""
+
+    def test_value_at_and_rgba(self):
+        """Lookups should address the right cell; images follow the values."""
+        hive = HiveLocation(50.85, 4.35, 100.0, 0.0, 0.0)
+        grid = hive_density([hive], size=100)
+        far = destination_point(50.85, 4.35, 90.0, 5000.0)
+
+        assert grid.value_at(50.85, 4.35) == pytest.approx(grid.peak()[2], rel=0.05)
+        assert grid.value_at(*far) == 0.0
+        image = grid.to_rgba()
+        assert image.shape == (*grid.shape, 4)
+        assert image[..., 3].max() == 255
+
+    def test_write_ascii_grid(self):
+        """The ASCII raster should carry the header and one line per row."""
+        grid = DensityGrid(np.array([[0.0, 1.5], [2.0, 0.25]]), 50.0, 4.0, 50.2, 4.4)
+        fh = io.StringIO()
+
+        write_ascii_grid(fh, grid)
+
+        lines = fh.getvalue().splitlines()
+        assert lines[:2] == ["ncols 2", "nrows 2"]
+        assert "yllcorner 50.0" in lines
+        assert lines[-2:] == ["0 1.5", "2 0.25"]
@@ -0,0 +1,210 @@
+"""Tests for round-trip distance models."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from vespa_finder.calculator import HiveCalculator
+from vespa_finder.distance_models import (
+    ConditionsDistanceModel,
+    DistanceModel,
+    EmpiricalDistanceModel,
+    HandlingTimeDistanceModel,
+    get_distance_model,
+)
+from vespa_finder.models import Observation
+
+NOON = datetime(2025, 8, 1, 12, 0)
+
+
+class TestEmpiricalDistanceModel:
+    """The default model should reproduce the Vespawatchers standard."""
+
+    def test_matches_observation_property(self):
+        """Scalar and batch distances should equal 100 m per minute."""
+        model = EmpiricalDistanceModel()
+        observation = Observation(50.85, 4.35, 90.0, 390.0)
+
+        assert model.distance(observation) == observation.estimated_distance_empirical == 650.0
+        assert np.array_equal(model.distances([60.0, 390.0]), [100.0, 650.0])
+
+
+class TestCustomDistanceModel:
+    """Tests for models subclassing DistanceModel."""
+
+    def test_rates_is_required(self):
+        """A subclass without ``rates`` should not be instantiable."""
+
+        class Incomplete(DistanceModel):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    def test_defaults_derive_from_rates(self):
+        """Implementing ``rates`` alone should give scalar and batch distances."""
+
+        class TwoMetersPerSecond(DistanceModel):
+            def rates(self, timestamp=None, temperature=None):  # noqa: ARG002
+                return np.array(2.0)
+
+        model = TwoMetersPerSecond()
+        assert model.distance(Observation(50.85, 4.35, 90.0, 100.0)) == 200.0
+        assert np.array_equal(model.distances([10.0, 50.0]), [20.0, 100.0])
+        assert np.array_equal(model.timing_errors(5.0, (2,)), [10.0, 10.0])
+        assert get_distance_model(model) is model
+
+
+class TestConditionsDistanceModel:
+    """Tests for the temperature and time-of-day model."""
+
+    def test_reference_conditions_match_empirical(self):
+        """At 20 °C around midday (or with unknown conditions) the rate is 100 m/min."""
+        model = ConditionsDistanceModel()
+
+        assert model.rate(NOON, 20.0) == pytest.approx(100 / 60)
+        assert model.rate() == pytest.approx(100 / 60)
+
+    def test_cold_and_late_are_slower(self):
+        """Cold temperatures and evening hours should shorten the distance."""
+        model = ConditionsDistanceModel()
+
+        assert model.rate(NOON, 12.0) < model.rate(NOON, 20.0)
+        assert model.rate(NOON.replace(hour=19, minute=30), 20.0) < model.rate(NOON, 20.0)
+        assert model.rate(NOON, -30.0) == model.rate(NOON, ConditionsDistanceModel.MIN_TEMPERATURE)
+
+    def test_batch_matches_scalar(self):
+        """Vectorized lookups should equal per-observation lookups, including unknowns."""
+        rng = np.random.default_rng(0)
+        times = [NOON + timedelta(minutes=int(m)) for m in rng.integers(-600, 600, 500)]
+        temperatures = rng.uniform(-5.0, 40.0, 500)
+        temperatures[::7] = np.nan
+        round_trips = rng.uniform(30.0, 600.0, 500)
+        model = ConditionsDistanceModel()
+
+        batch = model.distances(round_trips, np.array(times, dtype="M8[us]"), temperatures)
+
+        for i in range(500):
+            temperature = None if np.isnan(temperatures[i]) else float(temperatures[i])
+            observation = Observation(
+                50.85, 4.35, 0.0, float(round_trips[i]), timestamp=times[i], temperature=temperature
+            )
+            assert batch[i] == pytest.approx(model.distance(observation))
+
+    def test_fit_recovers_factors(self):
+        """Fitting to synthetic data should recover the generating factors."""
+        truth = ConditionsDistanceModel(
+            temperature_factors=((10.0, 0.6), (30.0, 1.2)), hour_factors=((8.0, 0.9), (14.0, 1.1))
+        )
+        rng = np.random.default_rng(1)
+        times = np.datetime64("2025-08-01T06:00") + rng.integers(0, 14 * 60, 5000).astype("m8[m]")
+        temperatures = rng.choice([10.0, 20.0, 30.0], 5000)
+        round_trips = rng.uniform(60.0, 600.0, 5000)
+        distances = truth.distances(round_trips, times, temperatures)
+
+        fitted = ConditionsDistanceModel.fit(
+            round_trips,
+            distances,
+            times,
+            temperatures,
+            temperature_knots=(10.0, 20.0, 30.0),
+            hour_knots=(7.0, 14.0, 19.0),
+        )
+
+        predicted = fitted.distances(round_trips, times, temperatures)
+        assert np.median(np.abs(predicted / distances - 1)) < 0.05
+
+    def test_get_distance_model(self):
+        """Names resolve to models; unknown names fail."""
+        assert isinstance(get_distance_model("conditions"), ConditionsDistanceModel)
+        with pytest.raises(ValueError, match="Unknown distance model"):
+            get_distance_model("guess")
+
+
+class TestCalculatorDistanceModel:
+    """Tests for selecting a distance model per calculator."""
+
+    def test_conditions_model_in_calculator(self):
+        """A conditions-aware calculator should shorten cold-weather estimates consistently."""
+        cold = Observation(50.85, 4.35, 45.0, 300.0, timestamp=NOON, temperature=10.0)
+        default = HiveCalculator().calculate_from_single_observation(cold)
+        calculator = HiveCalculator(distance_model="conditions")
+
+        hive = calculator.calculate_from_single_observation(cold)
+        batch = calculator.calculate_batch(
+            [cold.latitude],
+            [cold.longitude],
+            [cold.bearing],
+            [cold.round_trip_time],
+            timestamp=np.array([NOON], dtype="M8[us]"),
+            temperature=[10.0],
+        )
+
+        assert hive.distance_from_observer == pytest.approx(0.7 * default.distance_from_observer)
+        assert hive.calculation_method == "single_observation_conditions"
+        assert batch.distance_from_observer[0] == pytest.approx(hive.distance_from_observer)
+        assert batch.confidence_radius[0] == pytest.approx(hive.confidence_radius)
+
+    def test_temperature_validation(self):
+        """Implausible temperatures should be rejected."""
+        with pytest.raises(ValueError, match="Temperature"):
+            Observation(50.85, 4.35, 45.0, 300.0, temperature=80.0)
+
+
+class TestHandlingTimeDistanceModel:
+    """Tests for the handling-time corrected model."""
+
+    def test_short_trips_are_shortened(self):
+        """Subtracting handling time should shorten short trips relative to the linear rule."""
+        model = HandlingTimeDistanceModel()
+        empirical = EmpiricalDistanceModel()
+
+        assert model.distances([300.0])[0] == pytest.approx(empirical.distances([300.0])[0])
+        assert model.distances([90.0])[0] < 0.5 * empirical.distances([90.0])[0]
+        assert model.distances([5.0])[0] == pytest.approx(10.0 * model.flight_rate)
+
+    def test_uncertainty_widens_confidence(self):
+        """Handling-time spread should be added to the confidence radius, batch and scalar."""
+        observation = Observation(50.85, 4.35, 45.0, 600.0)
+        calculator = HiveCalculator(distance_model="handling")
+        model = calculator.distance_model
+
+        hive = calculator.calculate_from_single_observation(observation)
+        batch = calculator.calculate_batch([50.85], [4.35], [45.0], [600.0])
+
+        timing = HiveCalculator.TIME_UNCERTAINTY * model.flight_rate
+        bearing = hive.distance_from_observer * np.sin(
+            np.radians(HiveCalculator.BEARING_UNCERTAINTY)
+        )
+        handling = model.handling_std * model.flight_rate
+        assert hive.confidence_radius == pytest.approx(
+            np.sqrt(timing**2 + handling**2 + bearing**2)
+        )
+        assert batch.confidence_radius[0] == pytest.approx(hive.confidence_radius)
+        assert hive.calculation_method == "single_observation_handling"
+
+    def test_uncertainty_capped_for_short_trips(self):
+        """Trips barely longer than the minimum flight time cannot hide much handling time."""
+        model = HandlingTimeDistanceModel()
+
+        uncertainties = model.uncertainties([15.0, 600.0])
+
+        assert uncertainties[0] == pytest.approx(5.0 * model.flight_rate)
+        assert uncertainties[1] == pytest.approx(model.handling_std * model.flight_rate)
+        assert model.uncertainty(Observation(50.85, 4.35, 0.0, 15.0)) == uncertainties[0]
+
+    def test_calibrate_from_confirmed_nests(self):
+        """Calibration should recover the flight rate and handling-time distribution."""
+        rng = np.random.default_rng(2)
+        flight = rng.uniform(60.0, 900.0, 4000)
+        handling = rng.normal(45.0, 20.0, 4000)
+        distances = 2.2 * flight
+
+        model = HandlingTimeDistanceModel.calibrate(flight + handling, distances)
+
+        assert model.flight_rate == pytest.approx(2.2, rel=0.02)
+        assert model.handling_time == pytest.approx(45.0, abs=3.0)
+        assert model.handling_std == pytest.approx(20.0, rel=0.1)
+        with pytest.raises(ValueError):
+            HandlingTimeDistanceModel.calibrate([60.0, 120.0], [100.0, 200.0])
@@ -0,0 +1,179 @@
+"""Tests for the streaming GeoJSON, KML and GPX exporters."""
+
+import io
+import json
+import tracemalloc
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from vespa_finder.calculator import HiveCalculator
+from vespa_finder.exporters import confidence_ring, write_geojson, write_gpx, write_kml
+from vespa_finder.geo_utils import haversine_distance
+from vespa_finder.models import Observation
+
+KML_NS = {"kml": "http://www.opengis.net/kml/2.2"}
+GPX_NS = {"gpx": "http://www.topografix.com/GPX/1/1"}
+
+
+def make_observations(count):
+    return (
+        Observation(
+            latitude=50.85 + (i % 100) * 1e-4,
+            longitude=4.35 + (i % 77) * 1e-4,
+            bearing=(i * 11) % 360,
+            round_trip_time=60 + i % 120,
+            timestamp=datetime(2025, 8, 1, 9, 0),
+            notes="Near <garden> & pond" if i == 0 else "",
+            hornet_color_mark="red" if i % 2 else None,
+        )
+        for i in range(count)
+    )
+
+
+@pytest.fixture
+def data():
+    observations = list(make_observations(3))
+    calculator = HiveCalculator()
+    hives = [calculator.calculate_from_multiple_observations(observations)]
+    return observations, hives
+
+
+class TestGeoJSON:
+    """Tests for write_geojson."""
+
+    def test_feature_collection(self, data):
+        """Observations, rays, hives and confidence polygons should be exported."""
+        observations, hives = data
+        out = io.StringIO()
+
+        count = write_geojson(out, observations, hives)
+
+        collection = json.loads(out.getvalue())
+        kinds = [f["properties"]["feature"] for f in collection["features"]]
+        assert count == len(collection["features"]) == 8
+        assert kinds.count("observation") == 3
+        assert kinds.count("bearing_ray") == 3
+        assert kinds.count("confidence_area") == 1
+
+        point = collection["features"][0]["geometry"]["coordinates"]
+        assert point == [4.35, 50.85]  # GeoJSON order is lon, lat
+
+        ray = collection["features"][1]["geometry"]["coordinates"]
+        length = haversine_distance(ray[0][1], ray[0][0], ray[1][1], ray[1][0])
+        assert length == pytest.approx(observations[0].estimated_distance, abs=0.1)
+
+        ring = collection["features"][-1]["geometry"]["coordinates"][0]
+        assert ring[0] == ring[-1]
+
+    def test_text_sequence(self, data):
+        """Sequence mode should write one RS-prefixed feature per line."""
+        observations, _ = data
+        out = io.StringIO()
+
+        write_geojson(out, observations, include_rays=False, sequence=True)
+
+        lines = out.getvalue().rstrip("\n").split("\n")
+        assert len(lines) == 3
+        assert all(line.startswith("\x1e") for line in lines)
+        assert json.loads(lines[0][1:])["geometry"]["type"] == "Point"
+
+    def test_empty_export(self):
+        """No inputs should still produce a valid collection."""
+        out = io.StringIO()
+        assert write_geojson(out) == 0
+        assert json.loads(out.getvalue())["features"] == []
+
+    def test_constant_memory(self):
+        """Streaming a generator should not accumulate features in memory."""
+        sink = type("Sink", (), {"write": lambda _self, _text: None})()
+
+        tracemalloc.start()
+        write_geojson(sink, make_observations(5000))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert peak < 500_000
+
+
+class TestConfidenceRing:
+    """Tests for confidence_ring."""
+
+    def test_vertices_at_radius(self, data):
+        """Every vertex should lie on the confidence circle."""
+        _, hives = data
+        hive = hives[0]
+        ring = confidence_ring(hive, segments=16)
+
+        assert len(ring) == 17
+        for lat, lon in ring:
+            distance = haversine_distance(hive.latitude, hive.longitude, lat, lon)
+            assert distance == pytest.approx(hive.confidence_radius, rel=1e-6)
+
+
+class TestKML:
+    """Tests for write_kml."""
+
+    def test_valid_document(self, data):
+        """Output should be well-formed KML with escaped text."""
+        observations, hives = data
+        out = io.StringIO()
+
+        assert write_kml(out, observations, hives) == 4
+
+        root = ET.fromstring(out.getvalue().encode())
+        placemarks = root.findall(".//kml:Placemark", KML_NS)
+        assert len(placemarks) == 4
+        assert "<garden>" in placemarks[0].find("kml:description", KML_NS).text
+        assert root.findall(".//kml:Polygon", KML_NS)
+
+    def test_missing_timestamp(self):
+        """Observations without a timestamp should have no TimeStamp element."""
+        dated = Observation(50.85, 4.35, 90.0, 60.0, timestamp=datetime(2025, 8, 1, 9, 0))
+        undated = Observation.trusted(50.85, 4.35, 90.0, 60.0, None, None)
+        out = io.StringIO()
+
+        write_kml(out, [dated, undated])
+
+        root = ET.fromstring(out.getvalue().encode())
+        first, second = root.findall(".//kml:Placemark", KML_NS)
+        assert first.find("kml:TimeStamp/kml:when", KML_NS).text == "2025-08-01T09:00:00"
+        assert second.find("kml:TimeStamp", KML_NS) is None
+        assert "None" not in out.getvalue()
+
+
+class TestGPX:
+    """Tests for write_gpx."""
+
+    def test_waypoints(self, data):
+        """Observations and hives should become GPX waypoints."""
+        observations, hives = data
+        out = io.StringIO()
+
+        assert write_gpx(out, observations, hives) == 4
+
+        root = ET.fromstring(out.getvalue().encode())
+        waypoints = root.findall("gpx:wpt", GPX_NS)
+        assert len(waypoints) == 4
+        assert float(waypoints[0].get("lat")) == 50.85
+        assert waypoints[-1].find("gpx:type", GPX_NS).text == "hive"
+
+    def test_times_in_utc(self):
+        """Aware timestamps should be written in UTC; naive and missing ones get no time."""
+        plus_two = timezone(timedelta(hours=2))
+        aware = Observation(
+            50.85, 4.35, 90.0, 60.0, timestamp=datetime(2025, 8, 1, 9, 0, tzinfo=plus_two)
+        )
+        naive = Observation(50.85, 4.35, 90.0, 60.0, timestamp=datetime(2025, 8, 1, 9, 0))
+        undated = Observation.trusted(50.85, 4.35, 90.0, 60.0, None, None)
+        out = io.StringIO()
+
+        write_gpx(out, [aware, naive, undated])
+
+        root = ET.fromstring(out.getvalue().encode())
+        first, second, third = root.findall("gpx:wpt", GPX_NS)
+        assert first.find("gpx:time", GPX_NS).text == "2025-08-01T07:00:00Z"
+        assert second.find("gpx:time", GPX_NS) is None
+        assert third.find("gpx:time", GPX_NS) is None
+        assert "None" not in out.getvalue()
@@ -1,10 +1,16 @@
 """Tests for geographic utility functions."""
 
+import numpy as np
+import pytest
+
 from vespa_finder.geo_utils import (
+    GeoOrigin,
     bearing_between_points,
     destination_point,
+    destination_points,
     format_bearing,
     format_coordinates,
+    geo_origin,
     haversine_distance,
 )
 
@@ -50,6 +56,55 @@ class TestDestinationPoint:
         assert abs(lon) < 0.0001
 
 
+class TestDestinationPoints:
+    """Tests for the vectorized destination_points function."""
+
+    def test_matches_scalar_version(self):
+        """Each row should match destination_point, including dateline wrap."""
+        lats = np.array([48.8584, -33.9, 0.0, 89.0, 10.0])
+        lons = np.array([2.2945, 151.2, 179.999, -45.0, -179.999])
+        bearings = np.array([0.0, 135.0, 90.0, 270.0, 270.0])
+        distances = np.array([1000.0, 25000.0, 5000.0, 300.0, 5000.0])
+
+        result_lats, result_lons = destination_points(lats, lons, bearings, distances)
+
+        for i in range(len(lats)):
+            lat, lon = destination_point(lats[i], lons[i], bearings[i], distances[i])
+            assert result_lats[i] == pytest.approx(lat, abs=1e-12)
+            assert result_lons[i] == pytest.approx(lon, abs=1e-12)
+
+
+class TestGeoOrigin:
+    """Tests for GeoOrigin."""
+
+    def test_destination_identical_to_destination_point(self):
+        """Scalar projections should match destination_point exactly."""
+        origin = GeoOrigin(48.8584, 2.2945)
+        for bearing in (0, 33.3, 90, 181.5, 270, 359.9):
+            for distance in (0, 1.5, 100, 2500, 40000):
+                expected = destination_point(48.8584, 2.2945, bearing, distance)
+                assert origin.destination(bearing, distance) == expected
+
+    def test_destinations_vectorized(self):
+        """Vectorized projections should match scalar ones, with scalar or array distances."""
+        origin = GeoOrigin(-33.9, 179.99)
+        bearings = np.array([0.0, 45.0, 90.0, 135.0, 270.0])
+
+        lats, lons = origin.destinations(bearings, 5000.0)
+        for i, bearing in enumerate(bearings):
+            lat, lon = origin.destination(bearing, 5000.0)
+            assert lats[i] == pytest.approx(lat, abs=1e-12)
+            assert lons[i] == pytest.approx(lon, abs=1e-12)
+
+        distances = np.array([10.0, 20.0, 30.0, 40.0, 50.0])
+        lats, _ = origin.destinations(bearings, distances)
+        assert lats[3] == pytest.approx(origin.destination(135.0, 40.0)[0], abs=1e-12)
+
+    def test_geo_origin_is_cached(self):
+        """The same position should reuse one origin object."""
+        assert geo_origin(50.0, 4.0) is geo_origin(50.0, 4.0)
+
+
 class TestHaversineDistance:
     """Tests for haversine_distance function."""
 
@@ -0,0 +1,144 @@
+"""Tests for spherical and WGS84 geodesic models."""
+
+import numpy as np
+import pytest
+
+from vespa_finder.calculator import HiveCalculator
+from vespa_finder.geo_utils import destination_point, haversine_distance
+from vespa_finder.geodesic import (
+    SphericalGeodesic,
+    WGS84Geodesic,
+    get_geodesic,
+    vincenty_direct,
+    vincenty_inverse,
+)
+from vespa_finder.models import Observation
+
+# Flinders Peak -> Buninyong, Vincenty (1975) / Geoscience Australia worked example
+FLINDERS = (-37.95103341666667, 144.42486788888888)
+BUNINYONG = (-37.65282113888889, 143.92649552777777)
+FLINDERS_BUNINYONG_DISTANCE = 54972.271
+FLINDERS_BUNINYONG_AZIMUTH = 306 + 52 / 60 + 5.37 / 3600
+
+
+def random_lines(count, max_distance, seed=0):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.uniform(-79.0, 79.0, count),
+        rng.uniform(-180.0, 180.0, count),
+        rng.uniform(0.0, 360.0, count),
+        rng.uniform(0.0, max_distance, count),
+    )
+
+
+class TestVincenty:
+    """Tests for the vectorized Vincenty solutions."""
+
+    def test_inverse_reference(self):
+        """The inverse solution should reproduce the published reference line."""
+        distance, azimuth = vincenty_inverse(*FLINDERS, *BUNINYONG)
+
+        assert float(distance) == pytest.approx(FLINDERS_BUNINYONG_DISTANCE, abs=1e-3)
+        assert float(azimuth) == pytest.approx(FLINDERS_BUNINYONG_AZIMUTH, abs=1e-6)
+
+    def test_direct_reference(self):
+        """The direct solution should land on the reference end point."""
+        lat, lon = vincenty_direct(
+            np.array([FLINDERS[0]]),
+            np.array([FLINDERS[1]]),
+            np.array([FLINDERS_BUNINYONG_AZIMUTH]),
+            np.array([FLINDERS_BUNINYONG_DISTANCE]),
+        )
+
+        assert lat[0] == pytest.approx(BUNINYONG[0], abs=1e-7)
+        assert lon[0] == pytest.approx(BUNINYONG[1], abs=1e-7)
+
+    def test_direct_inverse_round_trip(self):
+        """Inverse of a direct projection should return its distance and azimuth."""
+        lat, lon, bearing, distance = random_lines(1000, 1_000_000)
+
+        lat2, lon2 = vincenty_direct(lat, lon, bearing, distance)
+        back_distance, back_bearing = vincenty_inverse(lat, lon, lat2, lon2)
+
+        assert np.allclose(back_distance, distance, atol=1e-5)
+        assert np.allclose((back_bearing - bearing + 180) % 360 - 180, 0, atol=1e-6)
+
+    def test_coincident_and_antipodal_points(self):
+        """Coincident points give zero; non-converging antipodes fall back to the sphere."""
+        distance, _ = vincenty_inverse([50.0, 0.0], [4.0, 0.0], [50.0, 0.5], [4.0, 179.7])
+
+        assert distance[0] == 0
+        assert distance[1] == pytest.approx(haversine_distance(0.0, 0.0, 0.5, 179.7))
+
+
+class TestWGS84Geodesic:
+    """Tests for WGS84Geodesic."""
+
+    def test_fast_path_matches_vincenty(self):
+        """Short projections should stay within a millimetre of Vincenty."""
+        lat, lon, bearing, distance = random_lines(5000, 2000)
+        model = WGS84Geodesic()
+
+        lat2, lon2 = model.direct(lat, lon, bearing, distance)
+        error, _ = vincenty_inverse(lat2, lon2, *vincenty_direct(lat, lon, bearing, distance))
+
+        assert error.max() < 1e-3
+
+    def test_scalar_matches_vectorized(self):
+        """Cached scalar projections should agree with the vectorized path."""
+        lat, lon, bearing, distance = random_lines(200, 3000, seed=1)
+        model = WGS84Geodesic()
+
+        lat2, lon2 = model.direct(lat, lon, bearing, distance)
+        for i in range(len(lat)):
+            point = model.destination(lat[i], lon[i], bearing[i], distance[i])
+            error, _ = model.distance_and_bearing(*point, lat2[i], lon2[i])
+            assert error < 1e-3
+
+    def test_differs_from_sphere(self):
+        """Ellipsoidal and spherical results should differ measurably but slightly."""
+        ellipsoidal = WGS84Geodesic().destination(50.85, 4.35, 0.0, 1000.0)
+        spherical = destination_point(50.85, 4.35, 0.0, 1000.0)
+
+        offset = haversine_distance(*ellipsoidal, *spherical)
+        assert 0.1 < offset < 10
+
+
+class TestGeodesicSelection:
+    """Tests for selecting a model per calculator."""
+
+    def test_get_geodesic(self):
+        """Names resolve to models; instances pass through; unknown names fail."""
+        model = WGS84Geodesic(fast_path_max_distance=0)
+
+        assert isinstance(get_geodesic("spherical"), SphericalGeodesic)
+        assert get_geodesic(model) is model
+        with pytest.raises(ValueError, match="Unknown geodesic model"):
+            get_geodesic("flat")
+
+    def test_default_calculator_is_spherical(self):
+        """The default calculator should keep the spherical results."""
+        observation = Observation(latitude=50.85, longitude=4.35, bearing=45, round_trip_time=300)
+
+        hive = HiveCalculator().calculate_from_single_observation(observation)
+
+        assert (hive.latitude, hive.longitude) == destination_point(50.85, 4.35, 45, 500.0)
+
+    def test_wgs84_calculator(self):
+        """A WGS84 calculator should place hives at the ellipsoidal distance."""
+        calculator = HiveCalculator(geodesic="wgs84")
+        observations = [
+            Observation(latitude=50.85, longitude=4.35, bearing=45, round_trip_time=300),
+            Observation(latitude=50.86, longitude=4.36, bearing=200, round_trip_time=420),
+        ]
+
+        hive = calculator.calculate_from_single_observation(observations[0])
+        distance, bearing = vincenty_inverse(50.85, 4.35, hive.latitude, hive.longitude)
+        assert float(distance) == pytest.approx(500.0, abs=1e-3)
+        assert float(bearing) == pytest.approx(45.0, abs=1e-5)
+
+        batch = calculator.calculate_batch([50.85], [4.35], [45], [300])
+        assert batch.latitude[0] == pytest.approx(hive.latitude, abs=1e-9)
+
+        triangulated = calculator.calculate_from_multiple_observations(observations)
+        assert triangulated.calculation_method == "triangulation_2_points_empirical"
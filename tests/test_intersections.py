@@ -0,0 +1,123 @@
+"""Tests for pairwise bearing-ray intersections."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from vespa_finder.calculator import HiveCalculator
+from vespa_finder.geo_utils import destination_point, haversine_distance
+from vespa_finder.intersections import intersect_observations, intersect_rays
+from vespa_finder.models import Observation
+
+
+def city_rays(count, seed=0):
+    """Random observations spread over ~20 km with 0.5-10 minute round trips."""
+    rng = np.random.default_rng(seed)
+    return (
+        50.85 + rng.uniform(-0.09, 0.09, count),
+        4.35 + rng.uniform(-0.14, 0.14, count),
+        rng.uniform(0.0, 360.0, count),
+        rng.uniform(30.0, 600.0, count),
+    )
+
+
+def pair_set(result):
+    return set(zip(result.first.tolist(), result.second.tolist(), strict=True))
+
+
+class TestIntersectRays:
+    """Tests for intersect_rays / intersect_observations."""
+
+    def test_crossing_pair(self):
+        """Two observers 1 km apart looking inwards should meet north of their midpoint."""
+        west = Observation(latitude=50.85, longitude=4.35, bearing=45.0, round_trip_time=424)
+        east_lat, east_lon = destination_point(50.85, 4.35, 90.0, 1000.0)
+        east = Observation(
+            latitude=east_lat, longitude=east_lon, bearing=315.0, round_trip_time=424
+        )
+
+        result = intersect_observations([west, east])
+
+        assert len(result) == 1
+        assert (result.first[0], result.second[0]) == (0, 1)
+        assert result.angle[0] == pytest.approx(90.0, abs=0.01)
+        expected = destination_point(50.85, 4.35, 45.0, 500.0 * np.sqrt(2))
+        assert haversine_distance(result.latitude[0], result.longitude[0], *expected) < 1.0
+        # Both rays estimate ~707 m, right where they cross
+        assert result.weight[0] == pytest.approx(1.0, abs=1e-3)
+
+    def test_observation_weights(self):
+        """Observation weights should scale each crossing by both observers' weights."""
+        lat, lon, bearing, rtt = city_rays(300, seed=3)
+        plain = intersect_rays(lat, lon, bearing, rtt)
+        weight = np.linspace(0.1, 1.0, 300)
+        weighted = intersect_rays(lat, lon, bearing, rtt, observation_weight=weight)
+
+        assert pair_set(weighted) == pair_set(plain)
+        expected = plain.weight * weight[plain.first] * weight[plain.second]
+        np.testing.assert_allclose(weighted.weight, expected)
+
+    def test_conditions_reach_distance_model(self):
+        """Observation temperatures should change the ray ranges of a conditions model."""
+        noon = datetime(2026, 7, 1, 12, 0)
+        west = Observation(50.85, 4.35, 45.0, 424, timestamp=noon, temperature=20.0)
+        east_lat, east_lon = destination_point(50.85, 4.35, 90.0, 1000.0)
+        east = Observation(east_lat, east_lon, 315.0, 424, timestamp=noon, temperature=20.0)
+        calculator = HiveCalculator(distance_model="conditions")
+
+        mild = intersect_observations([west, east], calculator=calculator)
+        west.temperature = east.temperature = 18.0
+        cool = intersect_observations([west, east], calculator=calculator)
+
+        # Cooler rays are predicted shorter than the distance to where they cross
+        assert cool.weight[0] < mild.weight[0]
+
+    def test_rejects_parallel_diverging_and_short_rays(self):
+        """Parallel, diverging or out-of-range rays should not intersect."""
+        base = {"latitude": 50.85, "round_trip_time": 300}
+        observations = [
+            Observation(longitude=4.35, bearing=0.0, **base),
+            Observation(longitude=4.36, bearing=0.0, **base),  # parallel
+            Observation(longitude=4.37, bearing=90.0, **base),  # pointing away
+            Observation(longitude=4.40, bearing=270.0, round_trip_time=30, latitude=50.85),
+        ]
+
+        assert len(intersect_observations(observations)) == 0
+
+    def test_pruning_matches_brute_force(self):
+        """Grid pruning should find exactly the intersections found with a single cell."""
+        lat, lon, bearing, rtt = city_rays(800)
+
+        pruned = intersect_rays(lat, lon, bearing, rtt)
+        brute = intersect_rays(lat, lon, bearing, rtt, cell_size=1e9)
+
+        assert pruned.pairs_tested == brute.pairs_tested
+        assert pruned.pairs_tested < 800 * 799 // 2 / 5
+        assert pair_set(pruned) == pair_set(brute)
+        assert len(pruned) > 0
+
+    def test_wgs84_calculator(self):
+        """Intersections should follow the calculator's geodesic model."""
+        lat, lon, bearing, rtt = city_rays(200, seed=1)
+
+        spherical = intersect_rays(lat, lon, bearing, rtt)
+        ellipsoidal = intersect_rays(lat, lon, bearing, rtt, calculator=HiveCalculator("wgs84"))
+
+        assert pair_set(spherical) == pair_set(ellipsoidal)
+        offsets = [
+            haversine_distance(a, b, c, d)
+            for a, b, c, d in zip(
+                spherical.latitude,
+                spherical.longitude,
+                ellipsoidal.latitude,
+                ellipsoidal.longitude,
+                strict=True,
+            )
+        ]
+        assert 0 < max(offsets) < 20
+
+    def test_empty_and_single(self):
+        """Fewer than two rays should give an empty result."""
+        assert len(intersect_rays([], [], [], [])) == 0
+        assert len(intersect_rays([50.0], [4.0], [0.0], [60.0])) == 0
@@ -0,0 +1,125 @@
+"""Tests for the mock Waarneming.nl API and load harness."""
+
+import pytest
+import requests
+
+from vespa_finder.bulk_submit import RetryPolicy
+from vespa_finder.mock_api import (
+    MockServerConfig,
+    MockWildlifeServer,
+    run_load_test,
+    synthetic_reports,
+)
+from vespa_finder.wildlife_api import WildlifeAPIError, WildlifeReporter
+
+FAST_RETRIES = RetryPolicy(max_retries=10, backoff_base=0.001, backoff_max=0.02)
+
+
+@pytest.fixture
+def server():
+    """Default mock server."""
+    with MockWildlifeServer() as mock:
+        yield mock
+
+
+class TestMockWildlifeServer:
+    """Tests for the request contract of MockWildlifeServer."""
+
+    def test_path_matches_reporter_endpoint(self, server):
+        """The mock should serve the path configured for Waarneming.nl."""
+        assert server.api_url.endswith("/api/v1/observations")
+
+    def test_reporter_submission(self, server):
+        """WildlifeReporter should submit successfully to the mock."""
+        observation, hive = synthetic_reports(1)[0]
+        reporter = WildlifeReporter(waarneming_api_url=server.api_url)
+
+        result = reporter.report_to_waarneming(observation, hive, api_key="key")
+
+        assert result["status"] == "success"
+        assert result["observation_id"] == 1
+        assert server.accepted[0]["species"] == "Vespa velutina"
+
+    def test_requires_bearer_token(self, server):
+        """Requests without authorization should be rejected."""
+        response = requests.post(server.api_url, json={}, timeout=5)
+        assert response.status_code == 401
+
+    def test_rejects_wrong_api_key(self):
+        """A configured API key should be enforced."""
+        with MockWildlifeServer(MockServerConfig(api_key="secret")) as mock:
+            observation, hive = synthetic_reports(1)[0]
+            reporter = WildlifeReporter(waarneming_api_url=mock.api_url)
+            with pytest.raises(WildlifeAPIError):
+                reporter.report_to_waarneming(observation, hive, api_key="wrong")
+            assert mock.status_counts[401] == 1
+
+    def test_validates_payload(self, server):
+        """Observations missing required fields should get HTTP 400."""
+        response = requests.post(
+            server.api_url,
+            json={"species": "Vespa velutina"},
+            headers={"Authorization": "Bearer key"},
+            timeout=5,
+        )
+        assert response.status_code == 400
+        assert "latitude" in response.json()["error"]
+
+    def test_unknown_path(self, server):
+        """Other paths should return 404."""
+        url = server.api_url.replace("/observations", "/unknown")
+        response = requests.post(url, json={}, headers={"Authorization": "Bearer k"}, timeout=5)
+        assert response.status_code == 404
+
+    def test_throttling(self):
+        """Requests above the rate limit should get 429 with Retry-After."""
+        config = MockServerConfig(rate_limit=1, burst=2, retry_after=3)
+        with MockWildlifeServer(config) as mock:
+            statuses = []
+            for _ in range(4):
+                response = requests.post(
+                    mock.api_url,
+                    json={"species": "x", "latitude": 0, "longitude": 0, "date": "2025-01-01"},
+                    headers={"Authorization": "Bearer key"},
+                    timeout=5,
+                )
+                statuses.append(response.status_code)
+
+        assert statuses[:2] == [201, 201]
+        assert 429 in statuses[2:]
+        assert response.headers["Retry-After"] == "3"
+
+    def test_error_rate(self):
+        """An error rate of 1 should fail every request with 503."""
+        with MockWildlifeServer(MockServerConfig(error_rate=1.0)) as mock:
+            response = requests.post(
+                mock.api_url, json={}, headers={"Authorization": "Bearer key"}, timeout=5
+            )
+        assert response.status_code == 503
+
+
+class TestLoadHarness:
+    """Tests for run_load_test."""
+
+    def test_load_test_with_failures_recovers(self):
+        """Injected errors and throttling should be absorbed by retries."""
+        config = MockServerConfig(error_rate=0.2, rate_limit=2000, burst=20, retry_after=0, seed=1)
+        with MockWildlifeServer(config) as mock:
+            report = run_load_test(
+                mock.api_url, count=100, max_concurrency=8, retry_policy=FAST_RETRIES
+            )
+
+            assert report.total == 100
+            assert report.succeeded == 100
+            assert report.retries > 0
+            assert len(mock.accepted) == 100
+            assert mock.status_counts[503] == report.retries - mock.status_counts[429]
+        assert report.throughput > 0
+        assert report.latency_percentile(99) >= report.latency_percentile(50)
+
+    def test_latency_is_reflected(self):
+        """Server latency should show up in the measured latency."""
+        with MockWildlifeServer(MockServerConfig(latency=0.02)) as mock:
+            report = run_load_test(mock.api_url, count=20, max_concurrency=4)
+
+        assert report.latency_percentile(50) >= 0.02
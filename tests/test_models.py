@@ -1,5 +1,6 @@
 """Tests for data models."""
 
+import pickle
 from datetime import datetime
 
 import pytest
@@ -219,6 +220,44 @@ class TestObservation:
         assert obs.estimated_distance == obs.estimated_distance_empirical
 
 
+class TestTrustedObservation:
+    """Tests for slotted models and Observation.trusted."""
+
+    def test_trusted_matches_validated(self):
+        """A trusted observation should equal the validated one with the same values."""
+        timestamp = datetime(2026, 7, 1, 12, 0)
+        validated = Observation(50.85, 4.35, 90.0, 300.0, 5.0, timestamp, "note", "red", 21.0)
+        trusted = Observation.trusted(50.85, 4.35, 90.0, 300.0, 5.0, timestamp, "note", "red", 21.0)
+        assert trusted == validated
+        assert trusted.estimated_distance == validated.estimated_distance
+
+    def test_trusted_skips_validation(self):
+        """Trusted construction does no checks and sets no default timestamp."""
+        observation = Observation.trusted(123.0, 4.35, 360.0, -1.0, None, None)
+        assert observation.latitude == 123.0
+        assert observation.bearing == 360.0
+        assert observation.timestamp is None
+        assert observation.notes == ""
+        assert observation.hornet_color_mark is None
+        assert observation.temperature is None
+
+    def test_slots(self):
+        """Models should use slots (no per-instance dict, no stray attributes)."""
+        observation = Observation(50.85, 4.35, 90.0, 300.0)
+        hive = HiveLocation(50.86, 4.36, 100.0, 500.0, 45.0)
+        for instance in (observation, hive):
+            assert not hasattr(instance, "__dict__")
+            with pytest.raises(AttributeError):
+                instance.unknown_field = 1
+
+    def test_pickle(self):
+        """Slotted models should still pickle (worker processes, caches)."""
+        observation = Observation(50.85, 4.35, 90.0, 300.0, hornet_color_mark="red")
+        hive = HiveLocation(50.86, 4.36, 100.0, 500.0, 45.0)
+        assert pickle.loads(pickle.dumps(observation)) == observation
+        assert pickle.loads(pickle.dumps(hive)) == hive
+
+
 class TestHiveLocation:
     """Tests for HiveLocation model."""
 
@@ -0,0 +1,193 @@
+"""Tests for the offline report outbox."""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from vespa_finder.bulk_submit import RetryPolicy, SubmissionResult
+from vespa_finder.models import HiveLocation, Observation
+from vespa_finder.outbox import OutboxDrainer, ReportOutbox, idempotency_key
+from vespa_finder.wildlife_api import WildlifeReporter
+
+BASE_TIME = datetime(2025, 8, 1, 14, 0, 0)
+
+
+def make_observation(i=0):
+    return Observation(
+        latitude=52.37,
+        longitude=4.89,
+        bearing=float(i % 360),
+        round_trip_time=300,
+        timestamp=BASE_TIME + timedelta(seconds=i),
+    )
+
+
+class FakeSubmitter:
+    """Records payloads and answers with scripted status codes."""
+
+    def __init__(self, statuses=()):
+        self.statuses = list(statuses)
+        self.payloads = []
+
+    def submit_one(self, payload, index=0):
+        self.payloads.append(payload)
+        status = self.statuses.pop(0) if self.statuses else 201
+        return SubmissionResult(
+            index=index,
+            success=status is not None and status < 300,
+            attempts=1,
+            latency=0.0,
+            status_code=status,
+            observation_id=len(self.payloads),
+            error=None if status == 201 else f"status {status}",
+        )
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    """Outbox stored in a temporary file."""
+    box = ReportOutbox(str(tmp_path / "outbox.sqlite"))
+    yield box
+    box.close()
+
+
+class TestIdempotencyKey:
+    """Tests for idempotency_key."""
+
+    def test_same_observation_same_key(self):
+        """Identical field records should produce the same key."""
+        assert idempotency_key(make_observation(1)) == idempotency_key(make_observation(1))
+
+    def test_different_observation_different_key(self):
+        """Different records or databases should produce different keys."""
+        assert idempotency_key(make_observation(1)) != idempotency_key(make_observation(2))
+        assert idempotency_key(make_observation(1)) != idempotency_key(
+            make_observation(1), database="vespawatch"
+        )
+
+
+class TestReportOutbox:
+    """Tests for ReportOutbox."""
+
+    def test_enqueue_deduplicates(self, outbox):
+        """Queueing the same observation twice should store it once."""
+        assert outbox.enqueue(make_observation(1), {"n": 1})
+        assert not outbox.enqueue(make_observation(1), {"n": 1})
+        assert outbox.count() == 1
+
+    def test_enqueue_many(self, outbox):
+        """Batch enqueue should report only newly queued items."""
+        reports = [(make_observation(i), {"n": i}) for i in range(100)]
+        assert outbox.enqueue_many(reports) == 100
+        assert outbox.enqueue_many(reports[:10]) == 0
+        assert outbox.count() == 100
+
+    def test_persists_across_reopen(self, tmp_path):
+        """Queued items should survive closing the outbox."""
+        path = str(tmp_path / "outbox.sqlite")
+        box = ReportOutbox(path)
+        box.enqueue(make_observation(1), {"n": 1})
+        box.close()
+
+        reopened = ReportOutbox(path)
+        items = list(reopened.iter_due())
+        reopened.close()
+        assert [item.payload for item in items] == [{"n": 1}]
+
+    def test_iter_due_pages_through_all_items(self, outbox):
+        """Paged iteration should return every item once, oldest first."""
+        outbox.enqueue_many((make_observation(i), {"n": i}) for i in range(2500))
+        items = list(outbox.iter_due(batch_size=300))
+        assert [item.payload["n"] for item in items] == list(range(2500))
+
+    def test_iter_due_skips_deferred(self, outbox):
+        """Items scheduled for later should not be due yet."""
+        outbox.enqueue(make_observation(1), {"n": 1})
+        (item,) = outbox.iter_due()
+        outbox.mark_retry(item.key, "offline", retry_at=time.time() + 3600)
+        assert list(outbox.iter_due()) == []
+
+
+class TestOutboxDrainer:
+    """Tests for OutboxDrainer."""
+
+    def make_drainer(self, outbox, submitter):
+        return OutboxDrainer(
+            outbox,
+            submitter,
+            rate=1000.0,
+            retry_policy=RetryPolicy(backoff_base=60.0, backoff_max=60.0),
+        )
+
+    def test_drain_sends_all(self, outbox):
+        """Due items should be submitted and marked sent."""
+        outbox.enqueue_many((make_observation(i), {"n": i}) for i in range(5))
+        submitter = FakeSubmitter()
+
+        result = self.make_drainer(outbox, submitter).drain_once()
+
+        assert result.sent == 5
+        assert outbox.count() == 0
+        assert outbox.count(ReportOutbox.STATUS_SENT) == 5
+
+    def test_drain_stops_when_offline(self, outbox):
+        """A connection failure should defer the item and end the pass."""
+        outbox.enqueue_many((make_observation(i), {"n": i}) for i in range(5))
+        submitter = FakeSubmitter(statuses=[201, None])
+
+        result = self.make_drainer(outbox, submitter).drain_once()
+
+        assert result.sent == 1
+        assert result.deferred == 1
+        assert result.offline
+        assert len(submitter.payloads) == 2
+        assert outbox.count() == 4
+
+    def test_rejected_items_not_retried(self, outbox):
+        """Client errors should mark items as permanently failed."""
+        outbox.enqueue(make_observation(1), {"n": 1})
+        result = self.make_drainer(outbox, FakeSubmitter(statuses=[400])).drain_once()
+
+        assert result.failed == 1
+        assert outbox.count(ReportOutbox.STATUS_FAILED) == 1
+        assert list(outbox.iter_due()) == []
+
+    def test_background_drain(self, outbox):
+        """The background thread should drain items queued after it started."""
+        drainer = self.make_drainer(outbox, FakeSubmitter())
+        drainer.start()
+        try:
+            outbox.enqueue_many((make_observation(i), {"n": i}) for i in range(3))
+            drainer.notify()
+            deadline = time.monotonic() + 5
+            while outbox.count() and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            drainer.stop(timeout=5)
+
+        assert outbox.count(ReportOutbox.STATUS_SENT) == 3
+
+
+class TestReporterOutbox:
+    """Tests for queueing from WildlifeReporter."""
+
+    def test_unreachable_api_queues_report(self, outbox):
+        """Connection errors should queue the report instead of raising."""
+        reporter = WildlifeReporter(waarneming_api_url="http://127.0.0.1:9/api/v1/observations")
+        observation = make_observation(1)
+        hive = HiveLocation(
+            latitude=52.37,
+            longitude=4.897,
+            confidence_radius=100.0,
+            distance_from_observer=500.0,
+            bearing_from_observer=90.0,
+        )
+
+        first = reporter.report_to_waarneming(observation, hive, api_key="k", outbox=outbox)
+        second = reporter.report_to_waarneming(observation, hive, api_key="k", outbox=outbox)
+
+        assert first["status"] == "queued"
+        assert not first["duplicate"]
+        assert second["duplicate"]
+        assert outbox.count() == 1
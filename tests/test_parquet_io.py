@@ -0,0 +1,226 @@
+"""Tests for Parquet export and import (skipped without pyarrow)."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from vespa_finder.archive import ArchiveError, ObservationArchive  # noqa: E402
+from vespa_finder.calculator import HiveCalculator  # noqa: E402
+from vespa_finder.models import Observation  # noqa: E402
+from vespa_finder.parquet_io import (  # noqa: E402
+    export_archive_parquet,
+    import_parquet_to_archive,
+    read_hive_locations_parquet,
+    read_observations_parquet,
+    write_hive_locations_parquet,
+    write_observations_parquet,
+)
+
+START = datetime(2025, 8, 1, 8, 0)
+
+
+def make_observations(count):
+    return [
+        Observation(
+            latitude=50.8 + i * 1e-5,
+            longitude=4.3 + i * 1e-5,
+            bearing=(i * 7.5) % 360,
+            round_trip_time=30 + i % 200,
+            speed=None if i % 2 else 4.5,
+            timestamp=START + timedelta(minutes=i),
+            notes="" if i % 5 else f"note {i}",
+            hornet_color_mark=[None, "red", "blue"][i % 3],
+            temperature=None if i % 3 else 15.0 + i % 10,
+        )
+        for i in range(count)
+    ]
+
+
+class TestObservationParquet:
+    """Tests for observation export/import."""
+
+    def test_round_trip(self, tmp_path):
+        """Observations should round-trip through Parquet."""
+        path = str(tmp_path / "obs.parquet")
+        observations = make_observations(250)
+
+        assert write_observations_parquet(path, observations, row_group_size=100) == 250
+
+        assert read_observations_parquet(path, batch_size=64) == observations
+
+    def test_without_temperature_column(self, tmp_path):
+        """Files written before the temperature column should read it as None."""
+        path = str(tmp_path / "old.parquet")
+        write_observations_parquet(path, make_observations(20))
+        pq.write_table(pq.read_table(path).drop_columns(["temperature"]), path)
+
+        observations = read_observations_parquet(path)
+
+        assert [o.temperature for o in observations] == [None] * 20
+        target = ObservationArchive.create(str(tmp_path / "target"))
+        assert import_parquet_to_archive(path, target) == 20
+        assert np.isnan(target.column("temperature")).all()
+
+    def test_schema_and_row_groups(self, tmp_path):
+        """Color marks should be dictionary-encoded and rows grouped as requested."""
+        path = str(tmp_path / "obs.parquet")
+        write_observations_parquet(path, iter(make_observations(250)), row_group_size=100)
+
+        parquet_file = pq.ParquetFile(path)
+        schema = parquet_file.schema_arrow
+
+        assert parquet_file.metadata.num_row_groups == 3
+        assert pa.types.is_dictionary(schema.field("hornet_color_mark").type)
+        assert schema.field("timestamp").type == pa.timestamp("us")
+        assert schema.metadata[b"vespa_finder.kind"] == b"observations"
+
+
+class TestArchiveParquet:
+    """Tests for archive export/import."""
+
+    def test_archive_round_trip(self, tmp_path):
+        """Importing into an archive with a different mark dictionary should remap marks."""
+        source = ObservationArchive.create(str(tmp_path / "source"), index_stride=16)
+        source.append(make_observations(300))
+        path = str(tmp_path / "season.parquet")
+
+        assert export_archive_parquet(source, path, row_group_size=128) == 300
+
+        target = ObservationArchive.create(str(tmp_path / "target"))
+        earlier = Observation(50.0, 4.0, 0, 60, timestamp=START, hornet_color_mark="blue")
+        target.append([earlier])
+        assert import_parquet_to_archive(path, target, batch_size=50) == 300
+
+        imported = target.rows(1, len(target))
+        assert target.marks[0] == "blue"
+        assert imported.color_marks() == source.rows(0, 300).color_marks()
+        assert np.array_equal(imported.timestamp, source.column("timestamp"))
+
+    def test_slice_export_and_import(self, tmp_path):
+        """A time-range slice should export and re-import with remapped marks."""
+        source = ObservationArchive.create(str(tmp_path / "source"), index_stride=16)
+        source.append(make_observations(300))
+        window = source.time_range(START + timedelta(minutes=100), START + timedelta(minutes=200))
+        path = str(tmp_path / "window.parquet")
+
+        assert export_archive_parquet(window, path, row_group_size=32) == 100
+
+        target = ObservationArchive.create(str(tmp_path / "target"))
+        assert import_parquet_to_archive(path, target, batch_size=40) == 100
+        imported = target.rows(0, len(target))
+        for name in ("latitude", "bearing", "round_trip_time", "timestamp"):
+            assert np.array_equal(imported.columns[name], window.columns[name])
+        np.testing.assert_array_equal(imported.temperature, window.temperature)
+        assert np.array_equal(np.isnan(imported.speed), np.isnan(window.speed))
+        assert imported.color_marks() == window.color_marks()
+
+    def test_import_without_marks(self, tmp_path):
+        """A batch whose color marks are all null should import as unmarked rows."""
+        path = str(tmp_path / "unmarked.parquet")
+        observations = [
+            Observation(50.8, 4.3, 90.0, 60.0, timestamp=START + timedelta(minutes=i))
+            for i in range(3)
+        ]
+        write_observations_parquet(path, observations)
+
+        target = ObservationArchive.create(str(tmp_path / "target"))
+        assert import_parquet_to_archive(path, target) == 3
+        assert target.rows(0, 3).color_marks() == [None, None, None]
+
+    def test_import_rejects_invalid_rows(self, tmp_path):
+        """Out-of-range values and missing timestamps should not reach the archive."""
+        path = str(tmp_path / "bad.parquet")
+        table = pa.table(
+            {
+                "latitude": [200.0],
+                "longitude": [4.3],
+                "bearing": [400.0],
+                "round_trip_time": [-5.0],
+                "speed": [-1.0],
+                "timestamp": pa.array([None], pa.timestamp("us")),
+            }
+        )
+        pq.write_table(table, path)
+
+        target = ObservationArchive.create(str(tmp_path / "target"))
+        with pytest.raises(ArchiveError):
+            import_parquet_to_archive(path, target)
+        assert len(ObservationArchive(target.path)) == 0
+
+    def test_aware_timestamps_across_paths(self, tmp_path):
+        """Time-of-day models should give the same distance directly, archived and via Parquet."""
+        paris = timezone(timedelta(hours=2))
+        observations = [
+            Observation(50.85, 4.35, 90.0, 300.0, timestamp=START.replace(hour=h, tzinfo=paris))
+            for h in (7, 8, 21)
+        ]
+        calculator = HiveCalculator(distance_model="conditions")
+        direct = [
+            calculator.calculate_from_single_observation(o).distance_from_observer
+            for o in observations
+        ]
+
+        path = str(tmp_path / "aware.parquet")
+        write_observations_parquet(path, observations)
+        read_back = read_observations_parquet(path)
+        assert [o.timestamp.isoformat() for o in read_back] == [
+            o.timestamp.isoformat() for o in observations
+        ]
+
+        archived = ObservationArchive.create(str(tmp_path / "archived"))
+        archived.append(observations)
+        imported = ObservationArchive.create(str(tmp_path / "imported"))
+        import_parquet_to_archive(path, imported)
+        exported = str(tmp_path / "exported.parquet")
+        export_archive_parquet(archived, exported)
+
+        for distances in (
+            [
+                calculator.calculate_from_single_observation(o).distance_from_observer
+                for o in read_back
+            ],
+            archived.rows(0, 3).calculate(calculator).distance_from_observer,
+            imported.rows(0, 3).calculate(calculator).distance_from_observer,
+            [
+                calculator.calculate_from_single_observation(o).distance_from_observer
+                for o in read_observations_parquet(exported)
+            ],
+        ):
+            np.testing.assert_allclose(distances, direct)
+
+
+class TestHiveLocationParquet:
+    """Tests for hive location export/import."""
+
+    def test_objects_round_trip(self, tmp_path):
+        """HiveLocation objects should round-trip."""
+        calculator = HiveCalculator()
+        locations = [calculator.calculate_from_single_observation(o) for o in make_observations(20)]
+        path = str(tmp_path / "hives.parquet")
+
+        write_hive_locations_parquet(path, locations)
+
+        assert read_hive_locations_parquet(path) == locations
+
+    def test_batch_export(self, tmp_path):
+        """A HiveLocationBatch should be written column-wise."""
+        observations = make_observations(50)
+        batch = HiveCalculator().calculate_batch(
+            [o.latitude for o in observations],
+            [o.longitude for o in observations],
+            [o.bearing for o in observations],
+            [o.round_trip_time for o in observations],
+        )
+        path = str(tmp_path / "hives.parquet")
+
+        assert write_hive_locations_parquet(path, batch, row_group_size=20) == 50
+
+        table = pq.read_table(path)
+        assert np.array_equal(table.column("latitude").to_numpy(), batch.latitude)
+        assert set(table.column("calculation_method").to_pylist()) == {
+            "single_observation_empirical"
+        }
@@ -0,0 +1,143 @@
+"""Tests for observation quality scoring."""
+
+import time
+import warnings
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from vespa_finder.models import Observation
+from vespa_finder.quality import (
+    FLAG_IMPLAUSIBLE_SPEED,
+    FLAG_INCONSISTENT_BEARING,
+    FLAG_LONG_ROUND_TRIP,
+    FLAG_NIGHT,
+    FLAG_SHORT_ROUND_TRIP,
+    QualityScorer,
+    score_observations,
+)
+
+NOON = datetime(2026, 7, 1, 12, 0, 0)
+
+
+def observation(bearing=90.0, rtt=300.0, speed=None, timestamp=NOON, latitude=50.85):
+    return Observation(latitude, 4.35, bearing, rtt, speed=speed, timestamp=timestamp)
+
+
+class TestQualityScorer:
+    """Tests for QualityScorer / score_observations."""
+
+    def test_clean_observation(self):
+        """A plausible observation should be unflagged with weight 1."""
+        scores = score_observations([observation(speed=5.0)])
+        assert scores.flags[0] == 0
+        assert scores.weight[0] == 1.0
+        assert scores.describe(0) == []
+
+    def test_round_trip_extremes(self):
+        """Very short and very long round trips should be flagged."""
+        scores = score_observations([observation(rtt=5.0), observation(rtt=3600.0)])
+        assert scores.flags[0] == FLAG_SHORT_ROUND_TRIP
+        assert scores.flags[1] == FLAG_LONG_ROUND_TRIP
+        assert scores.describe(0) == ["short_round_trip"]
+        assert scores.weight.tolist() == [0.25, 0.25]
+
+    def test_implausible_speed(self):
+        """Speeds out of range or contradicting the round-trip distance should be flagged."""
+        scores = score_observations(
+            [observation(speed=5.0), observation(speed=20.0), observation(speed=0.5)]
+        )
+        assert scores.flags.tolist() == [0, FLAG_IMPLAUSIBLE_SPEED, FLAG_IMPLAUSIBLE_SPEED]
+
+        # 9 m/s over a 90 s round trip is 405 m each way: within a factor 3 of the
+        # standard rate's 150 m, but not of the handling-time model's 62.5 m
+        fast = [observation(speed=9.0, rtt=90.0)]
+        assert score_observations(fast).flags[0] == 0
+        scorer = QualityScorer(distance_model="handling")
+        assert scorer.score(fast).flags[0] == FLAG_IMPLAUSIBLE_SPEED
+
+    def test_inconsistent_bearing(self):
+        """A bearing far from the station's other bearings should be flagged."""
+        observations = [observation(bearing=b) for b in (85.0, 90.0, 95.0, 270.0)]
+        scores = score_observations(observations)
+        assert scores.flags.tolist() == [0, 0, 0, FLAG_INCONSISTENT_BEARING]
+
+    def test_bearing_needs_agreeing_neighbours(self):
+        """Too few or scattered other bearings at the station give no verdict."""
+        assert not score_observations([observation(0.0), observation(180.0)]).flagged.any()
+        scattered = [observation(b) for b in (0.0, 90.0, 180.0, 270.0)]
+        assert not score_observations(scattered).flagged.any()
+        # Other stations do not count
+        others = [observation(90.0, latitude=50.86), observation(90.0, latitude=50.87)]
+        assert not score_observations([observation(270.0), *others]).flagged.any()
+
+    def test_bearing_wraps(self):
+        """Bearings either side of north agree."""
+        observations = [observation(bearing=b) for b in (355.0, 2.0, 5.0, 358.0)]
+        assert not score_observations(observations).flagged.any()
+
+    def test_night(self):
+        """Observations outside foraging hours should be flagged."""
+        scores = score_observations(
+            [
+                observation(timestamp=datetime(2026, 7, 1, 3, 0)),
+                observation(timestamp=datetime(2026, 7, 1, 22, 30)),
+                observation(timestamp=datetime(2026, 7, 1, 6, 0)),
+            ]
+        )
+        assert scores.flags.tolist() == [FLAG_NIGHT, FLAG_NIGHT, 0]
+        assert scores.weight[0] == pytest.approx(0.1)
+
+    def test_night_uses_local_clock(self):
+        """Aware timestamps should be judged by their recorded local time, not UTC."""
+        paris = timezone(timedelta(hours=2))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            scores = score_observations(
+                [
+                    observation(timestamp=datetime(2026, 7, 1, 7, 0, tzinfo=paris)),  # 05:00 UTC
+                    observation(timestamp=datetime(2026, 7, 1, 23, 0, tzinfo=paris)),
+                ]
+            )
+        assert scores.flags.tolist() == [0, FLAG_NIGHT]
+
+    def test_penalties_multiply(self):
+        """Weights should multiply the penalties of all raised flags."""
+        scorer = QualityScorer(penalties={FLAG_NIGHT: 0.5})
+        scores = scorer.score([observation(rtt=5.0, timestamp=datetime(2026, 7, 1, 23, 0))])
+        assert scores.flags[0] == FLAG_SHORT_ROUND_TRIP | FLAG_NIGHT
+        assert scores.weight[0] == pytest.approx(0.25 * 0.5)
+        assert scores.counts()["night"] == 1
+
+    def test_batch_with_missing_values(self):
+        """NaN speeds and NaT timestamps should not be flagged."""
+        scores = QualityScorer().score_batch(
+            [50.85, 50.85],
+            [4.35, 4.35],
+            [90.0, 90.0],
+            [300.0, 300.0],
+            speed=[np.nan, 5.0],
+            timestamp=np.array(["NaT", "2026-07-01T12:00"], dtype="M8[us]"),
+        )
+        assert scores.flags.tolist() == [0, 0]
+
+    def test_million_rows(self):
+        """A million rows should score in a few seconds."""
+        rng = np.random.default_rng(0)
+        count = 1_000_000
+        start = time.perf_counter()
+        scores = QualityScorer().score_batch(
+            50.85 + rng.integers(0, 2000, count) * 1e-3,
+            4.35 + rng.integers(0, 50, count) * 1e-3,
+            rng.normal(90.0, 20.0, count) % 360,
+            rng.uniform(5.0, 2000.0, count),
+            speed=np.where(rng.random(count) < 0.5, np.nan, rng.uniform(0.5, 15.0, count)),
+            timestamp=np.datetime64("2026-07-01T00:00", "us")
+            + rng.integers(0, 86_400_000_000, count).astype("m8[us]"),
+        )
+        elapsed = time.perf_counter() - start
+
+        assert len(scores) == count
+        assert 0 < scores.flagged.mean() < 1
+        assert elapsed < 5.0
@@ -0,0 +1,96 @@
+"""Tests for bulk report export."""
+
+import csv
+import json
+import time
+from datetime import datetime, timedelta
+
+from vespa_finder.calculator import HiveCalculator
+from vespa_finder.models import Observation
+from vespa_finder.report_export import BulkReportWriter
+from vespa_finder.wildlife_api import WildlifeReporter
+
+
+def make_reports(count):
+    """Build (observation, hive_location) pairs with varied values."""
+    calculator = HiveCalculator()
+    start = datetime(2025, 9, 1, 8, 0, 0)
+    reports = []
+    for i in range(count):
+        observation = Observation(
+            latitude=50.8 + (i % 100) * 0.001,
+            longitude=4.3 + (i % 37) * 0.001,
+            bearing=(i * 7) % 360,
+            round_trip_time=60 + (i % 240),
+            timestamp=start + timedelta(seconds=i * 13),
+            notes="" if i % 3 else f'Note, with "quotes" {i}',
+        )
+        reports.append((observation, calculator.calculate_from_single_observation(observation)))
+    return reports
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class TestBulkReportWriter:
+    """Tests for BulkReportWriter."""
+
+    def test_matches_per_observation_reports(self, tmp_path):
+        """Every exported record should equal the single-observation report data."""
+        reports = make_reports(50)
+        reporter = WildlifeReporter()
+
+        result = reporter.export_bulk_reports(reports, str(tmp_path))
+
+        assert result.count == 50
+        vespawatch = read_csv(result.files["vespawatch"])
+        observatoire = read_csv(result.files["observatoire"])
+        with open(result.files["waarneming"], encoding="utf-8") as f:
+            waarneming = json.load(f)
+
+        for i, (observation, hive) in enumerate(reports):
+            assert vespawatch[i] == reporter._prepare_vespawatch_data(observation, hive)
+            assert observatoire[i] == reporter._prepare_observatoire_data(observation, hive)
+            assert waarneming[i] == reporter._prepare_waarneming_data(observation, hive)
+
+    def test_empty_batch(self, tmp_path):
+        """An empty batch should produce header-only CSVs and an empty JSON array."""
+        result = BulkReportWriter().write([], str(tmp_path))
+
+        assert result.count == 0
+        assert read_csv(result.files["vespawatch"]) == []
+        with open(result.files["waarneming"], encoding="utf-8") as f:
+            assert json.load(f) == []
+
+    def test_accepts_generator(self, tmp_path):
+        """Reports should be consumed lazily from any iterable."""
+        reports = make_reports(10)
+        result = BulkReportWriter().write((pair for pair in reports), str(tmp_path / "out"))
+
+        assert result.count == 10
+        assert len(read_csv(result.files["observatoire"])) == 10
+
+    def test_large_export_is_fast(self, tmp_path):
+        """A 50k-record export should complete in a few seconds."""
+        reports = make_reports(1000) * 50
+
+        start = time.perf_counter()
+        result = BulkReportWriter().write(reports, str(tmp_path))
+        elapsed = time.perf_counter() - start
+
+        assert result.count == 50_000
+        assert elapsed < 5.0
+
+
+def test_combined_report_entry_is_not_shared():
+    """Mutating one combined report must not affect later reports."""
+    reporter = WildlifeReporter()
+    observation, hive = make_reports(1)[0]
+
+    first = reporter.generate_combined_report(observation, hive)
+    first["waarneming"]["status"] = "changed"
+    second = reporter.generate_combined_report(observation, hive)
+
+    assert second["waarneming"]["status"] == "api_available"
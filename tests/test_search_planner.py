@@ -0,0 +1,116 @@
+"""Tests for search plans."""
+
+import time
+
+import numpy as np
+import pytest
+
+from vespa_finder.density import kernel_density
+from vespa_finder.geo_utils import haversine_distance
+from vespa_finder.models import HiveLocation
+from vespa_finder.search_planner import plan_search, search_surface
+
+
+def hive(latitude=50.85, longitude=4.35, radius=150.0):
+    return HiveLocation(latitude, longitude, radius, 500.0, 45.0)
+
+
+class TestSearchSurface:
+    """Tests for search_surface."""
+
+    def test_cells_and_disc(self):
+        """Cells should be about the requested size and zero outside the disc."""
+        surface = search_surface([hive()], cell_size=25.0, radius=1000.0)
+
+        height, width = surface.cell_size
+        assert height * 111194.9 == pytest.approx(25.0, rel=1e-3)
+        assert width * 111194.9 * np.cos(np.radians(50.85)) == pytest.approx(25.0, rel=1e-3)
+        assert surface.shape == (80, 80)
+        assert surface.values[0, 0] == 0.0
+        assert surface.value_at(50.85, 4.35) > 0
+
+    def test_peak_at_estimate(self):
+        """The likelihood should peak at the hive estimate."""
+        surface = search_surface([hive(radius=200.0)], radius=1500.0)
+        lat, lon, _density = surface.peak()
+        assert haversine_distance(lat, lon, 50.85, 4.35) < 25.0
+
+    def test_default_radius_covers_estimates(self):
+        """The default disc should reach three confidence radii beyond every estimate."""
+        estimates = [hive(50.85, 4.35, 100.0), hive(50.86, 4.36, 100.0)]
+        surface = search_surface(estimates)
+        assert surface.value_at(50.85, 4.35) > 0
+        assert surface.value_at(50.86, 4.36) > 0
+
+    def test_empty(self):
+        """No estimates should raise."""
+        with pytest.raises(ValueError):
+            search_surface([])
+
+
+class TestPlanSearch:
+    """Tests for plan_search."""
+
+    def test_plan_columns(self):
+        """The plan should reach the coverage target with consistent columns."""
+        plan = plan_search(search_surface([hive()], radius=800.0), coverage=0.9)
+
+        assert plan.cumulative_probability[-1] >= 0.9
+        assert np.all(np.diff(plan.cumulative_probability) > 0)
+        assert np.all(np.diff(plan.walked) >= 0)
+        assert plan.total_distance == plan.walked[-1]
+        assert plan.cell_size == pytest.approx(25.0, rel=1e-3)
+        assert plan.cells_for(0.5) < plan.cells_for(0.9) <= len(plan)
+        # Cells are distinct
+        assert len(set(zip(plan.latitude, plan.longitude, strict=True))) == len(plan)
+
+    def test_starts_near_start_position(self):
+        """From a start position, the first cell is close by and not a far peak."""
+        surface = search_surface([hive(radius=300.0)], radius=1500.0)
+        plan = plan_search(surface, start=(50.846, 4.35))
+
+        first = haversine_distance(50.846, 4.35, plan.latitude[0], plan.longitude[0])
+        peak = haversine_distance(50.846, 4.35, 50.85, 4.35)
+        assert first < peak
+        assert plan.walked[0] == pytest.approx(first, rel=0.01, abs=1.0)
+
+    def test_front_loads_probability(self):
+        """Greedy order should find probability faster per meter than a raster sweep."""
+        surface = search_surface([hive(radius=200.0)], radius=1000.0)
+        plan = plan_search(surface, coverage=0.8)
+
+        half = plan.cells_for(0.5)
+        # A row-by-row sweep of the same cells walks at least one cell per cell searched
+        assert plan.walked[half - 1] < half * plan.cell_size * 1.5
+
+    def test_two_modes(self):
+        """Both estimates of a bimodal surface should be searched."""
+        surface = search_surface([hive(50.85, 4.35, 100.0), hive(50.855, 4.35, 100.0)])
+        plan = plan_search(surface, coverage=0.95)
+        cells = list(zip(plan.latitude, plan.longitude, strict=True))
+        for latitude in (50.85, 50.855):
+            assert any(haversine_distance(lat, lon, latitude, 4.35) < 100 for lat, lon in cells)
+
+    def test_density_grid_surface(self):
+        """Any density raster can be planned."""
+        grid = kernel_density([50.85], [4.35], [200.0], size=100)
+        plan = plan_search(grid, max_cells=50)
+        assert len(plan) == 50
+
+    def test_empty_surface(self):
+        """An all-zero surface should raise."""
+        surface = search_surface([hive()], radius=500.0)
+        surface.values[:] = 0
+        with pytest.raises(ValueError):
+            plan_search(surface)
+
+    def test_two_km_disc_under_a_second(self):
+        """A plan for a 2 km disc of 25 m cells should take under a second."""
+        start = time.perf_counter()
+        surface = search_surface([hive(radius=700.0)], radius=2000.0)
+        plan = plan_search(surface)
+        elapsed = time.perf_counter() - start
+
+        assert surface.shape == (160, 160)
+        assert len(plan) > 0
+        assert elapsed < 1.0
@@ -0,0 +1,147 @@
+"""Tests for next-station recommendations."""
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from vespa_finder.calculator import HiveCalculator
+from vespa_finder.geo_utils import haversine_distance
+from vespa_finder.models import Observation
+from vespa_finder.station_planner import area_reduction, nest_posterior, recommend_stations
+
+
+class TestNestPosterior:
+    """Tests for nest_posterior."""
+
+    def test_single_observation(self):
+        """One observation should center on its estimate, elongated across the bearing."""
+        observation = Observation(50.85, 4.35, 90.0, 300.0)
+        estimate = HiveCalculator().calculate_from_single_observation(observation)
+        posterior = nest_posterior([observation])
+
+        assert posterior.latitude == pytest.approx(estimate.latitude, abs=1e-6)
+        assert posterior.longitude == pytest.approx(estimate.longitude, abs=1e-6)
+        east_var, north_var = np.diag(posterior.covariance)
+        # Bearing 90°: the bearing error (500 m * sin 10°) spreads north-south
+        assert math.sqrt(north_var) == pytest.approx(500 * math.sin(math.radians(10)), rel=1e-6)
+        assert north_var > east_var
+
+    def test_crossing_bearings_shrink_area(self):
+        """A crossing bearing should shrink the posterior area."""
+        first = Observation(50.85, 4.35, 90.0, 300.0)
+        second = Observation(50.8455, 4.357, 0.0, 300.0)
+        one = nest_posterior([first])
+        two = nest_posterior([first, second])
+        assert two.area < one.area
+
+    @pytest.mark.parametrize("tzinfo", [None, timezone(timedelta(hours=2))])
+    def test_time_of_day_model(self, tzinfo):
+        """Time-dependent models should see each observation's recorded clock time."""
+        calculator = HiveCalculator(distance_model="conditions")
+        observation = Observation(
+            50.85, 4.35, 90.0, 300.0, timestamp=datetime(2026, 7, 1, 7, 0, tzinfo=tzinfo)
+        )
+        estimate = calculator.calculate_from_single_observation(observation)
+        posterior = nest_posterior([observation], calculator)
+
+        assert posterior.longitude == pytest.approx(estimate.longitude, abs=1e-9)
+
+    def test_empty(self):
+        """No observations should raise."""
+        with pytest.raises(ValueError):
+            nest_posterior([])
+
+
+class TestAreaReduction:
+    """Tests for area_reduction."""
+
+    def test_matches_explicit_update(self):
+        """The closed form should match updating the covariance explicitly."""
+        posterior = nest_posterior([Observation(50.85, 4.35, 45.0, 300.0)])
+        latitude = posterior.latitude + np.array([0.003, -0.002, 0.0])
+        longitude = posterior.longitude + np.array([0.001, 0.004, -0.005])
+        scores = area_reduction(posterior, latitude, longitude)
+
+        east, north = posterior.offsets(latitude, longitude)
+        for e, n, score in zip(east, north, scores, strict=True):
+            distance = math.hypot(e, n)
+            across = np.array([n, -e]) / distance
+            sigma = distance * math.sin(math.radians(10))
+            information = np.linalg.inv(posterior.covariance) + np.outer(across, across) / sigma**2
+            updated = np.linalg.inv(information)
+            expected = 1 - math.sqrt(np.linalg.det(updated) / np.linalg.det(posterior.covariance))
+            assert score == pytest.approx(expected, rel=1e-9)
+
+    def test_closer_is_better(self):
+        """Along the same line, a closer station gives a sharper bearing."""
+        posterior = nest_posterior([Observation(50.85, 4.35, 90.0, 300.0)])
+        longitude = posterior.longitude + np.array([0.002, 0.006])
+        near, far = area_reduction(posterior, [posterior.latitude] * 2, longitude)
+        assert near > far
+
+    def test_at_nest(self):
+        """A candidate at the estimate itself scores zero."""
+        posterior = nest_posterior([Observation(50.85, 4.35, 90.0, 300.0)])
+        assert area_reduction(posterior, [posterior.latitude], [posterior.longitude])[0] == 0.0
+
+
+class TestRecommendStations:
+    """Tests for recommend_stations."""
+
+    def test_top_k(self):
+        """Recommendations should be sorted, separated and within range."""
+        observations = [Observation(50.85, 4.35, 60.0, 360.0)]
+        stations = recommend_stations(observations, k=5, separation=200.0)
+        posterior = stations.posterior
+
+        assert len(stations) == 5
+        assert np.all(np.diff(stations.score) <= 0)
+        assert np.all((stations.distance >= 100.0) & (stations.distance <= 1000.0))
+        for i in range(5):
+            distance = haversine_distance(
+                stations.latitude[i], stations.longitude[i], posterior.latitude, posterior.longitude
+            )
+            assert distance == pytest.approx(stations.distance[i], rel=1e-3)
+            for j in range(i):
+                assert (
+                    haversine_distance(
+                        stations.latitude[i],
+                        stations.longitude[i],
+                        stations.latitude[j],
+                        stations.longitude[j],
+                    )
+                    >= 199.0
+                )
+
+    def test_best_is_grid_maximum(self):
+        """The first recommendation should be the best candidate on the grid."""
+        observations = [
+            Observation(50.85, 4.35, 60.0, 360.0),
+            Observation(50.846, 4.36, 20.0, 300.0),
+        ]
+        stations = recommend_stations(observations, k=1, spacing=50.0)
+        posterior = stations.posterior
+
+        steps = np.arange(-1000.0, 1025.0, 50.0)
+        east, north = (grid.ravel() for grid in np.meshgrid(steps, steps))
+        inside = (np.hypot(east, north) >= 100) & (np.hypot(east, north) <= 1000)
+        latitude = posterior.latitude + north[inside] / 111194.92664
+        longitude = posterior.longitude + east[inside] / (
+            111194.92664 * math.cos(math.radians(posterior.latitude))
+        )
+        best = area_reduction(posterior, latitude, longitude).max()
+        assert stations.score[0] == pytest.approx(best)
+
+    def test_bearing_points_to_nest(self):
+        """The expected flight bearing should point from the station to the nest."""
+        stations = recommend_stations([Observation(50.85, 4.35, 120.0, 300.0)], k=3)
+        posterior = stations.posterior
+        for lat, lon, bearing in zip(
+            stations.latitude, stations.longitude, stations.bearing, strict=True
+        ):
+            _distance, expected = HiveCalculator().geodesic.distance_and_bearing(
+                lat, lon, posterior.latitude, posterior.longitude
+            )
+            assert (bearing - expected + 180) % 360 - 180 == pytest.approx(0, abs=0.1)
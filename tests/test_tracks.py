@@ -0,0 +1,143 @@
+"""Tests for per-hornet track aggregation."""
+
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from vespa_finder.calculator import HiveCalculator
+from vespa_finder.geo_utils import bearing_between_points, destination_point, haversine_distance
+from vespa_finder.models import Observation
+from vespa_finder.tracks import P2Quantile, TrackAggregator
+
+START = datetime(2025, 8, 1, 9, 0)
+
+
+def round_trips(mark, latitude, longitude, bearing, round_trip, count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        Observation(
+            latitude=latitude,
+            longitude=longitude,
+            bearing=float((bearing + rng.normal(0, 5)) % 360),
+            round_trip_time=float(round_trip + rng.normal(0, 15)),
+            timestamp=START + timedelta(minutes=i),
+            hornet_color_mark=mark,
+        )
+        for i in range(count)
+    ]
+
+
+class TestP2Quantile:
+    """Tests for the streaming quantile estimator."""
+
+    def test_exact_for_few_samples(self):
+        """Up to five samples the median should be exact."""
+        quantile = P2Quantile()
+        assert quantile.value is None
+        for value in (5.0, 1.0, 3.0, 9.0):
+            quantile.add(value)
+        assert quantile.value == 4.0
+
+    @pytest.mark.parametrize("quantile", [0.5, 0.9])
+    def test_close_to_exact(self, quantile):
+        """Large streams should land close to the exact quantile."""
+        samples = np.random.default_rng(1).exponential(120.0, 20000)
+        estimator = P2Quantile(quantile)
+        for value in samples.tolist():
+            estimator.add(value)
+
+        assert estimator.value == pytest.approx(np.quantile(samples, quantile), rel=0.02)
+
+
+class TestTrackAggregator:
+    """Tests for TrackAggregator."""
+
+    def test_groups_by_mark_and_station(self):
+        """Interleaved streams should be split per mark and station; unmarked are counted."""
+        red = round_trips("red", 50.85, 4.35, 30.0, 240.0, 20)
+        blue = round_trips("blue", 50.85, 4.35, 200.0, 400.0, 15, seed=2)
+        stream = [o for pair in zip(red, blue, strict=False) for o in pair] + red[15:]
+        stream.append(Observation(50.85, 4.35, 90.0, 60.0))
+        aggregator = TrackAggregator()
+
+        assert aggregator.extend(stream) == 35
+
+        assert aggregator.unmarked == 1
+        assert aggregator.marks() == ["blue", "red"]
+        assert [track.count for track in aggregator.tracks_for("red")] == [20]
+
+    def test_tracks_for_indexes_marks(self):
+        """Tracks of one mark should come from every station, most round trips first."""
+        aggregator = TrackAggregator()
+        aggregator.extend(round_trips("green", 50.85, 4.35, 30.0, 240.0, 3))
+        aggregator.extend(round_trips("green", 50.86, 4.35, 120.0, 240.0, 5))
+        aggregator.extend(round_trips("red", 50.85, 4.35, 30.0, 240.0, 4))
+
+        tracks = aggregator.tracks_for("green")
+
+        assert [(track.station, track.count) for track in tracks] == [
+            ((50.86, 4.35), 5),
+            ((50.85, 4.35), 3),
+        ]
+        assert aggregator.tracks_for("blue") == []
+        assert aggregator.marks() == ["green", "red"]
+
+    def test_circular_mean_across_north(self):
+        """Bearings on both sides of north should average to north, not south."""
+        aggregator = TrackAggregator()
+        for bearing in (350.0, 355.0, 5.0, 10.0):
+            aggregator.add(Observation(50.85, 4.35, bearing, 120.0, hornet_color_mark="white"))
+
+        (track,) = aggregator.tracks_for("white")
+        assert min(track.mean_bearing, 360 - track.mean_bearing) < 1e-9
+        assert track.resultant_length > 0.99
+        assert track.concentration > 10
+
+    def test_fused_observation_keeps_temperature(self):
+        """The fused observation should carry the mean of the recorded temperatures."""
+        aggregator = TrackAggregator()
+        for temperature in (18.0, None, 22.0):
+            aggregator.add(
+                Observation(
+                    50.85, 4.35, 90.0, 120.0, temperature=temperature, hornet_color_mark="red"
+                )
+            )
+
+        (track,) = aggregator.tracks_for("red")
+        assert track.to_observation().temperature == pytest.approx(20.0)
+
+        unmeasured = TrackAggregator().add(
+            Observation(50.85, 4.35, 90.0, 120.0, hornet_color_mark="red")
+        )
+        assert unmeasured.to_observation().temperature is None
+
+    def test_fused_estimate_near_truth(self):
+        """A fused track estimate should land closer to the nest than single trips on average."""
+        trips = round_trips("red", 50.85, 4.35, 60.0, 300.0, 40)
+        nest = destination_point(50.85, 4.35, 60.0, 500.0)
+        aggregator = TrackAggregator()
+        aggregator.extend(trips)
+
+        fused = aggregator.estimate("red")
+
+        calculator = HiveCalculator()
+        singles = [calculator.calculate_from_single_observation(o) for o in trips]
+        single_error = np.mean([math.dist((h.latitude, h.longitude), nest) for h in singles])
+        assert math.dist((fused.latitude, fused.longitude), nest) < single_error
+        assert fused.calculation_method == "track_40_trips_empirical"
+
+    def test_two_stations_are_triangulated(self):
+        """Tracks of one mark from two stations should be triangulated."""
+        nest = (50.855, 4.355)
+        aggregator = TrackAggregator()
+        for seed, (lat, lon) in enumerate([(50.85, 4.35), (50.86, 4.35)]):
+            bearing = bearing_between_points(lat, lon, *nest)
+            seconds = haversine_distance(lat, lon, *nest) / 100 * 60
+            aggregator.extend(round_trips("green", lat, lon, bearing, seconds, 10, seed=seed))
+
+        hive = aggregator.estimate("green")
+
+        assert hive.calculation_method == "triangulation_2_points_empirical"
+        assert aggregator.estimates(min_trips=11) == {}
@@ -0,0 +1,212 @@
+"""Tests for the GUI background task helpers."""
+
+import threading
+import time
+
+import pytest
+
+from vespa_finder.workers import BackgroundTaskRunner, Debouncer, TaskCancelledError
+
+
+class FakeScheduler:
+    """Stand-in for ``root.after`` that runs callbacks when pumped."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, _delay_ms, callback):
+        self.callbacks.append(callback)
+
+    def pump(self, runner, timeout=5.0):
+        """Run scheduled callbacks until the runner has delivered everything."""
+        deadline = time.monotonic() + timeout
+        while self.callbacks:
+            if time.monotonic() > deadline:
+                raise AssertionError("Runner did not finish in time")
+            callback = self.callbacks.pop(0)
+            callback()
+            if self.callbacks and runner.busy:
+                time.sleep(0.005)
+
+
+class TestBackgroundTaskRunner:
+    """Tests for BackgroundTaskRunner."""
+
+    def setup_method(self):
+        """Create a runner driven by a fake scheduler."""
+        self.scheduler = FakeScheduler()
+        self.runner = BackgroundTaskRunner(self.scheduler.after)
+
+    def teardown_method(self):
+        """Stop worker threads."""
+        self.runner.shutdown()
+
+    def test_success_delivered_on_calling_thread(self):
+        """Results should be delivered through the scheduler, not the worker thread."""
+        results = []
+        main_thread = threading.get_ident()
+
+        def on_success(value):
+            results.append((value, threading.get_ident()))
+
+        self.runner.submit("job", lambda _ctx: 42, on_success=on_success)
+        self.scheduler.pump(self.runner)
+
+        assert results == [(42, main_thread)]
+        assert not self.runner.busy
+
+    def test_work_runs_off_main_thread(self):
+        """The submitted callable should run in a worker thread."""
+        results = []
+        self.runner.submit("job", lambda _ctx: threading.get_ident(), on_success=results.append)
+        self.scheduler.pump(self.runner)
+
+        assert results
+        assert results[0] != threading.get_ident()
+
+    def test_error_routed_to_on_error(self):
+        """Exceptions raised by the task should reach on_error."""
+        errors = []
+
+        def failing(_ctx):
+            raise ValueError("bad input")
+
+        self.runner.submit("job", failing, on_error=errors.append)
+        self.scheduler.pump(self.runner)
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], ValueError)
+
+    def test_progress_reported(self):
+        """Progress updates should be delivered in order and clamped to [0, 1]."""
+        progress = []
+
+        def work(ctx):
+            ctx.report_progress(0.5, "half")
+            ctx.report_progress(2.0, "done")
+            return None
+
+        self.runner.submit(
+            "job", work, on_progress=lambda fraction, msg: progress.append((fraction, msg))
+        )
+        self.scheduler.pump(self.runner)
+
+        assert progress == [(0.5, "half"), (1.0, "done")]
+
+    def test_resubmit_discards_stale_result(self):
+        """Submitting under the same name should cancel and drop the previous job."""
+        release = threading.Event()
+        results = []
+
+        def slow(ctx):
+            release.wait(timeout=5)
+            ctx.raise_if_cancelled()
+            return "stale"
+
+        first = self.runner.submit("calc", slow, on_success=results.append)
+        self.runner.submit("calc", lambda _ctx: "fresh", on_success=results.append)
+        release.set()
+        self.scheduler.pump(self.runner)
+
+        assert first.cancelled
+        assert results == ["fresh"]
+
+    def test_cancel_suppresses_callbacks(self):
+        """Cancelled jobs should call neither on_success nor on_error."""
+        release = threading.Event()
+        outcomes = []
+
+        def slow(ctx):
+            release.wait(timeout=5)
+            ctx.raise_if_cancelled()
+            return "value"
+
+        self.runner.submit("job", slow, on_success=outcomes.append, on_error=outcomes.append)
+        assert self.runner.is_running("job")
+        self.runner.cancel("job")
+        release.set()
+        self.scheduler.pump(self.runner)
+
+        assert outcomes == []
+        assert not self.runner.is_running("job")
+
+    def test_raise_if_cancelled(self):
+        """raise_if_cancelled should raise once the token is cancelled."""
+        seen = []
+
+        def work(ctx):
+            ctx.token.cancel()
+            with pytest.raises(TaskCancelledError):
+                ctx.raise_if_cancelled()
+            seen.append(True)
+
+        self.runner.submit("job", work)
+        self.scheduler.pump(self.runner)
+
+        assert seen == [True]
+
+
+class FakeTimers:
+    """Stand-in for ``root.after`` / ``root.after_cancel`` with manual firing."""
+
+    def __init__(self):
+        self.timers = {}
+        self.next_id = 0
+
+    def after(self, _delay_ms, callback):
+        self.next_id += 1
+        self.timers[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, timer_id):
+        self.timers.pop(timer_id, None)
+
+    def fire_all(self):
+        timers, self.timers = self.timers, {}
+        for callback in timers.values():
+            callback()
+
+
+class TestDebouncer:
+    """Tests for Debouncer."""
+
+    def setup_method(self):
+        """Create a debouncer driven by fake timers."""
+        self.timers = FakeTimers()
+        self.calls = []
+        self.debouncer = Debouncer(
+            self.timers.after, self.timers.after_cancel, 10, lambda: self.calls.append(1)
+        )
+
+    def test_burst_runs_callback_once(self):
+        """Several triggers before the quiet period ends should run the callback once."""
+        for _ in range(5):
+            self.debouncer.trigger()
+        assert len(self.timers.timers) == 1
+
+        self.timers.fire_all()
+        assert self.calls == [1]
+        assert not self.debouncer.pending
+
+    def test_trigger_accepts_event_argument(self):
+        """Trigger should be usable directly as a Tk event handler."""
+        self.debouncer.trigger(object())
+        self.timers.fire_all()
+        assert self.calls == [1]
+
+    def test_cancel(self):
+        """Cancelled triggers should not run the callback."""
+        self.debouncer.trigger()
+        self.debouncer.cancel()
+        self.timers.fire_all()
+        assert self.calls == []
+
+    def test_flush(self):
+        """Flush should run a pending callback immediately, exactly once."""
+        self.debouncer.trigger()
+        self.debouncer.flush()
+        self.timers.fire_all()
+        assert self.calls == [1]
+
+        self.debouncer.flush()
+        assert self.calls == [1]